@@ -69,12 +69,12 @@ def generate_lexer_docs():
     return ''.join(out).decode('utf-8')
 
 def generate_formatter_docs():
+    from pygments import formatters
     from pygments.formatters import FORMATTERS
 
     out = []
-    for cls, data in sorted(FORMATTERS.iteritems(),
-                            key=lambda x: x[0].__name__):
-        heading = cls.__name__
+    for heading, data in sorted(FORMATTERS.iteritems()):
+        cls = getattr(formatters, heading)
         out.append('`' + heading + '`\n' + '-'*(2+len(heading)) + '\n')
         out.append(cls.__doc__)
         out.append('''
@@ -82,7 +82,7 @@ def generate_formatter_docs():
     :Filename patterns: %s
 
 
-''' % (', '.join(data[1]) or 'None', ', '.join(data[2]).replace('*', '\\*') or 'None'))
+''' % (', '.join(data[2]) or 'None', ', '.join(data[3]).replace('*', '\\*') or 'None'))
     return ''.join(out).decode('utf-8')
 
 def generate_filter_docs():
@@ -29,7 +29,8 @@
 __version__ = '1.3.1'
 __docformat__ = 'restructuredtext'
 
-__all__ = ['lex', 'format', 'highlight']
+__all__ = ['lex', 'format', 'format_many', 'highlight', 'highlight_range',
+           'set_highlight_cache']
 
 
 import sys
@@ -75,6 +76,44 @@ def format(tokens, formatter, outfile=None):
         raise
 
 
+def format_many(tokens, targets):
+    """
+    Format a tokenlist ``tokens`` with several formatters, consuming it
+    only once.  ``targets`` is a sequence of ``(formatter, outfile)``
+    pairs; like for ``format()``, ``outfile`` may be ``None`` to get the
+    result as a string.
+
+    Return a list with the return value of ``format()`` for each target.
+
+    Unless ``tokens`` is a list, tuple or ``TokenBuffer`` already, it is
+    stored in a ``pygments.tokenbuffer.TokenBuffer`` first, which every
+    formatter then reads on its own, so that formatters that need the
+    number of lines in advance work as usual.
+    """
+    from pygments.tokenbuffer import TokenBuffer
+    if not isinstance(tokens, (list, tuple, TokenBuffer)):
+        # a TokenStream from highlight() knows the text of its values
+        tokens = TokenBuffer(tokens, getattr(tokens, 'text', None))
+    return [format(tokens, formatter, outfile)
+            for formatter, outfile in targets]
+
+
+#: the cache used by highlight(), see set_highlight_cache()
+_highlight_cache = None
+
+
+def set_highlight_cache(cache):
+    """
+    Make ``highlight()`` use ``cache``, one of the caches from
+    ``pygments.cache``, for its output; ``None`` switches caching off.
+    Return the cache used before.
+    """
+    global _highlight_cache
+    old = _highlight_cache
+    _highlight_cache = cache
+    return old
+
+
 def highlight(code, lexer, formatter, outfile=None):
     """
     Lex ``code`` with ``lexer`` and format it with the formatter ``formatter``.
@@ -83,7 +122,45 @@ def highlight(code, lexer, formatter, outfile=None):
     with a ``write`` method), the result will be written to it, otherwise
     it is returned as a string.
     """
-    return format(lex(code, lexer), formatter, outfile)
+    if _highlight_cache is not None:
+        return _highlight_cache.highlight(code, lexer, formatter, outfile)
+    return _highlight(code, lexer, formatter, outfile)
+
+
+def _highlight(code, lexer, formatter, outfile=None):
+    from pygments.lexer import _uses_regex_loop
+    if _uses_regex_loop(lexer) and not lexer.filters:
+        # the token values are the preprocessed text, so the number of
+        # lines (needed e.g. for line numbers) can be told from it
+        from pygments.tokenbuffer import TokenStream
+        text = lexer.preprocess_text(code)
+        tokens = TokenStream(_strip_indices(
+            lexer.get_tokens_unprocessed(text)), text)
+    else:
+        tokens = lex(code, lexer)
+    return format(tokens, formatter, outfile)
+
+
+def _strip_indices(tokens):
+    for i, t, v in tokens:
+        yield t, v
+
+
+def highlight_range(code, lexer, formatter, first_line, last_line,
+                    outfile=None):
+    """
+    Like ``highlight()``, but only for the lines ``first_line`` to
+    ``last_line`` (inclusive, counted from 1) of ``code``.  Line numbers,
+    line anchors and highlighted lines are those of the whole text.
+
+    Lexing stops after ``last_line``.  Lexers based on ``RegexLexer``
+    start near ``first_line`` if a cache set with ``set_highlight_cache()``
+    has a checkpoint index of the code from an earlier call, see
+    ``pygments.checkpoints``.
+    """
+    from pygments.checkpoints import lex_range
+    tokens = lex_range(code, lexer, first_line, last_line, _highlight_cache)
+    return format(tokens, formatter.get_range_formatter(first_line), outfile)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,395 @@
+# -*- coding: utf-8 -*-
+"""
+    pygments.cache
+    ~~~~~~~~~~~~~~
+
+    Caches for highlighted output.
+
+    A cache stores the output of `pygments.highlight()` under a key made
+    from the code, the lexer and the formatter, so that highlighting the
+    same code the same way again costs a lookup.  Install one for all
+    `highlight()` calls with `pygments.set_highlight_cache()`, or call its
+    `highlight()` method directly::
+
+        from pygments.cache import MemoryCache
+        cache = MemoryCache(maxsize=16 * 1024 * 1024)
+        html = cache.highlight(code, lexer, formatter)
+
+    Caches can also store token streams, keyed by the code and the lexer
+    only, so that formatting the same code differently doesn't lex it
+    again::
+
+        tokens = cache.get_tokens(code, lexer)
+        html = format(tokens, HtmlFormatter(style='emacs'))
+
+    :copyright: Copyright 2006-2010 by the Pygments team, see AUTHORS.
+    :license: BSD, see LICENSE for details.
+"""
+
+import os
+import sys
+import tempfile
+
+import pygments
+from pygments.checkpoints import CheckpointIndex
+from pygments.tokenbuffer import TokenBuffer
+from pygments.util import b
+
+try:
+    from hashlib import sha1 as sha
+except ImportError:
+    import sha
+    sha = sha.new
+
+__all__ = ['BaseCache', 'MemoryCache', 'FileCache']
+
+
+# bytes per character of a unicode string
+if sys.maxunicode > 0xffff:
+    _unicode_width = 4
+else:
+    _unicode_width = 2
+
+
+class BaseCache(object):
+    """
+    Base class for caches of highlighted output.
+
+    Subclasses implement `get()` and `set()`.  The counters `hits` and
+    `misses` count the `highlight()` calls that found their output in the
+    cache and those that had to highlight the code; `uncacheable` counts
+    the calls whose lexer or formatter could not give a cache key.
+    `token_hits` and `token_misses` count the `get_tokens()` calls.
+
+    If `tokens` is true, `highlight()` gets the tokens of output that is
+    not in the cache from `get_tokens()`, which stores them too.
+    """
+
+    def __init__(self, tokens=False):
+        self.tokens = tokens
+        self.hits = 0
+        self.misses = 0
+        self.uncacheable = 0
+        self.token_hits = 0
+        self.token_misses = 0
+
+    def get(self, key):
+        """
+        Return the value stored under `key`, or None.
+        """
+        raise NotImplementedError
+
+    def set(self, key, value):
+        """
+        Store `value`, a byte or unicode string, under `key`.
+        """
+        raise NotImplementedError
+
+    def clear(self):
+        """
+        Remove all values and reset the counters.
+        """
+        self.hits = self.misses = self.uncacheable = 0
+        self.token_hits = self.token_misses = 0
+
+    def make_key(self, code, lexer, formatter=None):
+        """
+        Return the key for the output of highlighting `code` with `lexer`
+        and `formatter`, a hex digest of the code, the cache keys of lexer
+        and formatter and the Pygments version; or None if the lexer or
+        the formatter has no cache key.  Without `formatter`, return the
+        key for the tokens of `code`.
+        """
+        if formatter is None:
+            return self._make_key(code, lexer, 'tokens')
+        formatter_key = formatter.get_cache_key()
+        if formatter_key is None:
+            return None
+        return self._make_key(code, lexer, formatter_key)
+
+    def _make_key(self, code, lexer, what):
+        lexer_key = lexer.get_cache_key()
+        if lexer_key is None:
+            return None
+        if isinstance(code, unicode):
+            code = b('u') + code.encode('utf-8')
+        else:
+            code = b('b') + code
+        head = u'%s\0%s\0%s\0' % (pygments.__version__, lexer_key, what)
+        return sha(head.encode('utf-8') + code).hexdigest()
+
+    def get_tokens(self, code, lexer):
+        """
+        Return the tokens of `code` lexed with `lexer`, filters applied, as
+        a `pygments.tokenbuffer.TokenBuffer`.  They are taken from the
+        cache if they are there and stored otherwise, where possible in a
+        compact form that refers to the text instead of storing the token
+        values.
+        """
+        key = self.make_key(code, lexer)
+        if key is None:
+            return TokenBuffer.from_lexer(lexer, code)
+        text = lexer.preprocess_text(code)
+        data = self.get(key)
+        if data is not None:
+            try:
+                buf = TokenBuffer.loads(data, text)
+            except ValueError:
+                pass
+            else:
+                self.token_hits += 1
+                return buf
+        self.token_misses += 1
+        buf = TokenBuffer.from_lexer(lexer, code)
+        # the text is only left out if the tokens are slices of the text
+        # that preprocess_text() returns, which filters or lexers like
+        # RawTokenLexer don't reproduce
+        self.set(key, buf.dumps(include_text=buf.text != text))
+        return buf
+
+    def get_checkpoints(self, code, lexer):
+        """
+        Return the `pygments.checkpoints.CheckpointIndex` stored for
+        lexing `code` with `lexer`, or None.
+        """
+        key = self._make_key(code, lexer, 'checkpoints')
+        if key is None:
+            return None
+        data = self.get(key)
+        if data is None:
+            return None
+        try:
+            return CheckpointIndex.loads(data)
+        except ValueError:
+            return None
+
+    def set_checkpoints(self, code, lexer, index):
+        """
+        Store the checkpoint `index` for lexing `code` with `lexer`.
+        """
+        key = self._make_key(code, lexer, 'checkpoints')
+        if key is not None:
+            self.set(key, index.dumps())
+
+    def highlight(self, code, lexer, formatter, outfile=None):
+        """
+        Like `pygments.highlight()`, but take the output from the cache if
+        it is there and store it otherwise.
+        """
+        key = self.make_key(code, lexer, formatter)
+        if key is None:
+            self.uncacheable += 1
+            return pygments._highlight(code, lexer, formatter, outfile)
+        result = self.get(key)
+        if result is None:
+            self.misses += 1
+            if self.tokens:
+                result = pygments.format(self.get_tokens(code, lexer),
+                                         formatter)
+            else:
+                result = pygments._highlight(code, lexer, formatter)
+            self.set(key, result)
+        else:
+            self.hits += 1
+        if not outfile:
+            return result
+        outfile.write(result)
+
+
+class MemoryCache(BaseCache):
+    """
+    A cache that keeps values in memory, up to a total of `maxsize` bytes
+    (32 MiB by default).  When it is full, the least recently used values
+    are dropped.  Values bigger than `maxsize` are not stored.
+    """
+
+    def __init__(self, maxsize=32 * 1024 * 1024, tokens=False):
+        BaseCache.__init__(self, tokens)
+        self.maxsize = maxsize
+        self.size = 0
+        # links of a circular list [prev, next, key, value, size], most
+        # recently used first
+        self._links = {}
+        root = self._root = []
+        root[:] = [root, root, None, None, 0]
+
+    def __len__(self):
+        return len(self._links)
+
+    def get(self, key):
+        link = self._links.get(key)
+        if link is None:
+            return None
+        # move the link to the front
+        root = self._root
+        prev, next = link[0], link[1]
+        prev[1] = next
+        next[0] = prev
+        first = root[1]
+        link[0] = root
+        link[1] = first
+        first[0] = root[1] = link
+        return link[3]
+
+    def set(self, key, value):
+        if key in self._links:
+            self._remove(self._links[key])
+        if isinstance(value, unicode):
+            size = len(value) * _unicode_width
+        else:
+            size = len(value)
+        if size > self.maxsize:
+            return
+        root = self._root
+        while self.size + size > self.maxsize:
+            self._remove(root[0])
+        first = root[1]
+        link = [root, first, key, value, size]
+        first[0] = root[1] = self._links[key] = link
+        self.size += size
+
+    def _remove(self, link):
+        prev, next = link[0], link[1]
+        prev[1] = next
+        next[0] = prev
+        del self._links[link[2]]
+        self.size -= link[4]
+
+    def clear(self):
+        BaseCache.clear(self)
+        self._links.clear()
+        root = self._root
+        root[:] = [root, root, None, None, 0]
+        self.size = 0
+
+
+class FileCache(BaseCache):
+    """
+    A cache that keeps values in files below `directory`, which is created
+    if needed, so that they can be shared between processes.
+
+    Values are written to a temporary file that is then renamed, so that
+    other processes never read a partly written value.  When the files
+    take up more than `maxsize` bytes (256 MiB by default), the least
+    recently used ones are removed until they take up three quarters of it.
+    """
+
+    def __init__(self, directory, maxsize=256 * 1024 * 1024, tokens=False):
+        BaseCache.__init__(self, tokens)
+        self.directory = directory
+        self.maxsize = maxsize
+        # total size of the files, counted when first needed
+        self._size = None
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key[2:])
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            f = open(path, 'rb')
+            try:
+                data = f.read()
+            finally:
+                f.close()
+        except (IOError, OSError):
+            return None
+        try:
+            # mark the file as recently used
+            os.utime(path, None)
+        except OSError:
+            pass
+        if data[:1] == b('u'):
+            return data[1:].decode('utf-8')
+        return data[1:]
+
+    def set(self, key, value):
+        if isinstance(value, unicode):
+            data = b('u') + value.encode('utf-8')
+        else:
+            data = b('b') + value
+        if len(data) > self.maxsize:
+            return
+        path = self._path(key)
+        dirname = os.path.dirname(path)
+        if not os.path.isdir(dirname):
+            try:
+                os.mkdir(dirname)
+            except OSError:
+                # created by another process in the meantime
+                if not os.path.isdir(dirname):
+                    raise
+        try:
+            # the size of a value this one replaces
+            old_size = os.stat(path).st_size
+        except OSError:
+            old_size = 0
+        fd, tmppath = tempfile.mkstemp(dir=dirname, suffix='.tmp')
+        try:
+            f = os.fdopen(fd, 'wb')
+            try:
+                f.write(data)
+            finally:
+                f.close()
+            try:
+                os.rename(tmppath, path)
+            except OSError:
+                # Windows doesn't replace existing files
+                os.remove(path)
+                os.rename(tmppath, path)
+        except:
+            os.remove(tmppath)
+            raise
+        if self._size is None:
+            self._size = self._scan()[0]
+        else:
+            self._size += len(data) - old_size
+        if self._size > self.maxsize:
+            self.prune(self.maxsize * 3 // 4)
+
+    def _scan(self):
+        """
+        Return the total size of the cached files and a list of their
+        ``(mtime, size, path)``.
+        """
+        total = 0
+        files = []
+        for dirname in os.listdir(self.directory):
+            dirpath = os.path.join(self.directory, dirname)
+            if not os.path.isdir(dirpath):
+                continue
+            for name in os.listdir(dirpath):
+                if name.endswith('.tmp'):
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                total += st.st_size
+                files.append((st.st_mtime, st.st_size, path))
+        return total, files
+
+    def prune(self, maxsize):
+        """
+        Remove the least recently used files until the others take up at
+        most `maxsize` bytes.
+        """
+        total, files = self._scan()
+        files.sort()
+        for mtime, size, path in files:
+            if total <= maxsize:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                # removed by another process
+                pass
+            total -= size
+        self._size = total
+
+    def clear(self):
+        BaseCache.clear(self)
+        self.prune(0)
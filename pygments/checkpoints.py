@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+    pygments.checkpoints
+    ~~~~~~~~~~~~~~~~~~~~
+
+    Lexer state checkpoints, for lexing a range of lines of a long text
+    without lexing all the text before it.
+
+    :copyright: Copyright 2006-2010 by the Pygments team, see AUTHORS.
+    :license: BSD, see LICENSE for details.
+"""
+
+from array import array
+from bisect import bisect_right
+
+from pygments.lexer import _uses_regex_loop
+from pygments.tokenbuffer import TokenBuffer, _types_array
+from pygments.util import b, SpanError
+
+__all__ = ['CheckpointIndex', 'lex_range']
+
+
+# format version of `CheckpointIndex.dumps()`
+_dump_version = 'CP1'
+
+
+class CheckpointIndex(object):
+    """
+    The states of a `RegexLexer` at line starts of a text, about every
+    `interval` characters.  The lexer can resume at each of these
+    checkpoints, since its state is just the position and the state stack.
+
+    The index is filled while lexing (see `lex_range()`), so it covers
+    the text up to where it has been lexed.
+
+    *New in Pygments 1.4.*
+    """
+
+    #: number of characters after which the next checkpoint is added
+    interval = 4096
+
+    def __init__(self):
+        #: array of the offsets of the checkpoints in the text
+        self.offsets = array('I', [0])
+        #: array of the line numbers of the checkpoints
+        self.lines = array('I', [1])
+        #: list of the state stacks (tuples) at the checkpoints
+        self.stacks = [('root',)]
+        #: the offset from which on the next checkpoint is added
+        self.next_offset = self.interval
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __repr__(self):
+        return '<pygments.checkpoints.CheckpointIndex with %d checkpoints>' \
+               % len(self.offsets)
+
+    def add(self, text, pos, stack):
+        """
+        Add a checkpoint at offset `pos` of `text`, a line start after the
+        last checkpoint, where the lexer has the state `stack`.
+        """
+        for state in stack:
+            if state.startswith('_tmp_'):
+                # combined states are named in the order they are created
+                # in, which could differ in another process; try the
+                # next line
+                return
+        last = self.offsets[-1]
+        self.lines.append(self.lines[-1] + text.count('\n', last, pos))
+        self.offsets.append(pos)
+        self.stacks.append(tuple(stack))
+        self.next_offset = pos + self.interval
+
+    def find(self, line):
+        """
+        Return the position of the last checkpoint at or before `line`.
+        """
+        return bisect_right(self.lines, line) - 1
+
+    def dumps(self):
+        """
+        Return the index serialized as a byte string, for `loads()`.
+        """
+        parts = [_dump_version]
+        for offset, line, stack in zip(self.offsets, self.lines,
+                                       self.stacks):
+            parts.append('%d %d %s' % (offset, line, ' '.join(stack)))
+        return b('\n'.join(parts))
+
+    @classmethod
+    def loads(cls, data):
+        """
+        Return the index serialized by `dumps()` in `data`.  Raise
+        `ValueError` if `data` is not a serialized index.
+        """
+        try:
+            lines = data.decode('ascii').split('\n')
+        except UnicodeError:
+            raise ValueError('not a serialized checkpoint index')
+        if lines[0] != _dump_version:
+            raise ValueError('not a serialized checkpoint index')
+        index = cls()
+        del index.offsets[:]
+        del index.lines[:]
+        del index.stacks[:]
+        for item in lines[1:]:
+            item = item.split()
+            if len(item) < 3:
+                raise ValueError('invalid checkpoint %r' % ' '.join(item))
+            index.offsets.append(int(item[0]))
+            index.lines.append(int(item[1]))
+            index.stacks.append(tuple(item[2:]))
+        if not index.stacks:
+            raise ValueError('empty checkpoint index')
+        index.next_offset = index.offsets[-1] + index.interval
+        return index
+
+
+def _token_lines(tokensource, first, last):
+    """
+    Yield the tokens of the lines `first` to `last` of the token stream,
+    splitting tokens that cross the boundaries, and stop consuming the
+    stream after line `last`.
+    """
+    line = 1
+    for ttype, value in tokensource:
+        if line > last:
+            return
+        n = value.count('\n')
+        if line + n < first:
+            line += n
+            continue
+        if line < first:
+            pos = -1
+            for i in xrange(first - line):
+                pos = value.index('\n', pos + 1)
+            value = value[pos + 1:]
+            line = first
+            n = value.count('\n')
+        if line + n > last:
+            pos = -1
+            for i in xrange(last - line + 1):
+                pos = value.index('\n', pos + 1)
+            yield ttype, value[:pos + 1]
+            return
+        if value:
+            yield ttype, value
+        line += n
+
+
+def _lex_lines(code, lexer, first, last):
+    """
+    Lex `code` from the start, up to line `last`.
+    """
+    return TokenBuffer(_token_lines(lexer.get_tokens(code), first, last))
+
+
+def lex_range(code, lexer, first, last, cache=None):
+    """
+    Return a `TokenBuffer` with the tokens of the lines `first` to `last`
+    (inclusive, counted from 1) of `code` lexed with `lexer`.  Lexing stops
+    at the end of line `last`.
+
+    A `RegexLexer` without filters starts lexing at the last checkpoint
+    before `first`.  The checkpoint index of the code is taken from and
+    stored in `cache` (see `pygments.cache`), if given; without an index,
+    lexing starts at the beginning and adds the checkpoints it passes.
+    Other lexers lex from the beginning.
+    """
+    if first < 1 or last < first:
+        raise ValueError('invalid line range %d-%d' % (first, last))
+    if lexer.filters or not _uses_regex_loop(lexer):
+        return _lex_lines(code, lexer, first, last)
+    text = lexer.preprocess_text(code)
+    index = None
+    if cache is not None:
+        index = cache.get_checkpoints(code, lexer)
+    if index is None:
+        index = CheckpointIndex()
+    ncheckpoints = len(index)
+    i = index.find(first)
+    offset = index.offsets[i]
+    # find the offsets of the range, starting at the checkpoint
+    start = offset
+    for n in xrange(first - index.lines[i]):
+        start = text.find('\n', start) + 1
+        if not start:
+            start = len(text)
+            break
+    end = start
+    for n in xrange(last - first + 1):
+        end = text.find('\n', end) + 1
+        if not end:
+            end = len(text)
+            break
+    types = _types_array()
+    offsets = array('I', [start])
+    if start < end:
+        # only the last checkpoint is followed by unindexed text
+        if i == ncheckpoints - 1:
+            spans = lexer._lex(text, index.stacks[i], offset, True, index)
+        else:
+            spans = lexer._lex(text, index.stacks[i], offset, True)
+        try:
+            for tstart, tend, ttype in spans:
+                if tend <= start:
+                    continue
+                types.append(ttype.id)
+                if tend >= end:
+                    offsets.append(end)
+                    break
+                offsets.append(tend)
+        except SpanError:
+            # a callback doesn't reproduce its match
+            return _lex_lines(code, lexer, first, last)
+    if cache is not None and len(index) > ncheckpoints:
+        cache.set_checkpoints(code, lexer, index)
+    return TokenBuffer._from_arrays(text, types, offsets)
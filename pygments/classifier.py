@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+    pygments.classifier
+    ~~~~~~~~~~~~~~~~~~~
+
+    A statistical language identifier that ranks lexers by the character
+    trigrams and words of a text, used by ``guess_lexer()`` if it is set
+    with ``pygments.lexers.set_guess_classifier()``.
+
+    Models are trained from example files with ``scripts/train_classifier.py``.
+
+    :copyright: Copyright 2006-2010 by the Pygments team, see AUTHORS.
+    :license: BSD, see LICENSE for details.
+"""
+
+import re
+import math
+
+__all__ = ['NgramClassifier']
+
+
+word_re = re.compile(r'[A-Za-z_][A-Za-z0-9_]+')
+
+#: first line of model files
+MODEL_HEADER = '# pygments n-gram model 1'
+
+
+def get_features(text, prefix):
+    """
+    Return a dict mapping the features of the first `prefix` characters of
+    `text` to their number of occurrences: the character trigrams and,
+    prefixed with a NUL byte, the words.
+    """
+    text = text[:prefix]
+    if not isinstance(text, unicode):
+        text = text.decode('latin1')
+    counts = {}
+    get = counts.get
+    for i in xrange(len(text) - 2):
+        feature = text[i:i + 3]
+        counts[feature] = get(feature, 0) + 1
+    for word in word_re.findall(text):
+        word = u'\0' + word
+        counts[word] = get(word, 0) + 1
+    return counts
+
+
+class NgramClassifier(object):
+    """
+    A naive Bayes classifier over character trigrams and words.
+
+    For every lexer (identified by its name), the model stores the weights
+    (log probabilities) of its most frequent features and one weight for
+    all other features.  They are kept in an inverted index, so that
+    scoring a text needs one dict lookup per distinct feature.
+
+    *New in Pygments 1.4.*
+    """
+
+    #: number of characters of a text that are looked at
+    prefix = 4096
+
+    #: number of features stored per lexer
+    features_per_lexer = 400
+
+    def __init__(self, prefix=None):
+        if prefix is not None:
+            self.prefix = prefix
+        #: lexer names
+        self.lexers = []
+        #: weight of features not stored for a lexer, by lexer index
+        self.unseen = []
+        #: feature -> list of (lexer index, weight - unseen weight)
+        self.index = {}
+
+    @classmethod
+    def train(cls, samples, prefix=None, features_per_lexer=None):
+        """
+        Create a classifier from an iterable of ``(lexername, text)``
+        samples.
+        """
+        self = cls(prefix)
+        if features_per_lexer is None:
+            features_per_lexer = cls.features_per_lexer
+        counts = {}
+        vocabulary = {}
+        for name, text in samples:
+            lexer_counts = counts.setdefault(name, {})
+            # train on more than the prefix, for more robust weights
+            features = get_features(text, self.prefix * 16)
+            for feature, n in features.iteritems():
+                lexer_counts[feature] = lexer_counts.get(feature, 0) + n
+                vocabulary[feature] = True
+        size = len(vocabulary)
+        names = counts.keys()
+        names.sort()
+        for name in names:
+            lexer_counts = counts[name]
+            total = sum(lexer_counts.itervalues())
+            unseen = math.log(1.0 / (total + size))
+            frequent = [(n, f) for f, n in lexer_counts.iteritems()]
+            frequent.sort()
+            weights = []
+            for n, feature in frequent[-features_per_lexer:]:
+                weight = math.log((n + 1.0) / (total + size))
+                weights.append((feature, weight))
+            self._add_lexer(name, unseen, weights)
+        return self
+
+    def _add_lexer(self, name, unseen, weights):
+        idx = len(self.lexers)
+        self.lexers.append(name)
+        self.unseen.append(unseen)
+        for feature, weight in weights:
+            self.index.setdefault(feature, []).append((idx, weight - unseen))
+
+    def rank(self, text):
+        """
+        Return a list of ``(score, lexername)`` for `text`, best first.  The
+        scores are log probabilities; only their order is meaningful.
+        Return an empty list if the text has no features.
+        """
+        features = get_features(text, self.prefix)
+        if not features:
+            return []
+        total = sum(features.itervalues())
+        scores = [unseen * total for unseen in self.unseen]
+        index = self.index
+        for feature, n in features.iteritems():
+            if feature in index:
+                for idx, delta in index[feature]:
+                    scores[idx] += delta * n
+        result = zip(scores, self.lexers)
+        result.sort()
+        result.reverse()
+        return result
+
+    def save(self, outfile):
+        """
+        Write the model to the file object `outfile`, as ASCII text.
+        """
+        weights = [[] for name in self.lexers]
+        for feature, entries in self.index.iteritems():
+            for idx, delta in entries:
+                weights[idx].append((feature, delta + self.unseen[idx]))
+        outfile.write('%s\nprefix %d\n' % (MODEL_HEADER, self.prefix))
+        for idx, name in enumerate(self.lexers):
+            outfile.write('lexer %.4f %s\n' % (self.unseen[idx],
+                                               name.encode('utf-8')))
+            weights[idx].sort()
+            for feature, weight in weights[idx]:
+                outfile.write('%.4f %s\n' % (weight,
+                              feature.encode('unicode_escape')))
+
+    @classmethod
+    def load(cls, infile):
+        """
+        Read a model written by `save()` from the file object `infile`.
+        """
+        lines = iter(infile)
+        if lines.next().rstrip('\n') != MODEL_HEADER:
+            raise ValueError('not a pygments n-gram model')
+        self = cls(int(lines.next().split()[1]))
+        name = None
+        for line in lines:
+            line = line.rstrip('\n')
+            if line.startswith('lexer '):
+                if name is not None:
+                    self._add_lexer(name, unseen, weights)
+                unseen, name = line[6:].split(' ', 1)
+                name = name.decode('utf-8')
+                unseen = float(unseen)
+                weights = []
+            else:
+                weight, feature = line.split(' ', 1)
+                weights.append((feature.decode('unicode_escape'),
+                                float(weight)))
+        if name is not None:
+            self._add_lexer(name, unseen, weights)
+        return self
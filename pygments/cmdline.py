@@ -12,14 +12,12 @@ import sys
 import getopt
 from textwrap import dedent
 
-from pygments import __version__, highlight
+from pygments import __version__, highlight, lex
 from pygments.util import ClassNotFound, OptionError, docstring_headline
 from pygments.lexers import get_all_lexers, get_lexer_by_name, get_lexer_for_filename, \
      find_lexer_class, guess_lexer, TextLexer
 from pygments.formatters import get_all_formatters, get_formatter_by_name, \
-     get_formatter_for_filename, find_formatter_class, \
-     TerminalFormatter  # pylint:disable-msg=E0611
-from pygments.filters import get_all_filters, find_filter_class
+     get_formatter_for_filename, find_formatter_class
 from pygments.styles import get_all_styles, get_style_by_name
 
 
@@ -126,6 +124,7 @@ def _print_help(what, name):
             print "Help on the %s formatter:" % cls.name
             print dedent(cls.__doc__)
         elif what == 'filter':
+            from pygments.filters import find_filter_class
             cls = find_filter_class(name)
             print "Help on the %s filter:" % name
             print dedent(cls.__doc__)
@@ -168,6 +167,7 @@ def _print_list(what):
         print "Filters:"
         print "~~~~~~~~"
 
+        from pygments.filters import get_all_filters, find_filter_class
         for name in get_all_filters():
             cls = find_filter_class(name)
             print "* " + name + ':'
@@ -340,9 +340,14 @@ def main(args=sys.argv):
             return 1
     else:
         if not fmter:
-            fmter = TerminalFormatter(**parsed_opts)
+            fmter = get_formatter_by_name('terminal', **parsed_opts)
         outfile = sys.stdout
 
+    if not outfn and getattr(fmter, 'pagelines', 0):
+        print >>sys.stderr, 'Error: the pages can only be written next ' + \
+                            'to an output file (use -o <outfile>)'
+        return 2
+
     # select lexer
     lexer = opts.pop('-l', None)
     if lexer:
@@ -414,7 +419,12 @@ def main(args=sys.argv):
         # process filters
         for fname, fopts in F_opts:
             lexer.add_filter(fname, **fopts)
-        highlight(code, lexer, fmter, outfile)
+        if outfn and getattr(fmter, 'pagelines', 0):
+            # write the pages to files of their own, and an index to outfn
+            outfile.close()
+            fmter.format_pages(lex(code, lexer), outfn)
+        else:
+            highlight(code, lexer, fmter, outfile)
     except Exception, err:
         import traceback
         info = traceback.format_exception(*sys.exc_info())
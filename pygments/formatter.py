@@ -11,7 +11,7 @@
 
 import codecs
 
-from pygments.util import get_bool_opt
+from pygments.util import get_bool_opt, cache_key, _stable_repr
 from pygments.styles import get_style_by_name
 
 __all__ = ['Formatter']
@@ -71,6 +71,37 @@ class Formatter(object):
         self.encoding = options.get('outencoding', None) or self.encoding
         self.options = options
 
+    def get_cache_key(self):
+        """
+        Return a string that identifies the formatter class, its options,
+        the contents of its style and its encoding and is the same in every
+        process, or None if an option or class has no stable representation
+        (see ``pygments.util.cache_key``).  Used by ``pygments.cache``.
+        """
+        key = cache_key(self.__class__, self.options, ('style',))
+        if key is None:
+            return None
+        # the style by its contents, which could be changed under the
+        # same name
+        style = self.style
+        style_key = _stable_repr([style.styles, style.background_color,
+                                  style.highlight_color])
+        if style_key is None:
+            return None
+        return '%s|%s|%r' % (key, style_key, self.encoding)
+
+    def get_range_formatter(self, first):
+        """
+        Return a formatter that formats the lines of a text from line
+        ``first`` on like this one formats them as part of the whole text,
+        for formatting just a range of lines.
+
+        Formatters whose output depends on the line numbers (like line
+        numbers or highlighted lines) return a changed copy; by default
+        this returns the formatter itself.
+        """
+        return self
+
     def get_style_defs(self, arg=''):
         """
         Return the style definitions for the current style as a string.
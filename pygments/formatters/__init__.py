@@ -8,61 +8,123 @@
     :copyright: Copyright 2006-2010 by the Pygments team, see AUTHORS.
     :license: BSD, see LICENSE for details.
 """
+import sys
+import types
 import os.path
-import fnmatch
 
 from pygments.formatters._mapping import FORMATTERS
-from pygments.plugin import find_plugin_formatters
-from pygments.util import ClassNotFound
+from pygments.plugin import find_plugin_formatters, on_refresh
+from pygments.util import ClassNotFound, FilenameIndex
 
-ns = globals()
-for fcls in FORMATTERS:
-    ns[fcls.__name__] = fcls
-del fcls
 
 __all__ = ['get_formatter_by_name', 'get_formatter_for_filename',
-           'get_all_formatters'] + [cls.__name__ for cls in FORMATTERS]
-
-
-_formatter_alias_cache = {}
-_formatter_filename_cache = []
-
-def _init_formatter_cache():
-    if _formatter_alias_cache:
-        return
-    for cls in get_all_formatters():
-        for alias in cls.aliases:
-            _formatter_alias_cache[alias] = cls
-        for fn in cls.filenames:
-            _formatter_filename_cache.append((fn, cls))
+           'get_all_formatters'] + FORMATTERS.keys()
+
+_formatter_cache = {}
+
+#: lookup tables built by _get_index(): the aliases mapped to the names of
+#: the builtin formatters and a `FilenameIndex` of their filename patterns;
+#: the same for the plugin formatters (with ``plugin_`` prefixed keys),
+#: mapped to the classes
+_index = {}
+on_refresh(_index.clear)
+
+
+def _load_formatters(module_name):
+    """
+    Load a formatter (and all others in the module too).
+    """
+    mod = __import__(module_name, None, None, ['__all__'])
+    for formatter_name in mod.__all__:
+        _formatter_cache[formatter_name] = getattr(mod, formatter_name)
+
+
+def _get_formatter_class(entry):
+    """
+    Return the formatter class for an index entry.
+    """
+    if isinstance(entry, str):
+        if entry not in _formatter_cache:
+            _load_formatters(FORMATTERS[entry][0])
+        return _formatter_cache[entry]
+    return entry
+
+
+def _get_index(key):
+    """
+    Return one of the lookup tables, building it on first use.  The plugin
+    entry points are only scanned when a plugin table is needed.
+    """
+    if key not in _index:
+        if key.startswith('plugin_'):
+            formatters = [(cls, cls.aliases, cls.filenames)
+                          for _, cls in find_plugin_formatters()]
+            prefix = 'plugin_'
+        else:
+            formatters = [(name, info[2], info[3])
+                          for name, info in FORMATTERS.iteritems()]
+            prefix = ''
+        aliases = {}
+        filenames = FilenameIndex()
+        for entry, formatter_aliases, formatter_filenames in formatters:
+            for alias in formatter_aliases:
+                aliases[alias] = entry
+            filenames.add(entry, formatter_filenames)
+        _index[prefix + 'alias'] = aliases
+        _index[prefix + 'filename'] = filenames
+    return _index[key]
 
 
 def find_formatter_class(name):
-    _init_formatter_cache()
-    cls = _formatter_alias_cache.get(name, None)
-    return cls
+    """
+    Lookup a formatter by alias.  Builtin formatters take precedence over
+    plugins.  Return None if not found.
+    """
+    entry = _get_index('alias').get(name)
+    if entry is None:
+        entry = _get_index('plugin_alias').get(name)
+        if entry is None:
+            return None
+    return _get_formatter_class(entry)
 
 
 def get_formatter_by_name(name, **options):
-    _init_formatter_cache()
-    cls = _formatter_alias_cache.get(name, None)
+    cls = find_formatter_class(name)
     if not cls:
         raise ClassNotFound("No formatter found for name %r" % name)
     return cls(**options)
 
 
 def get_formatter_for_filename(fn, **options):
-    _init_formatter_cache()
     fn = os.path.basename(fn)
-    for pattern, cls in _formatter_filename_cache:
-        if fnmatch.fnmatch(fn, pattern):
-            return cls(**options)
+    matches = _get_index('filename').match(fn) or \
+              _get_index('plugin_filename').match(fn)
+    if matches:
+        return _get_formatter_class(matches[0])(**options)
     raise ClassNotFound("No formatter found for file name %r" % fn)
 
 
 def get_all_formatters():
     """Return a generator for all formatters."""
-    for formatter in FORMATTERS:
-        yield formatter
+    for name in FORMATTERS:
+        yield _get_formatter_class(name)
     for _, formatter in find_plugin_formatters():
         yield formatter
+
+
+class _automodule(types.ModuleType):
+    """Automatically import formatters."""
+
+    def __getattr__(self, name):
+        if name in FORMATTERS:
+            cls = _get_formatter_class(name)
+            setattr(self, name, cls)
+            return cls
+        raise AttributeError(name)
+
+
+oldmod = sys.modules['pygments.formatters']
+newmod = _automodule('pygments.formatters')
+newmod.__dict__.update(oldmod.__dict__)
+sys.modules['pygments.formatters'] = newmod
+del newmod.newmod, newmod.oldmod, newmod.sys, newmod.types
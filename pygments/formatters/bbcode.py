@@ -82,23 +82,29 @@ class BBCodeFormatter(Formatter):
         if self._mono:
             outfile.write('[font=monospace]')
 
+        styles = self.styles
         lastval = ''
-        lasttype = None
+        laststyle = None
 
         for ttype, value in tokensource:
-            while ttype not in self.styles:
-                ttype = ttype.parent
-            if ttype == lasttype:
+            try:
+                style = styles[ttype]
+            except KeyError:
+                node = ttype
+                while node not in styles:
+                    node = node.parent
+                style = styles[ttype] = styles[node]
+            if style is laststyle:
                 lastval += value
             else:
                 if lastval:
-                    start, end = self.styles[lasttype]
+                    start, end = laststyle
                     outfile.write(''.join((start, lastval, end)))
                 lastval = value
-                lasttype = ttype
+                laststyle = style
 
         if lastval:
-            start, end = self.styles[lasttype]
+            start, end = laststyle
             outfile.write(''.join((start, lastval, end)))
 
         if self._mono:
@@ -10,26 +10,21 @@
 """
 
 import os
+import re
 import sys
+import copy
 import StringIO
 
 from pygments.formatter import Formatter
 from pygments.token import Token, Text, STANDARD_TYPES
-from pygments.util import get_bool_opt, get_int_opt, get_list_opt, bytes
+from pygments.tokenbuffer import TokenBuffer, count_lines
+from pygments.util import get_bool_opt, get_int_opt, get_list_opt, bytes, \
+     escape_html, BytesIO
 
 
 __all__ = ['HtmlFormatter']
 
 
-def escape_html(text):
-    """Escape &, <, > as well as single and double quotes for HTML."""
-    return text.replace('&', '&amp;').  \
-                replace('<', '&lt;').   \
-                replace('>', '&gt;').   \
-                replace('"', '&quot;'). \
-                replace("'", '&#39;')
-
-
 def get_random_id():
     """Return a random id for javascript fields."""
     from random import random
@@ -42,6 +37,22 @@ def get_random_id():
     return sha('%s|%s' % (random(), time())).hexdigest()
 
 
+_short_color_re = re.compile(r'#([0-9a-fA-F])\1([0-9a-fA-F])\2'
+                             r'([0-9a-fA-F])\3\b')
+_visible_blank_re = re.compile(r'background|underline|border')
+
+def _compact_style(style):
+    """Return the shortest equivalent of an inline style string."""
+    style = style.replace(': ', ':').replace('; ', ';')
+    style = style.replace('background-color:', 'background:')
+    return _short_color_re.sub(r'#\1\2\3', style)
+
+
+#: the class maps, span tags and style definitions of all formatters with
+#: the same class, style and options, see `HtmlFormatter._create_stylesheet()`
+_stylesheet_cache = {}
+
+
 def _get_ttype_class(ttype):
     fname = STANDARD_TYPES.get(ttype)
     if fname:
@@ -98,6 +109,25 @@ DOC_FOOTER = '''\
 </html>
 '''
 
+PAGES_INDEX = '''\
+<!DOCTYPE html PUBLIC "-//W3C//DTD HTML 4.01//EN"
+   "http://www.w3.org/TR/html4/strict.dtd">
+
+<html>
+<head>
+  <title>%(title)s</title>
+  <meta http-equiv="content-type" content="text/html; charset=%(encoding)s">
+</head>
+<body>
+<h2>%(title)s</h2>
+
+<ul>
+%(pages)s
+</ul>
+</body>
+</html>
+'''
+
 
 class HtmlFormatter(Formatter):
     r"""
@@ -283,6 +313,22 @@ class HtmlFormatter(Formatter):
         If set to `True`, will wrap line numbers in <a> tags. Used in
         combination with `linenos` and `lineanchors`.
 
+    `compact`
+        If set to ``True``, make the output as small as possible without
+        changing how it looks: tokens get the ``<span>`` of their nearest
+        styled parent type (or none if no parent is styled), whitespace
+        tokens join the ``<span>`` before them if that doesn't show
+        whitespace, adjacent tokens with the same ``<span>`` share it, and
+        inline styles are written in their shortest form.  CSS rules of
+        your own for the classes of unstyled token types won't apply
+        (default: ``False``).  *New in Pygments 1.4.*
+
+    `pagelines`
+        If set to a number n > 0, the `iter_pages()`, `get_page()` and
+        `format_pages()` methods split the output into pages of n lines,
+        each wrapped and numbered like a complete output of its own
+        (default: ``0``, use `format()` only).  *New in Pygments 1.4.*
+
 
     **Subclassing the HTML formatter**
 
@@ -331,6 +377,39 @@ class HtmlFormatter(Formatter):
     After calling `wrap()`, the `format()` method also adds the "line numbers"
     and/or "full document" wrappers if the respective options are set. Then, all
     HTML yielded by the wrapped generator is output.
+
+
+    **Splitting the output into pages**
+
+    *New in Pygments 1.4.*
+
+    Browsers are slow to render very long ``<pre>`` blocks.  If the
+    `pagelines` option is set, the output can be split into pages that are
+    formatted independently, with the line numbers, anchors and highlighted
+    lines of the whole text:
+
+    `iter_pages(tokensource)`
+        Yield ``(first, last, output)`` for every page: the numbers of its
+        first and last line, counted from 1, and its formatted output (as
+        `format()` would write it to a string).
+
+    `get_page(tokensource, pageno)`
+        Return the output of page `pageno` (counted from 1).
+
+    `highlight_page(code, lexer, pageno)`
+        Return the output of page `pageno` of `code` like `get_page()`, but
+        lex only that page: lexers based on `RegexLexer` start near it, see
+        ``pygments.highlight_range()``.
+
+    `format_pages(tokensource, filename)`
+        Write every page to a file of its own, named like `filename` with
+        the page number added (``code.html`` becomes ``code-1.html``,
+        ``code-2.html``...), and an index page linking to them to
+        `filename`.  With the `full` option, every page is a complete
+        document.  Return the names of the page files.
+
+    The token stream is split lazily, so if it comes from a lexer's
+    `get_tokens()`, the text is lexed only as far as the requested pages.
     """
 
     name = 'HTML'
@@ -364,6 +443,8 @@ class HtmlFormatter(Formatter):
         self.lineseparator = options.get('lineseparator', '\n')
         self.lineanchors = options.get('lineanchors', '')
         self.anchorlinenos = options.get('anchorlinenos', False)
+        self.pagelines = abs(get_int_opt(options, 'pagelines', 0))
+        self.compact = get_bool_opt(options, 'compact', False)
         self.hl_lines = set()
         for lineno in get_list_opt(options, 'hl_lines', []):
             try:
@@ -371,17 +452,37 @@ class HtmlFormatter(Formatter):
             except ValueError:
                 pass
 
-        self._class_cache = {}
         self._create_stylesheet()
 
     def _get_css_class(self, ttype):
         """Return the css class of this token type prefixed with
         the classprefix option."""
-        if ttype in self._class_cache:
+        try:
             return self._class_cache[ttype]
-        return self.classprefix + _get_ttype_class(ttype)
+        except KeyError:
+            cls = self._class_cache[ttype] = \
+                  self.classprefix + _get_ttype_class(ttype)
+            return cls
 
     def _create_stylesheet(self):
+        # everything computed from the style is shared with the formatters
+        # having the same class, style and options, so it must not be
+        # modified except by filling the caches
+        key = (self.__class__, self.style, self.classprefix, self.noclasses,
+               self.compact)
+        try:
+            (self.ttype2class, self.class2style, self._class_cache,
+             self._span_cache, self._visible_blank_spans,
+             self._style_defs_cache) = _stylesheet_cache[key]
+            return
+        except KeyError:
+            pass
+        self._class_cache = {}
+        self._span_cache = {}
+        # spans whose style shows whitespace, filled by _get_span()
+        self._visible_blank_spans = {}
+        # get_style_defs() results by arguments
+        self._style_defs_cache = {}
         t2c = self.ttype2class = {Token: ''}
         c2s = self.class2style = {}
         cp = self.classprefix
@@ -405,6 +506,9 @@ class HtmlFormatter(Formatter):
                 # save len(ttype) to enable ordering the styles by
                 # hierarchy (necessary for CSS cascading rules!)
                 c2s[name] = (style[:-2], ttype, len(ttype))
+        _stylesheet_cache[key] = (t2c, c2s, self._class_cache,
+                                  self._span_cache, self._visible_blank_spans,
+                                  self._style_defs_cache)
 
     def get_style_defs(self, arg=None):
         """
@@ -418,6 +522,11 @@ class HtmlFormatter(Formatter):
             args = [arg]
         else:
             args = list(arg)
+        key = (tuple(args), bool(arg), self.nobackground)
+        try:
+            return self._style_defs_cache[key]
+        except KeyError:
+            pass
 
         def prefix(cls):
             if cls:
@@ -443,7 +552,8 @@ class HtmlFormatter(Formatter):
         if self.style.highlight_color is not None:
             lines.insert(0, '%s.hll { background-color: %s }' %
                          (prefix(''), self.style.highlight_color))
-        return '\n'.join(lines)
+        result = self._style_defs_cache[key] = '\n'.join(lines)
+        return result
 
     def _decodeifneeded(self, value):
         if isinstance(value, bytes):
@@ -494,13 +604,17 @@ class HtmlFormatter(Formatter):
             yield t, line
         yield 0, DOC_FOOTER
 
-    def _wrap_tablelinenos(self, inner):
-        dummyoutfile = StringIO.StringIO()
-        lncount = 0
-        for t, line in inner:
-            if t:
-                lncount += 1
-            dummyoutfile.write(line)
+    def _wrap_tablelinenos(self, inner, lncount=None):
+        if lncount is None:
+            # the line numbers come first, so the code has to be buffered
+            # to count its lines
+            dummyoutfile = StringIO.StringIO()
+            lncount = 0
+            for t, line in inner:
+                if t:
+                    lncount += 1
+                dummyoutfile.write(line)
+            inner = [(0, dummyoutfile.getvalue())]
 
         fl = self.linenostart
         mw = len(str(lncount + fl - 1))
@@ -553,20 +667,23 @@ class HtmlFormatter(Formatter):
             yield 0, ('<table class="%stable">' % self.cssclass +
                       '<tr><td class="linenos"><div class="linenodiv"><pre>' +
                       ls + '</pre></div></td><td class="code">')
-        yield 0, dummyoutfile.getvalue()
+        for t, line in inner:
+            yield t, line
         yield 0, '</td></tr></table>'
 
-    def _wrap_inlinelinenos(self, inner):
-        # need a list of lines since we need the width of a single number :(
-        lines = list(inner)
+    def _wrap_inlinelinenos(self, inner, lncount=None):
+        if lncount is None:
+            # need a list of lines since we need the width of a single number
+            inner = list(inner)
+            lncount = len(inner)
         sp = self.linenospecial
         st = self.linenostep
         num = self.linenostart
-        mw = len(str(len(lines) + num - 1))
+        mw = len(str(lncount + num - 1))
 
         if self.noclasses:
             if sp:
-                for t, line in lines:
+                for t, line in inner:
                     if num%sp == 0:
                         style = 'background-color: #ffffc0; padding: 0 5px 0 5px'
                     else:
@@ -575,26 +692,27 @@ class HtmlFormatter(Formatter):
                         style, mw, (num%st and ' ' or num)) + line
                     num += 1
             else:
-                for t, line in lines:
+                for t, line in inner:
                     yield 1, ('<span style="background-color: #f0f0f0; '
                               'padding: 0 5px 0 5px">%*s</span> ' % (
                               mw, (num%st and ' ' or num)) + line)
                     num += 1
         elif sp:
-            for t, line in lines:
+            for t, line in inner:
                 yield 1, '<span class="lineno%s">%*s</span> ' % (
                     num%sp == 0 and ' special' or '', mw,
                     (num%st and ' ' or num)) + line
                 num += 1
         else:
-            for t, line in lines:
+            for t, line in inner:
                 yield 1, '<span class="lineno">%*s</span> ' % (
                     mw, (num%st and ' ' or num)) + line
                 num += 1
 
     def _wrap_lineanchors(self, inner):
         s = self.lineanchors
-        i = 0
+        # the anchors have the line numbers, which anchorlinenos links to
+        i = self.linenostart - 1
         for t, line in inner:
             if t:
                 i += 1
@@ -630,60 +748,90 @@ class HtmlFormatter(Formatter):
             yield tup
         yield 0, '</pre>'
 
+    def _get_span(self, ttype):
+        """Return the opening ``<span>`` tag for this token type, or an
+        empty string if the type isn't styled."""
+        if self.noclasses or self.compact:
+            # use the style of the nearest styled type
+            getcls = self.ttype2class.get
+            cclass = getcls(ttype)
+            while cclass is None:
+                ttype = ttype.parent
+                cclass = getcls(ttype)
+            if not cclass:
+                return ''
+            style = self.class2style[cclass][0]
+            if not self.noclasses:
+                span = '<span class="%s">' % cclass
+            elif self.compact:
+                span = '<span style="%s">' % _compact_style(style)
+            else:
+                span = '<span style="%s">' % style
+            if _visible_blank_re.search(style):
+                self._visible_blank_spans[span] = True
+            return span
+        cls = self._get_css_class(ttype)
+        return cls and '<span class="%s">' % cls or ''
+
     def _format_lines(self, tokensource):
         """
         Just format the tokens, without any wrapping tags.
         Yield individual lines.
         """
-        nocls = self.noclasses
         lsep = self.lineseparator
-        # for <span style=""> lookup only
-        getcls = self.ttype2class.get
-        c2s = self.class2style
+        # opening span tag per token type, computed once per type
+        spans = self._span_cache
+        compact = self.compact
+        visible_blank = self._visible_blank_spans
 
         lspan = ''
-        line = ''
+        line = []
         for ttype, value in tokensource:
-            if nocls:
-                cclass = getcls(ttype)
-                while cclass is None:
-                    ttype = ttype.parent
-                    cclass = getcls(ttype)
-                cspan = cclass and '<span style="%s">' % c2s[cclass][0] or ''
-            else:
-                cls = self._get_css_class(ttype)
-                cspan = cls and '<span class="%s">' % cls or ''
-
-            parts = escape_html(value).split('\n')
-
-            # for all but the last line
-            for part in parts[:-1]:
-                if line:
-                    if lspan != cspan:
-                        line += (lspan and '</span>') + cspan + part + \
-                                (cspan and '</span>') + lsep
-                    else: # both are the same
-                        line += part + (lspan and '</span>') + lsep
-                    yield 1, line
-                    line = ''
-                elif part:
-                    yield 1, cspan + part + (cspan and '</span>') + lsep
+            try:
+                cspan = spans[ttype]
+            except KeyError:
+                cspan = spans[ttype] = self._get_span(ttype)
+            if compact and cspan != lspan and value.isspace() and \
+               cspan not in visible_blank:
+                # whitespace looks the same in any span not showing it
+                if line and lspan not in visible_blank and \
+                   '\n' not in value:
+                    cspan = lspan
                 else:
-                    yield 1, lsep
+                    cspan = ''
+
+            value = escape_html(value)
+            if '\n' in value:
+                parts = value.split('\n')
+                # for all but the last line
+                for part in parts[:-1]:
+                    if line:
+                        if lspan != cspan:
+                            line.extend((lspan and '</span>', cspan, part,
+                                         cspan and '</span>', lsep))
+                        else: # both are the same
+                            line.extend((part, lspan and '</span>', lsep))
+                        yield 1, ''.join(line)
+                        line = []
+                    elif part:
+                        yield 1, cspan + part + (cspan and '</span>') + lsep
+                    else:
+                        yield 1, lsep
+                value = parts[-1]
             # for the last line
-            if line and parts[-1]:
-                if lspan != cspan:
-                    line += (lspan and '</span>') + cspan + parts[-1]
+            if value:
+                if not line:
+                    line.append(cspan)
                     lspan = cspan
-                else:
-                    line += parts[-1]
-            elif parts[-1]:
-                line = cspan + parts[-1]
-                lspan = cspan
+                elif lspan != cspan:
+                    line.append(lspan and '</span>')
+                    line.append(cspan)
+                    lspan = cspan
+                line.append(value)
             # else we neither have to open a new span nor set lspan
 
         if line:
-            yield 1, line + (lspan and '</span>') + lsep
+            yield 1, ''.join(line) + (lspan and '</span>') + lsep
 
     def _highlight_lines(self, tokensource):
         """
@@ -729,19 +877,170 @@ class HtmlFormatter(Formatter):
         use several different wrappers that process the original source
         linewise, e.g. line number generators.
         """
+        lncount = None
+        if self.linenos and not self.nowrap:
+            # the line numbers need the number of lines in advance: get
+            # it from the token source if it can tell (see highlight()),
+            # count it in a sequence, or else in a compact copy of the
+            # tokens, but don't buffer the output
+            if isinstance(tokensource, (list, tuple)):
+                lncount = count_lines(u''.join([v for t, v in tokensource]))
+            else:
+                if not hasattr(tokensource, 'count_lines'):
+                    tokensource = TokenBuffer(tokensource)
+                lncount = tokensource.count_lines()
+
         source = self._format_lines(tokensource)
         if self.hl_lines:
             source = self._highlight_lines(source)
         if not self.nowrap:
             if self.linenos == 2:
-                source = self._wrap_inlinelinenos(source)
+                source = self._wrap_inlinelinenos(source, lncount)
             if self.lineanchors:
                 source = self._wrap_lineanchors(source)
             source = self.wrap(source, outfile)
             if self.linenos == 1:
-                source = self._wrap_tablelinenos(source)
+                source = self._wrap_tablelinenos(source, lncount)
             if self.full:
                 source = self._wrap_full(source, outfile)
 
         for t, piece in source:
             outfile.write(piece)
+
+    def _split_pages(self, tokensource, skip=0):
+        """
+        Split the token stream into pages of `pagelines` lines and yield
+        ``(first, last, tokens)`` for each page after the first `skip`.
+        Tokens crossing a page break are split.
+        """
+        pagelines = self.pagelines
+        if pagelines <= 0:
+            raise ValueError('the pagelines option must be set to split '
+                             'the output into pages')
+        page = []
+        first = 1
+        left = pagelines
+        skipping = skip > 0
+        for ttype, value in tokensource:
+            while value:
+                n = value.count('\n')
+                if n < left:
+                    left -= n
+                    if not skipping:
+                        page.append((ttype, value))
+                    break
+                # the page ends with the left-th newline in this value
+                pos = -1
+                for i in xrange(left):
+                    pos = value.index('\n', pos + 1)
+                if not skipping:
+                    page.append((ttype, value[:pos + 1]))
+                    yield first, first + pagelines - 1, page
+                    page = []
+                first += pagelines
+                left = pagelines
+                skipping = first <= skip * pagelines
+                value = value[pos + 1:]
+        if page:
+            last = first + pagelines - left
+            if page[-1][1][-1:] == '\n':
+                last -= 1
+            yield first, last, page
+
+    def get_range_formatter(self, first):
+        """
+        Return a copy of the formatter with the line numbers, anchors and
+        highlighted lines shifted for formatting the lines from `first` on.
+        """
+        if first == 1:
+            return self
+        fmt = copy.copy(self)
+        fmt.linenostart = self.linenostart + first - 1
+        fmt.hl_lines = set([line - first + 1 for line in self.hl_lines
+                            if line >= first])
+        return fmt
+
+    def _format_page(self, tokens, first):
+        """
+        Format the tokens of the page starting with line `first` into a
+        string, with the line numbers, anchors and highlighted lines of the
+        whole text.
+        """
+        fmt = self.get_range_formatter(first)
+        if self.encoding:
+            outfile = BytesIO()
+        else:
+            outfile = StringIO.StringIO()
+        fmt.format(tokens, outfile)
+        return outfile.getvalue()
+
+    def iter_pages(self, tokensource):
+        """
+        Yield ``(first, last, output)`` for each page of `pagelines` lines.
+        See the class docstring.
+        """
+        for first, last, tokens in self._split_pages(tokensource):
+            yield first, last, self._format_page(tokens, first)
+
+    def get_page(self, tokensource, pageno):
+        """
+        Return the output of page `pageno`, counted from 1.  Raise
+        `ValueError` if there is no such page.
+        """
+        if pageno >= 1:
+            for first, last, tokens in self._split_pages(tokensource,
+                                                         pageno - 1):
+                return self._format_page(tokens, first)
+        raise ValueError('page %d out of range' % pageno)
+
+    def highlight_page(self, code, lexer, pageno):
+        """
+        Like `get_page()`, but lex only page `pageno` of `code`, starting
+        near it like ``pygments.highlight_range()``.
+        """
+        if self.pagelines <= 0:
+            raise ValueError('the pagelines option must be set to split '
+                             'the output into pages')
+        if pageno >= 1:
+            import pygments
+            from pygments.checkpoints import lex_range
+            first = (pageno - 1) * self.pagelines + 1
+            tokens = lex_range(code, lexer, first, first + self.pagelines - 1,
+                               pygments._highlight_cache)
+            if len(tokens):
+                return self._format_page(tokens, first)
+        raise ValueError('page %d out of range' % pageno)
+
+    def format_pages(self, tokensource, filename):
+        """
+        Write each page to a file named like `filename` with the page
+        number added, and an index of the pages to `filename`.  Return the
+        list of page file names.
+        """
+        root, ext = os.path.splitext(filename)
+        encoding = self.encoding or 'utf-8'
+        filenames = []
+        items = []
+        for first, last, output in self.iter_pages(tokensource):
+            pagename = '%s-%d%s' % (root, len(filenames) + 1, ext)
+            if not isinstance(output, bytes):
+                output = output.encode(encoding)
+            f = open(pagename, 'wb')
+            try:
+                f.write(output)
+            finally:
+                f.close()
+            filenames.append(pagename)
+            items.append('<li><a href="%s">Lines %d&ndash;%d</a></li>' %
+                         (escape_html(os.path.basename(pagename)),
+                          first + self.linenostart - 1,
+                          last + self.linenostart - 1))
+        index = PAGES_INDEX % dict(title=escape_html(self.title),
+                                   encoding=encoding,
+                                   pages='\n'.join(items))
+        f = open(filename, 'wb')
+        try:
+            f.write(index.encode(encoding))
+        finally:
+            f.close()
+        return filenames
@@ -10,6 +10,7 @@
 """
 
 import sys
+import copy
 from commands import getstatusoutput
 
 from pygments.formatter import Formatter
@@ -332,6 +333,16 @@ class ImageFormatter(Formatter):
                                     self.style.highlight_color) or '#f90'
         self.drawables = []
 
+    def get_range_formatter(self, first):
+        if first == 1:
+            return self
+        fmt = copy.copy(self)
+        fmt.line_number_start = self.line_number_start + first - 1
+        fmt.hl_lines = [line - first + 1 for line in self.hl_lines
+                        if line >= first]
+        fmt.drawables = []
+        return fmt
+
     def get_style_defs(self, arg=''):
         raise NotImplementedError('The -S option is meaningless for the image '
                                   'formatter. Use -O style=<stylename> instead.')
@@ -418,10 +429,9 @@ class ImageFormatter(Formatter):
         Create drawables for the token content.
         """
         lineno = charno = maxcharno = 0
+        resolve = self.style.resolve_token
         for ttype, value in tokensource:
-            while ttype not in self.styles:
-                ttype = ttype.parent
-            style = self.styles[ttype]
+            style = resolve(ttype)
             # TODO: make sure tab expansion happens earlier in the chain.  It
             # really ought to be done on the input, as to do it right here is
             # quite complex.
@@ -9,6 +9,8 @@
     :license: BSD, see LICENSE for details.
 """
 
+import copy
+
 from pygments.formatter import Formatter
 from pygments.token import Token, STANDARD_TYPES
 from pygments.util import get_bool_opt, get_int_opt, StringIO
@@ -261,6 +263,13 @@ class LatexFormatter(Formatter):
             t2n[ttype] = name
             c2d[name] = cmndef
 
+    def get_range_formatter(self, first):
+        if first == 1:
+            return self
+        fmt = copy.copy(self)
+        fmt.linenostart = self.linenostart + first - 1
+        return fmt
+
     def get_style_defs(self, arg=''):
         """
         Return the command sequences needed to define the commands
@@ -277,6 +286,8 @@ class LatexFormatter(Formatter):
         # TODO: add support for background colors
         t2n = self.ttype2name
         cp = self.commandprefix
+        # the "+"-joined style names per token type
+        stylevals = {}
 
         if self.full:
             realoutfile = outfile
@@ -322,15 +333,19 @@ class LatexFormatter(Formatter):
                     value = escape_tex(value, self.commandprefix)
             else:
                 value = escape_tex(value, self.commandprefix)
-            styles = []
-            while ttype is not Token:
-                try:
-                    styles.append(t2n[ttype])
-                except KeyError:
-                    # not in current style
-                    styles.append(_get_ttype_name(ttype))
-                ttype = ttype.parent
-            styleval = '+'.join(reversed(styles))
+            try:
+                styleval = stylevals[ttype]
+            except KeyError:
+                styles = []
+                node = ttype
+                while node is not Token:
+                    try:
+                        styles.append(t2n[node])
+                    except KeyError:
+                        # not in current style
+                        styles.append(_get_ttype_name(node))
+                    node = node.parent
+                styleval = stylevals[ttype] = '+'.join(reversed(styles))
             if styleval:
                 spl = value.split('\n')
                 for line in spl[:-1]:
@@ -108,25 +108,27 @@ class RtfFormatter(Formatter):
         outfile.write(r'}\f0')
 
         # highlight stream
+        starts = {}
         for ttype, value in tokensource:
-            while not self.style.styles_token(ttype) and ttype.parent:
-                ttype = ttype.parent
-            style = self.style.style_for_token(ttype)
-            buf = []
-            if style['bgcolor']:
-                buf.append(r'\cb%d' % color_mapping[style['bgcolor']])
-            if style['color']:
-                buf.append(r'\cf%d' % color_mapping[style['color']])
-            if style['bold']:
-                buf.append(r'\b')
-            if style['italic']:
-                buf.append(r'\i')
-            if style['underline']:
-                buf.append(r'\ul')
-            if style['border']:
-                buf.append(r'\chbrdr\chcfpat%d' %
-                           color_mapping[style['border']])
-            start = ''.join(buf)
+            try:
+                start = starts[ttype]
+            except KeyError:
+                style = self.style.resolve_token(ttype)
+                buf = []
+                if style['bgcolor']:
+                    buf.append(r'\cb%d' % color_mapping[style['bgcolor']])
+                if style['color']:
+                    buf.append(r'\cf%d' % color_mapping[style['color']])
+                if style['bold']:
+                    buf.append(r'\b')
+                if style['italic']:
+                    buf.append(r'\i')
+                if style['underline']:
+                    buf.append(r'\ul')
+                if style['border']:
+                    buf.append(r'\chbrdr\chcfpat%d' %
+                               color_mapping[style['border']])
+                start = starts[ttype] = ''.join(buf)
             if start:
                 outfile.write('{%s ' % start)
             outfile.write(self._escape_text(value))
@@ -10,20 +10,11 @@
 """
 
 from pygments.formatter import Formatter
-from pygments.util import get_bool_opt, get_int_opt
+from pygments.util import get_bool_opt, get_int_opt, escape_html
 
 __all__ = ['SvgFormatter']
 
 
-def escape_html(text):
-    """Escape &, <, > as well as single and double quotes for HTML."""
-    return text.replace('&', '&amp;').  \
-                replace('<', '&lt;').   \
-                replace('>', '&gt;').   \
-                replace('"', '&quot;'). \
-                replace("'", '&#39;')
-
-
 class2style = {}
 
 class SvgFormatter(Formatter):
@@ -139,10 +130,7 @@ class SvgFormatter(Formatter):
     def _get_style(self, tokentype):
         if tokentype in self._stylecache:
             return self._stylecache[tokentype]
-        otokentype = tokentype
-        while not self.style.styles_token(tokentype):
-            tokentype = tokentype.parent
-        value = self.style.style_for_token(tokentype)
+        value = self.style.resolve_token(tokentype)
         result = ''
         if value['color']:
             result = ' fill="#' + value['color'] + '"'
@@ -150,5 +138,5 @@ class SvgFormatter(Formatter):
             result += ' font-weight="bold"'
         if value['italic']:
             result += ' font-style="italic"'
-        self._stylecache[otokentype] = result
+        self._stylecache[tokentype] = result
         return result
@@ -169,17 +169,19 @@ class Terminal256Formatter(Formatter):
 
     def _setup_styles(self):
         for ttype, ndef in self.style:
-            escape = EscapeSequence()
-            if ndef['color']:
-                escape.fg = self._color_index(ndef['color'])
-            if ndef['bgcolor']:
-                escape.bg = self._color_index(ndef['bgcolor'])
-            if self.usebold and ndef['bold']:
-                escape.bold = True
-            if self.useunderline and ndef['underline']:
-                escape.underline = True
-            self.style_string[str(ttype)] = (escape.color_string(),
-                                             escape.reset_string())
+            self.style_string[str(ttype)] = self._escape_strings(ndef)
+
+    def _escape_strings(self, ndef):
+        escape = EscapeSequence()
+        if ndef['color']:
+            escape.fg = self._color_index(ndef['color'])
+        if ndef['bgcolor']:
+            escape.bg = self._color_index(ndef['bgcolor'])
+        if self.usebold and ndef['bold']:
+            escape.bold = True
+        if self.useunderline and ndef['underline']:
+            escape.underline = True
+        return escape.color_string(), escape.reset_string()
 
     def format(self, tokensource, outfile):
         # hack: if the output is a terminal and has an encoding set,
@@ -190,30 +192,20 @@ class Terminal256Formatter(Formatter):
         return Formatter.format(self, tokensource, outfile)
 
     def format_unencoded(self, tokensource, outfile):
+        escapes = {}
         for ttype, value in tokensource:
-            not_found = True
-            while ttype and not_found:
-                try:
-                    #outfile.write( "<" + str(ttype) + ">" )
-                    on, off = self.style_string[str(ttype)]
-
-                    # Like TerminalFormatter, add "reset colors" escape sequence
-                    # on newline.
-                    spl = value.split('\n')
-                    for line in spl[:-1]:
-                        if line:
-                            outfile.write(on + line + off)
-                        outfile.write('\n')
-                    if spl[-1]:
-                        outfile.write(on + spl[-1] + off)
-
-                    not_found = False
-                    #outfile.write( '#' + str(ttype) + '#' )
-
-                except KeyError:
-                    #ottype = ttype
-                    ttype = ttype[:-1]
-                    #outfile.write( '!' + str(ottype) + '->' + str(ttype) + '!' )
-
-            if not_found:
-                outfile.write(value)
+            try:
+                on, off = escapes[ttype]
+            except KeyError:
+                on, off = escapes[ttype] = \
+                    self._escape_strings(self.style.resolve_token(ttype))
+
+            # Like TerminalFormatter, add "reset colors" escape sequence
+            # on newline.
+            spl = value.split('\n')
+            for line in spl[:-1]:
+                if line:
+                    outfile.write(on + line + off)
+                outfile.write('\n')
+            if spl[-1]:
+                outfile.write(on + spl[-1] + off)
@@ -10,19 +10,23 @@
 """
 import re
 
-from pygments.filter import apply_filters, Filter
-from pygments.filters import get_filter_by_name
+from pygments.filter import apply_filters, Filter, FunctionFilter
+from pygments.regexopt import regex_opt
 from pygments.token import Error, Text, Other, _TokenType
 from pygments.util import get_bool_opt, get_int_opt, get_list_opt, \
-     make_analysator
+     make_analysator, cache_key, SpanError
 
 
 __all__ = ['Lexer', 'RegexLexer', 'ExtendedRegexLexer', 'DelegatingLexer',
-           'LexerContext', 'include', 'bygroups', 'using', 'this']
+           'LexerContext', 'include', 'bygroups', 'using', 'this',
+           'builtin_names', 'words']
 
 
 _default_analyse = staticmethod(lambda x: 0.0)
 
+#: sets built by builtin_names()
+_builtin_names = {}
+
 
 class LexerMeta(type):
     """
@@ -75,6 +79,23 @@ class Lexer(object):
     #: mime types
     mimetypes = []
 
+    #: regular expression that must be found in a text (with ``re.search``)
+    #: for `analyse_text` to return anything but `analyse_default`; it lets
+    #: ``guess_lexer`` skip loading the lexer for most texts
+    analyse_hint = None
+
+    #: what `analyse_text` returns for texts without `analyse_hint`
+    analyse_default = 0.0
+
+    #: number of characters from the start of a text that `analyse_text`
+    #: needs to see, if that is more than the analysis window (see
+    #: ``pygments.lexers.set_analysis_window()``)
+    analyse_window = 0
+
+    #: set for instances shared through a ``pygments.lexers.LexerPool``,
+    #: which must not be changed
+    _shared = False
+
     __metaclass__ = LexerMeta
 
     def __init__(self, **options):
@@ -100,10 +121,34 @@ class Lexer(object):
         """
         Add a new stream filter to this lexer.
         """
+        if self._shared:
+            raise TypeError('cannot add a filter to a shared lexer, pass '
+                            'the "filters" option to the LexerPool instead')
         if not isinstance(filter_, Filter):
+            # imported here so that lexing without filters doesn't need it
+            from pygments.filters import get_filter_by_name
             filter_ = get_filter_by_name(filter_, **options)
         self.filters.append(filter_)
 
+    def get_cache_key(self):
+        """
+        Return a string that identifies the lexer class, its options,
+        encoding and filters and is the same in every process, or None if
+        an option or class has no stable representation (see
+        ``pygments.util.cache_key``) or a filter is made with
+        ``simplefilter``.  Used by ``pygments.cache``.
+        """
+        parts = [cache_key(self.__class__, self.options, ('filters',)),
+                 repr(self.encoding)]
+        for filter_ in self.filters:
+            if isinstance(filter_, FunctionFilter):
+                # the key would not tell the functions apart
+                return None
+            parts.append(cache_key(filter_.__class__, filter_.options))
+        if None in parts:
+            return None
+        return '|'.join(parts)
+
     def analyse_text(text):
         """
         Has to return a float between ``0`` and ``1`` that indicates
@@ -127,6 +172,24 @@ class Lexer(object):
         Also preprocess the text, i.e. expand tabs and strip it if
         wanted and applies registered filters.
         """
+        text = self.preprocess_text(text)
+
+        def streamer():
+            for i, t, v in self.get_tokens_unprocessed(text):
+                yield t, v
+        stream = streamer()
+        if not unfiltered:
+            stream = apply_filters(stream, self.filters, self)
+        return stream
+
+    def preprocess_text(self, text):
+        """
+        Return `text` as the lexer sees it: decoded to Unicode, with
+        normalized newlines, and stripped, tab-expanded and terminated
+        with a newline according to the lexer options.  `get_tokens()`
+        lexes the result of this method; preprocessing it again doesn't
+        change it.
+        """
         if not isinstance(text, unicode):
             if self.encoding == 'guess':
                 try:
@@ -157,14 +220,7 @@ class Lexer(object):
             text = text.expandtabs(self.tabsize)
         if self.ensurenl and not text.endswith('\n'):
             text += '\n'
-
-        def streamer():
-            for i, t, v in self.get_tokens_unprocessed(text):
-                yield t, v
-        stream = streamer()
-        if not unfiltered:
-            stream = apply_filters(stream, self.filters, self)
-        return stream
+        return text
 
     def get_tokens_unprocessed(self, text):
         """
@@ -174,6 +230,57 @@ class Lexer(object):
         """
         raise NotImplementedError
 
+    def get_spans_unprocessed(self, text):
+        """
+        Return an iterable of ``(start, end, tokentype)`` triples, where
+        ``text[start:end]`` is the token value.  Unlike
+        `get_tokens_unprocessed()`, lexers that support it natively (like
+        `RegexLexer`) don't create a string for every token.
+
+        This implementation adapts `get_tokens_unprocessed()`.  Filters
+        are not applied.  If a token value is not the next slice of `text`
+        (the lexer doesn't reproduce its input), `SpanError` is raised.
+        """
+        return _spans_from_tokens(self.get_tokens_unprocessed(text), text)
+
+
+def _spans_from_tokens(tokens, text):
+    """
+    Convert ``(index, tokentype, value)`` tuples to ``(start, end,
+    tokentype)``.  The values must be consecutive slices of `text`, else
+    `SpanError` is raised.  The offsets follow from the value lengths,
+    since not every lexer yields exact indices.
+    """
+    pos = 0
+    for i, t, v in tokens:
+        if not text.startswith(v, pos):
+            raise SpanError('token %r is not the text at offset %d' % (v, pos))
+        end = pos + len(v)
+        yield pos, end, t
+        pos = end
+
+
+def _defining_class(obj, name):
+    """
+    Return the class in the MRO of `obj`'s class that defines `name`.
+    """
+    for cls in type(obj).__mro__:
+        if name in cls.__dict__:
+            return cls
+
+
+def _uses_regex_loop(lexer):
+    """
+    Return True if `lexer` is a `RegexLexer` that lexes with the main loop
+    of `RegexLexer` itself, without post-processing the tokens.  Its
+    spans come straight from the regex matches, its token values are the
+    preprocessed text (unless a callback changes them), and it can resume
+    lexing at any line start given the state stack there.
+    """
+    return isinstance(lexer, RegexLexer) and \
+           _defining_class(lexer, 'get_tokens_unprocessed') is RegexLexer and \
+           _defining_class(lexer, 'get_tokens') is Lexer
+
 
 class DelegatingLexer(Lexer):
     """
@@ -234,6 +341,24 @@ class combined(tuple):
         pass
 
 
+class words(object):
+    """
+    Indicates a list of literal words that is transformed into an optimized
+    regex that matches any of them (see `pygments.regexopt`), when the
+    token definitions are processed.
+
+    *New in Pygments 1.4.*
+    """
+
+    def __init__(self, words, prefix='', suffix=''):
+        self.words = words
+        self.prefix = prefix
+        self.suffix = suffix
+
+    def get(self):
+        return regex_opt(self.words, prefix=self.prefix, suffix=self.suffix)
+
+
 class _PseudoMatch(object):
     """
     A pseudo match object constructed from a string.
@@ -285,6 +410,38 @@ def bygroups(*args):
     return callback
 
 
+def builtin_names(module, table, disabled=()):
+    """
+    Return a frozenset of the names in `table` of the module
+    ``pygments.lexers.<module>``.  A table is a list of names or a string of
+    whitespace separated names (which is faster to load), or a dict mapping
+    categories to such lists or strings; the categories in `disabled` are
+    left out.
+
+    The set is only built once per process for the same arguments, so
+    that lexer instances can share it.
+    """
+    key = module, table, frozenset(disabled)
+    try:
+        return _builtin_names[key]
+    except KeyError:
+        pass
+    mod = __import__('pygments.lexers.' + module, None, None, [table])
+    value = getattr(mod, table)
+    if isinstance(value, dict):
+        parts = [names for category, names in value.iteritems()
+                 if category not in disabled]
+    else:
+        parts = [value]
+    result = set()
+    for names in parts:
+        if isinstance(names, basestring):
+            names = names.split()
+        result.update(names)
+    result = _builtin_names[key] = frozenset(result)
+    return result
+
+
 class _This(object):
     """
     Special singleton used for indicating the caller class.
@@ -365,11 +522,14 @@ class RegexLexerMeta(LexerMeta):
 
             assert type(tdef) is tuple, "wrong rule def %r" % tdef
 
+            regex = tdef[0]
+            if isinstance(regex, words):
+                regex = regex.get()
             try:
-                rex = re.compile(tdef[0], rflags).match
+                rex = re.compile(regex, rflags).match
             except Exception, err:
                 raise ValueError("uncompilable regex %r in state %r of %r: %s" %
-                                 (tdef[0], state, cls, err))
+                                 (regex, state, cls, err))
 
             assert type(tdef[1]) is _TokenType or callable(tdef[1]), \
                    'token type must be simple type or callable, not %r' % (tdef[1],)
@@ -470,7 +630,34 @@ class RegexLexer(Lexer):
 
         ``stack`` is the inital stack (default: ``['root']``)
         """
-        pos = 0
+        return self._lex(text, stack, 0, False)
+
+    def get_spans_unprocessed(self, text, stack=('root',)):
+        """
+        Like `get_tokens_unprocessed()`, but yield ``(start, end,
+        tokentype)`` triples without slicing the token values out of
+        `text`.
+        """
+        if not _uses_regex_loop(self):
+            # the lexer post-processes the token stream, use that
+            if stack == ('root',):
+                tokens = self.get_tokens_unprocessed(text)
+            else:
+                tokens = self.get_tokens_unprocessed(text, stack)
+            return _spans_from_tokens(tokens, text)
+        return self._lex(text, stack, 0, True)
+
+    def _lex(self, text, stack, pos, spans, index=None):
+        """
+        The main loop: lex `text` from offset `pos` on, starting with the
+        state `stack`.  Yield ``(start, end, tokentype)`` spans if `spans`
+        is true, ``(index, tokentype, value)`` tokens otherwise.
+
+        Spans of callbacks are taken from the indices they yield, which
+        must be consecutive and cover the match, else `SpanError` is
+        raised.  If `index` (a ``pygments.checkpoints.CheckpointIndex``)
+        is given, the states at line starts are added to it.
+        """
         tokendefs = self._tokens
         statestack = list(stack)
         statetokens = tokendefs[statestack[-1]]
@@ -479,7 +666,27 @@ class RegexLexer(Lexer):
                 m = rexmatch(text, pos)
                 if m:
                     if type(action) is _TokenType:
-                        yield pos, action, m.group()
+                        if spans:
+                            yield pos, m.end(), action
+                        else:
+                            yield pos, action, m.group()
+                    elif spans:
+                        end = pos
+                        for i, t, v in action(self, m):
+                            if not v:
+                                # some callbacks don't give empty values
+                                # a proper index
+                                yield end, end, t
+                                continue
+                            if i != end or not text.startswith(v, i):
+                                raise SpanError('callback token %r at %d '
+                                                'is not the text at %d' %
+                                                (v, i, end))
+                            end = i + len(v)
+                            yield i, end, t
+                        if end != m.end():
+                            raise SpanError('callback tokens end at %d '
+                                            'instead of %d' % (end, m.end()))
                     else:
                         for item in action(self, m):
                             yield item
@@ -502,17 +709,28 @@ class RegexLexer(Lexer):
                         else:
                             assert False, "wrong state def: %r" % new_state
                         statetokens = tokendefs[statestack[-1]]
+                    if index is not None and pos >= index.next_offset and \
+                       text[pos - 1] == '\n':
+                        index.add(text, pos, statestack)
                     break
             else:
                 try:
                     if text[pos] == '\n':
                         # at EOL, reset state to "root"
-                        pos += 1
                         statestack = ['root']
                         statetokens = tokendefs['root']
-                        yield pos, Text, u'\n'
+                        if spans:
+                            yield pos, pos + 1, Text
+                        else:
+                            yield pos, Text, u'\n'
+                        pos += 1
+                        if index is not None and pos >= index.next_offset:
+                            index.add(text, pos, statestack)
                         continue
-                    yield pos, Error, text[pos]
+                    if spans:
+                        yield pos, pos + 1, Error
+                    else:
+                        yield pos, Error, text[pos]
                     pos += 1
                 except IndexError:
                     break
@@ -585,10 +803,10 @@ class ExtendedRegexLexer(RegexLexer):
                         break
                     if text[ctx.pos] == '\n':
                         # at EOL, reset state to "root"
-                        ctx.pos += 1
                         ctx.stack = ['root']
                         statetokens = tokendefs['root']
                         yield ctx.pos, Text, u'\n'
+                        ctx.pos += 1
                         continue
                     yield ctx.pos, Error, text[ctx.pos]
                     ctx.pos += 1
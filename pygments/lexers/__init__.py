@@ -9,21 +9,37 @@
     :license: BSD, see LICENSE for details.
 """
 
+import re
 import sys
 import types
-import fnmatch
 from os.path import basename
 
-from pygments.lexers._mapping import LEXERS
-from pygments.plugin import find_plugin_lexers
-from pygments.util import ClassNotFound, bytes
+from pygments.lexers._mapping import LEXERS, ANALYSERS
+from pygments.plugin import find_plugin_lexers, on_refresh
+from pygments.util import ClassNotFound, FilenameIndex, bytes
 
 
 __all__ = ['get_lexer_by_name', 'get_lexer_for_filename', 'find_lexer_class',
-           'guess_lexer'] + LEXERS.keys()
+           'guess_lexer', 'set_analysis_window', 'set_guess_classifier',
+           'LexerPool'] + LEXERS.keys()
 
 _lexer_cache = {}
 
+#: lookup tables built by _get_index(): the lexer names, aliases and
+#: mimetypes, each mapped to a `LEXERS` entry, and a `FilenameIndex` of the
+#: filename patterns; the same for the plugin lexers (with ``plugin_``
+#: prefixed keys); the list of plugin lexer classes, the alias filename
+#: patterns and the analysis hints of the builtin lexers
+_index = {}
+on_refresh(_index.clear)
+
+#: the head and tail sizes of the analysis window
+_analysis_window = [1 << 20, 0]
+
+#: the classifier used by guess_lexer() (or the name of its model file)
+#: and the number of candidates it selects
+_classifier = [None, 5]
+
 
 def _load_lexers(module_name):
     """
@@ -35,6 +51,175 @@ def _load_lexers(module_name):
         _lexer_cache[cls.name] = cls
 
 
+def _build_tables(lexers):
+    """
+    Return the lookup tables for an iterable of ``(entry, name, aliases,
+    filenames, mimetypes)``.  Of several lexers with the same alias or
+    mimetype the first wins, like in a linear search.
+    """
+    names = {}
+    aliases = {}
+    mimetypes = {}
+    filenames = FilenameIndex()
+    for entry, name, lexer_aliases, lexer_filenames, lexer_mimetypes \
+            in lexers:
+        filenames.add(entry, lexer_filenames)
+        if name not in names:
+            names[name] = entry
+        for alias in lexer_aliases:
+            if alias not in aliases:
+                aliases[alias] = entry
+        for mimetype in lexer_mimetypes:
+            if mimetype not in mimetypes:
+                mimetypes[mimetype] = entry
+    return {'name': names, 'alias': aliases, 'mimetype': mimetypes,
+            'filename': filenames}
+
+
+def _get_index(key):
+    """
+    Return one of the lookup tables, building it on first use.  The plugin
+    entry points are only scanned when a plugin table is needed.
+    """
+    if key in _index:
+        return _index[key]
+    if key in ('name', 'alias', 'mimetype', 'filename'):
+        _index.update(_build_tables([(entry,) + entry[1:]
+                                     for entry in LEXERS.itervalues()]))
+    elif key.startswith('plugin'):
+        plugins = list(find_plugin_lexers())
+        tables = _build_tables([(cls, cls.name, cls.aliases, cls.filenames,
+                                 cls.mimetypes) for cls in plugins])
+        for table, value in tables.iteritems():
+            _index['plugin_' + table] = value
+        _index['plugins'] = plugins
+    elif key == 'analysers':
+        analysers = {}
+        for lexer_name, (hint, default, window) in ANALYSERS.iteritems():
+            if hint is not None:
+                hint = re.compile(hint).search
+            analysers[lexer_name] = hint, default, window
+        _index[key] = analysers
+    elif key == 'alias_filename':
+        # alias filenames are not in the mapping, this loads all lexers
+        alias_filenames = FilenameIndex()
+        for cls in _iter_lexerclasses():
+            alias_filenames.add(cls, cls.alias_filenames)
+        _index[key] = alias_filenames
+    return _index[key]
+
+
+def _lookup(table, key):
+    """
+    Return the index entry for `key` in `table`; builtin lexers take
+    precedence over plugins.
+    """
+    entry = _get_index(table).get(key)
+    if entry is None:
+        entry = _get_index('plugin_' + table).get(key)
+    return entry
+
+
+def _match_filename(fn):
+    """
+    Return the index entries whose filename patterns match `fn`.
+    """
+    return _get_index('filename').match(fn) + \
+           _get_index('plugin_filename').match(fn)
+
+
+def _get_lexer_class(entry):
+    """
+    Return the lexer class for an index entry.
+    """
+    if type(entry) is tuple:
+        if entry[1] not in _lexer_cache:
+            _load_lexers(entry[0])
+        return _lexer_cache[entry[1]]
+    return entry
+
+
+def set_analysis_window(head, tail=0):
+    """
+    Set how much of a text the ``analyse_text()`` methods of lexers see
+    when a lexer is guessed: the first `head` and the last `tail`
+    characters.  If `head` is None, they see the whole text.  Lexers can
+    ask for a larger head with their ``analyse_window`` attribute.
+
+    Return the previous ``(head, tail)``.  The default is a head of 1 MiB
+    and no tail.
+    """
+    old = tuple(_analysis_window)
+    _analysis_window[:] = [head, tail]
+    return old
+
+
+def set_guess_classifier(classifier, candidates=5):
+    """
+    Make `guess_lexer()` rank the lexers with `classifier`, a
+    `pygments.classifier.NgramClassifier` or the file name of a model
+    (which is loaded on first use).  Only the best `candidates` lexers are
+    asked to analyse the text; if none of them is sure, the best ranked
+    lexer is used.  Pass None to go back to asking all lexers.
+    """
+    _classifier[:] = [classifier, candidates]
+
+
+def _guess_with_classifier(text, options):
+    """
+    Guess a lexer with the classifier.  If one of the best ranked lexers
+    is sure about the text (its ``analyse_text()`` returns 1.0), it is
+    used, else the best ranked one.  Return None if nothing is ranked.
+    """
+    classifier, candidates = _classifier
+    if isinstance(classifier, basestring):
+        from pygments.classifier import NgramClassifier
+        f = open(classifier)
+        try:
+            classifier = _classifier[0] = NgramClassifier.load(f)
+        finally:
+            f.close()
+    # the weaker ratings of analyse_text() are less reliable than the
+    # ranking, they made the guesses worse in scripts/benchmark.py
+    best = None
+    samples = {}
+    for score, name in classifier.rank(text)[:candidates]:
+        lexer = find_lexer_class(name)
+        if lexer is None:
+            continue
+        if best is None:
+            best = lexer
+        rv = lexer.analyse_text(_analysis_text(text, lexer.analyse_window,
+                                               samples))
+        if rv == 1.0:
+            return lexer(**options)
+    if best is None:
+        return None
+    return best(**options)
+
+
+def _analysis_text(text, window, samples):
+    """
+    Return the part of `text` that a lexer with the given `window` analyses.
+    `samples` caches the slices of `text` by head size.
+    """
+    head, tail = _analysis_window
+    if head is None:
+        return text
+    head = max(head, window)
+    if len(text) <= head + tail:
+        return text
+    if head not in samples:
+        sample = text[:head]
+        if tail:
+            # start the tail at a line boundary
+            start = text.find('\n', len(text) - tail)
+            if start != -1:
+                sample += text[start:]
+        samples[head] = sample
+    return samples[head]
+
+
 def get_all_lexers():
     """
     Return a generator of tuples in the form ``(name, aliases,
@@ -42,7 +227,7 @@ def get_all_lexers():
     """
     for item in LEXERS.itervalues():
         yield item[1:]
-    for lexer in find_plugin_lexers():
+    for lexer in _get_index('plugins'):
         yield lexer.name, lexer.aliases, lexer.filenames, lexer.mimetypes
 
 
@@ -52,32 +237,19 @@ def find_lexer_class(name):
     """
     if name in _lexer_cache:
         return _lexer_cache[name]
-    # lookup builtin lexers
-    for module_name, lname, aliases, _, _ in LEXERS.itervalues():
-        if name == lname:
-            _load_lexers(module_name)
-            return _lexer_cache[name]
-    # continue with lexers from setuptools entrypoints
-    for cls in find_plugin_lexers():
-        if cls.name == name:
-            return cls
+    entry = _lookup('name', name)
+    if entry is not None:
+        return _get_lexer_class(entry)
 
 
 def get_lexer_by_name(_alias, **options):
     """
     Get a lexer by an alias.
     """
-    # lookup builtin lexers
-    for module_name, name, aliases, _, _ in LEXERS.itervalues():
-        if _alias in aliases:
-            if name not in _lexer_cache:
-                _load_lexers(module_name)
-            return _lexer_cache[name](**options)
-    # continue with lexers from setuptools entrypoints
-    for cls in find_plugin_lexers():
-        if _alias in cls.aliases:
-            return cls(**options)
-    raise ClassNotFound('no lexer for alias %r found' % _alias)
+    entry = _lookup('alias', _alias)
+    if entry is None:
+        raise ClassNotFound('no lexer for alias %r found' % _alias)
+    return _get_lexer_class(entry)(**options)
 
 
 def get_lexer_for_filename(_fn, code=None, **options):
@@ -86,29 +258,22 @@ def get_lexer_for_filename(_fn, code=None, **options):
     pattern, use ``analyze_text()`` to figure out which one is more
     appropriate.
     """
-    matches = []
     fn = basename(_fn)
-    for modname, name, _, filenames, _ in LEXERS.itervalues():
-        for filename in filenames:
-            if fnmatch.fnmatch(fn, filename):
-                if name not in _lexer_cache:
-                    _load_lexers(modname)
-                matches.append(_lexer_cache[name])
-    for cls in find_plugin_lexers():
-        for filename in cls.filenames:
-            if fnmatch.fnmatch(fn, filename):
-                matches.append(cls)
+    matches = [_get_lexer_class(entry)
+               for entry in _match_filename(fn)]
 
     if sys.version_info > (3,) and isinstance(code, bytes):
         # decode it, since all analyse_text functions expect unicode
         code = code.decode('latin1')
 
+    samples = {}
     def get_rating(cls):
         # The class _always_ defines analyse_text because it's included in
         # the Lexer class.  The default implementation returns None which
         # gets turned into 0.0.  Run scripts/detect_missing_analyse_text.py
         # to find lexers which need it overridden.
-        d = cls.analyse_text(code)
+        d = cls.analyse_text(_analysis_text(code, cls.analyse_window,
+                                            samples))
         #print "Got %r from %r" % (d, cls)
         return d
 
@@ -124,15 +289,10 @@ def get_lexer_for_mimetype(_mime, **options):
     """
     Get a lexer for a mimetype.
     """
-    for modname, name, _, _, mimetypes in LEXERS.itervalues():
-        if _mime in mimetypes:
-            if name not in _lexer_cache:
-                _load_lexers(modname)
-            return _lexer_cache[name](**options)
-    for cls in find_plugin_lexers():
-        if _mime in cls.mimetypes:
-            return cls(**options)
-    raise ClassNotFound('no lexer for mimetype %r found' % _mime)
+    entry = _lookup('mimetype', _mime)
+    if entry is None:
+        raise ClassNotFound('no lexer for mimetype %r found' % _mime)
+    return _get_lexer_class(entry)(**options)
 
 
 def _iter_lexerclasses():
@@ -143,7 +303,7 @@ def _iter_lexerclasses():
         if name not in _lexer_cache:
             _load_lexers(module_name)
         yield _lexer_cache[name]
-    for lexer in find_plugin_lexers():
+    for lexer in _get_index('plugins'):
         yield lexer
 
 
@@ -166,21 +326,20 @@ def guess_lexer_for_filename(_fn, _text, **options):
     fn = basename(_fn)
     primary = None
     matching_lexers = set()
-    for lexer in _iter_lexerclasses():
-        for filename in lexer.filenames:
-            if fnmatch.fnmatch(fn, filename):
-                matching_lexers.add(lexer)
-                primary = lexer
-        for filename in lexer.alias_filenames:
-            if fnmatch.fnmatch(fn, filename):
-                matching_lexers.add(lexer)
+    for entry in _match_filename(fn):
+        primary = _get_lexer_class(entry)
+        matching_lexers.add(primary)
+    for lexer in _get_index('alias_filename').match(fn):
+        matching_lexers.add(lexer)
     if not matching_lexers:
         raise ClassNotFound('no lexer for filename %r found' % fn)
     if len(matching_lexers) == 1:
         return matching_lexers.pop()(**options)
     result = []
+    samples = {}
     for lexer in matching_lexers:
-        rv = lexer.analyse_text(_text)
+        rv = lexer.analyse_text(_analysis_text(_text, lexer.analyse_window,
+                                               samples))
         if rv == 1.0:
             return lexer(**options)
         result.append((rv, lexer))
@@ -194,16 +353,101 @@ def guess_lexer(_text, **options):
     """
     Guess a lexer by strong distinctions in the text (eg, shebang).
     """
+    if _classifier[0] is not None:
+        lexer = _guess_with_classifier(_text, options)
+        if lexer is not None:
+            return lexer
+    # The analysis hints recorded in the mapping tell which builtin lexers
+    # can rate the text with something else than their default, only those
+    # are loaded.  The result is the same as calling analyse_text() of
+    # every lexer class in turn.
+    analysers = _get_index('analysers')
     best_lexer = [0.0, None]
-    for lexer in _iter_lexerclasses():
-        rv = lexer.analyse_text(_text)
+    samples = {}
+    for lexer_name, entry in LEXERS.iteritems():
+        if lexer_name not in analysers:
+            continue
+        hint, rv, window = analysers[lexer_name]
+        text = _analysis_text(_text, window, samples)
+        if hint is None or hint(text):
+            entry = _get_lexer_class(entry)
+            rv = entry.analyse_text(text)
+            if rv == 1.0:
+                return entry(**options)
+        if rv > best_lexer[0]:
+            best_lexer[:] = (rv, entry)
+    for lexer in _get_index('plugins'):
+        rv = lexer.analyse_text(_analysis_text(_text, lexer.analyse_window,
+                                               samples))
         if rv == 1.0:
             return lexer(**options)
         if rv > best_lexer[0]:
             best_lexer[:] = (rv, lexer)
     if not best_lexer[0] or best_lexer[1] is None:
         raise ClassNotFound('no lexer matching the text found')
-    return best_lexer[1](**options)
+    return _get_lexer_class(best_lexer[1])(**options)
+
+
+def _freeze(value):
+    """
+    Return a hashable equivalent of an option value.
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple([_freeze(item) for item in value])
+    if isinstance(value, dict):
+        items = [(key, _freeze(item)) for key, item in value.iteritems()]
+        items.sort()
+        return tuple(items)
+    return value
+
+
+class LexerPool(object):
+    """
+    A cache of lexer instances.  Asking for the same lexer class with the
+    same options returns the same instance, so that the options are parsed
+    and the lexer is initialized only once.
+
+    Lexers keep the state of lexing a text in the token generator, so the
+    instances can be used by several threads at the same time.  They can
+    not be changed though: to use filters, pass them with the ``filters``
+    option, ``add_filter()`` raises a `TypeError`.
+
+    *New in Pygments 1.4.*
+    """
+
+    def __init__(self):
+        self._lexers = {}
+
+    def get_lexer(self, cls, **options):
+        """
+        Return the shared instance of the lexer class `cls` with `options`.
+        If an option value can't be hashed, return a new instance.
+        """
+        try:
+            key = cls, _freeze(options)
+            lexer = self._lexers.get(key)
+        except TypeError:
+            return cls(**options)
+        if lexer is None:
+            lexer = cls(**options)
+            lexer._shared = True
+            self._lexers[key] = lexer
+        return lexer
+
+    def get_lexer_by_name(self, _alias, **options):
+        """
+        Like ``get_lexer_by_name()``, but return a shared instance.
+        """
+        entry = _lookup('alias', _alias)
+        if entry is None:
+            raise ClassNotFound('no lexer for alias %r found' % _alias)
+        return self.get_lexer(_get_lexer_class(entry), **options)
+
+    def clear(self):
+        """
+        Forget all shared instances.
+        """
+        self._lexers.clear()
 
 
 class _automodule(types.ModuleType):
@@ -7,7 +7,7 @@
     you change something on a builtin lexer defintion, run this script from
     the lexers folder to update it.
 
-    Do not alter the LEXERS dictionary by hand.
+    Do not alter the LEXERS and ANALYSERS dictionaries by hand.
 
     :copyright: Copyright 2006-2010 by the Pygments team, see AUTHORS.
     :license: BSD, see LICENSE for details.
@@ -194,13 +194,89 @@ LEXERS = {
     'YamlLexer': ('pygments.lexers.text', 'YAML', ('yaml',), ('*.yaml', '*.yml'), ('text/x-yaml',))
 }
 
+# lexers with their own analyse_text(), mapped to its analyse_hint,
+# analyse_default and analyse_window
+ANALYSERS = {
+    'ActionScript3Lexer': ('\\A\\w+\\s*:\\s*\\w', 0.1, 0),
+    'ActionScriptLexer': ('(?!)', 0.05, 0),
+    'AntlrActionScriptLexer': ('grammar', 0.0, 0),
+    'AntlrCSharpLexer': ('grammar', 0.0, 0),
+    'AntlrCppLexer': ('grammar', 0.0, 0),
+    'AntlrJavaLexer': ('grammar', 0.0, 0),
+    'AntlrLexer': ('grammar', 0.0, 0),
+    'AntlrObjectiveCLexer': ('grammar', 0.0, 0),
+    'AntlrPerlLexer': ('grammar', 0.0, 0),
+    'AntlrPythonLexer': ('grammar', 0.0, 0),
+    'AntlrRubyLexer': ('grammar', 0.0, 0),
+    'BashLexer': ('\\A#!', 0.0, 0),
+    'CSharpAspxLexer': ('(?i)language', 0.001, 0),
+    'CssDjangoLexer': ('\\{[%{]', 0.0, 0),
+    'CssErbLexer': ('<%', 0.0, 0),
+    'CssGenshiLexer': ('\\$\\{|py:|<', 0.0, 0),
+    'CssPhpLexer': ('<\\?|\\?>', 0.0, 0),
+    'CssSmartyLexer': ('\\{', 0.0, 0),
+    'DiffLexer': ('\\A(Index: |diff |--- )', 0.0, 0),
+    'DjangoLexer': ('\\{[%{]', 0.0, 0),
+    'ErbLexer': ('<%', 0.0, 0),
+    'GasLexer': ('\\A\\.\\w', 0.0, 0),
+    'GenshiLexer': ('\\$\\{|py:|<', 0.0, 0),
+    'GroffLexer': ('\\A\\.', 0.0, 0),
+    'HaxeLexer': ('\\A\\w+\\s*:\\s*\\w', 0.0, 0),
+    'HtmlDjangoLexer': ('\\{[%{]|<!DOCTYPE', 0.0, 0),
+    'HtmlGenshiLexer': ('\\$\\{|py:|<!DOCTYPE', 0.0, 0),
+    'HtmlLexer': ('<!DOCTYPE', 0.0, 0),
+    'HtmlPhpLexer': ('<\\?|\\?>|<!DOCTYPE', 0.0, 0),
+    'HtmlSmartyLexer': ('\\{|<!DOCTYPE', 0.0, 0),
+    'IniLexer': ('\\A\\[', 0.0, 0),
+    'JavascriptDjangoLexer': ('\\{[%{]', 0.0, 0),
+    'JavascriptErbLexer': ('<%', 0.0, 0),
+    'JavascriptGenshiLexer': ('\\$\\{|py:|<', 0.0, 0),
+    'JavascriptPhpLexer': ('<\\?|\\?>', 0.0, 0),
+    'JavascriptSmartyLexer': ('\\{', 0.0, 0),
+    'JspLexer': ('<', 0.0, 0),
+    'LogtalkLexer': (':- ', 0.0, 0),
+    'MatlabLexer': ('\\A\\s*%|\\A!\\w', 0.1, 0),
+    'NumPyLexer': ('\\A#!', 0.0, 0),
+    'ObjectiveCLexer': ('@"|\\A\\[', 0.0, 0),
+    'ObjectiveJLexer': ('@import', 0.0, 0),
+    'PerlLexer': ('\\A#!|my \\$', 0.1, 0),
+    'PhpLexer': ('<\\?|\\?>', 0.0, 0),
+    'PrologLexer': (':-', 0.0, 0),
+    'Python3Lexer': ('\\A#!', 0.0, 0),
+    'PythonLexer': ('\\A#!', 0.0, 0),
+    'RagelCLexer': ('@LANG: ', 0.0, 0),
+    'RagelCppLexer': ('@LANG: ', 0.0, 0),
+    'RagelDLexer': ('@LANG: ', 0.0, 0),
+    'RagelEmbeddedLexer': ('@LANG: indep', 0.1, 0),
+    'RagelJavaLexer': ('@LANG: ', 0.0, 0),
+    'RagelObjectiveCLexer': ('@LANG: ', 0.0, 0),
+    'RagelRubyLexer': ('@LANG: ', 0.0, 0),
+    'RhtmlLexer': ('<%|<!DOCTYPE', 0.0, 0),
+    'RstLexer': ('\\A\\.\\.|\\n[-=]', 0.0, 0),
+    'RubyLexer': ('\\A#!', 0.0, 0),
+    'SLexer': ('<-', 0.0, 0),
+    'SmartyLexer': ('\\{', 0.0, 0),
+    'SourcesListLexer': ('(?u)\\A\\s*(#|deb(-src)? |$)', 0.0, 0),
+    'TclLexer': ('\\A#!', 0.0, 0),
+    'TexLexer': ('\\A\\\\(documentclass|input|documentstyle|relax)', 0.0, 0),
+    'VbNetAspxLexer': ('(?i)language', 0.0, 0),
+    'XmlDjangoLexer': ('\\{[%{]|<', 0.0, 0),
+    'XmlErbLexer': ('<', 0.0, 0),
+    'XmlLexer': ('<', 0.0, 0),
+    'XmlPhpLexer': ('\\?>|<', 0.0, 0),
+    'XmlSmartyLexer': ('\\{|<', 0.0, 0),
+    'XsltLexer': ('<xsl', 0.0, 0)
+}
+
 if __name__ == '__main__':
     import sys
     import os
 
     # lookup lexers
     found_lexers = []
+    found_analysers = []
     sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+    from pygments.lexer import Lexer
     for filename in os.listdir('.'):
         if filename.endswith('.py') and not filename.startswith('_'):
             module_name = 'pygments.lexers.%s' % filename[:-3]
@@ -215,8 +291,19 @@ if __name__ == '__main__':
                                  tuple(lexer.aliases),
                                  tuple(lexer.filenames),
                                  tuple(lexer.mimetypes))))
+                # record the hints of the class defining analyse_text()
+                for cls in lexer.__mro__:
+                    if 'analyse_text' in cls.__dict__:
+                        break
+                if cls is not Lexer:
+                    found_analysers.append(
+                        '%r: %r' % (lexer_name,
+                                    (cls.__dict__.get('analyse_hint'),
+                                     cls.__dict__.get('analyse_default', 0.0),
+                                     lexer.analyse_window)))
     # sort them, that should make the diff files for svn smaller
     found_lexers.sort()
+    found_analysers.sort()
 
     # extract useful sourcecode from this file
     f = open(__file__)
@@ -231,5 +318,8 @@ if __name__ == '__main__':
     f = open(__file__, 'w')
     f.write(header)
     f.write('LEXERS = {\n    %s\n}\n\n' % ',\n    '.join(found_lexers))
+    f.write('# lexers with their own analyse_text(), mapped to its analyse_hint,\n'
+            '# analyse_default and analyse_window\n')
+    f.write('ANALYSERS = {\n    %s\n}\n\n' % ',\n    '.join(found_analysers))
     f.write(footer)
     f.close()
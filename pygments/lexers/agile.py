@@ -12,7 +12,8 @@
 import re
 
 from pygments.lexer import Lexer, RegexLexer, ExtendedRegexLexer, \
-     LexerContext, include, combined, do_insertions, bygroups, using
+     LexerContext, include, combined, do_insertions, bygroups, using, \
+     builtin_names, words
 from pygments.token import Error, Text, Other, \
      Comment, Operator, Keyword, Name, String, Number, Generic, Punctuation
 from pygments.util import get_bool_opt, get_list_opt, shebang_matches
@@ -76,30 +77,41 @@ class PythonLexer(RegexLexer):
              r'return|try|while|yield|as|with)\b', Keyword),
         ],
         'builtins': [
-            (r'(?<!\.)(__import__|abs|all|any|apply|basestring|bin|bool|buffer|'
-             r'bytearray|bytes|callable|chr|classmethod|cmp|coerce|compile|'
-             r'complex|delattr|dict|dir|divmod|enumerate|eval|execfile|exit|'
-             r'file|filter|float|frozenset|getattr|globals|hasattr|hash|hex|id|'
-             r'input|int|intern|isinstance|issubclass|iter|len|list|locals|'
-             r'long|map|max|min|next|object|oct|open|ord|pow|property|range|'
-             r'raw_input|reduce|reload|repr|reversed|round|set|setattr|slice|'
-             r'sorted|staticmethod|str|sum|super|tuple|type|unichr|unicode|'
-             r'vars|xrange|zip)\b', Name.Builtin),
+            (words((
+                '__import__', 'abs', 'all', 'any', 'apply', 'basestring',
+                'bin', 'bool', 'buffer', 'bytearray', 'bytes', 'callable',
+                'chr', 'classmethod', 'cmp', 'coerce', 'compile', 'complex',
+                'delattr', 'dict', 'dir', 'divmod', 'enumerate', 'eval',
+                'execfile', 'exit', 'file', 'filter', 'float', 'frozenset',
+                'getattr', 'globals', 'hasattr', 'hash', 'hex', 'id', 'input',
+                'int', 'intern', 'isinstance', 'issubclass', 'iter', 'len',
+                'list', 'locals', 'long', 'map', 'max', 'min', 'next',
+                'object', 'oct', 'open', 'ord', 'pow', 'property', 'range',
+                'raw_input', 'reduce', 'reload', 'repr', 'reversed', 'round',
+                'set', 'setattr', 'slice', 'sorted', 'staticmethod', 'str',
+                'sum', 'super', 'tuple', 'type', 'unichr', 'unicode', 'vars',
+                'xrange', 'zip'),
+                prefix=r'(?<!\.)', suffix=r'\b'), Name.Builtin),
             (r'(?<!\.)(self|None|Ellipsis|NotImplemented|False|True'
              r')\b', Name.Builtin.Pseudo),
-            (r'(?<!\.)(ArithmeticError|AssertionError|AttributeError|'
-             r'BaseException|DeprecationWarning|EOFError|EnvironmentError|'
-             r'Exception|FloatingPointError|FutureWarning|GeneratorExit|IOError|'
-             r'ImportError|ImportWarning|IndentationError|IndexError|KeyError|'
-             r'KeyboardInterrupt|LookupError|MemoryError|NameError|'
-             r'NotImplemented|NotImplementedError|OSError|OverflowError|'
-             r'OverflowWarning|PendingDeprecationWarning|ReferenceError|'
-             r'RuntimeError|RuntimeWarning|StandardError|StopIteration|'
-             r'SyntaxError|SyntaxWarning|SystemError|SystemExit|TabError|'
-             r'TypeError|UnboundLocalError|UnicodeDecodeError|'
-             r'UnicodeEncodeError|UnicodeError|UnicodeTranslateError|'
-             r'UnicodeWarning|UserWarning|ValueError|VMSError|Warning|'
-             r'WindowsError|ZeroDivisionError)\b', Name.Exception),
+            (words((
+                'ArithmeticError', 'AssertionError', 'AttributeError',
+                'BaseException', 'DeprecationWarning', 'EOFError',
+                'EnvironmentError', 'Exception', 'FloatingPointError',
+                'FutureWarning', 'GeneratorExit', 'IOError', 'ImportError',
+                'ImportWarning', 'IndentationError', 'IndexError', 'KeyError',
+                'KeyboardInterrupt', 'LookupError', 'MemoryError', 'NameError',
+                'NotImplemented', 'NotImplementedError', 'OSError',
+                'OverflowError', 'OverflowWarning',
+                'PendingDeprecationWarning', 'ReferenceError', 'RuntimeError',
+                'RuntimeWarning', 'StandardError', 'StopIteration',
+                'SyntaxError', 'SyntaxWarning', 'SystemError', 'SystemExit',
+                'TabError', 'TypeError', 'UnboundLocalError',
+                'UnicodeDecodeError', 'UnicodeEncodeError', 'UnicodeError',
+                'UnicodeTranslateError', 'UnicodeWarning', 'UserWarning',
+                'ValueError', 'VMSError', 'Warning', 'WindowsError',
+                'ZeroDivisionError'),
+                prefix=r'(?<!\.)', suffix=r'\b'), Name.Exception),
         ],
         'numbers': [
             (r'(\d+\.\d*|\d*\.\d+)([eE][+-]?[0-9]+)?', Number.Float),
@@ -172,6 +184,8 @@ class PythonLexer(RegexLexer):
         ],
     }
 
+    analyse_hint = r'\A#!'
+
     def analyse_text(text):
         return shebang_matches(text, r'pythonw?(2\.\d)?')
 
@@ -199,14 +213,17 @@ class Python3Lexer(RegexLexer):
          r'return|try|while|yield|as|with|True|False|None)\b', Keyword),
     ]
     tokens['builtins'] = [
-        (r'(?<!\.)(__import__|abs|all|any|bin|bool|bytearray|bytes|'
-         r'chr|classmethod|cmp|compile|complex|delattr|dict|dir|'
-         r'divmod|enumerate|eval|filter|float|format|frozenset|getattr|'
-         r'globals|hasattr|hash|hex|id|input|int|isinstance|issubclass|'
-         r'iter|len|list|locals|map|max|memoryview|min|next|object|oct|'
-         r'open|ord|pow|print|property|range|repr|reversed|round|'
-         r'set|setattr|slice|sorted|staticmethod|str|sum|super|tuple|type|'
-         r'vars|zip)\b', Name.Builtin),
+        (words((
+            '__import__', 'abs', 'all', 'any', 'bin', 'bool', 'bytearray',
+            'bytes', 'chr', 'classmethod', 'cmp', 'compile', 'complex',
+            'delattr', 'dict', 'dir', 'divmod', 'enumerate', 'eval', 'filter',
+            'float', 'format', 'frozenset', 'getattr', 'globals', 'hasattr',
+            'hash', 'hex', 'id', 'input', 'int', 'isinstance', 'issubclass',
+            'iter', 'len', 'list', 'locals', 'map', 'max', 'memoryview', 'min',
+            'next', 'object', 'oct', 'open', 'ord', 'pow', 'print', 'property',
+            'range', 'repr', 'reversed', 'round', 'set', 'setattr', 'slice',
+            'sorted', 'staticmethod', 'str', 'sum', 'super', 'tuple', 'type',
+            'vars', 'zip'), prefix=r'(?<!\.)', suffix=r'\b'), Name.Builtin),
         (r'(?<!\.)(self|Ellipsis|NotImplemented)\b', Name.Builtin.Pseudo),
         (r'(?<!\.)(ArithmeticError|AssertionError|AttributeError|'
          r'BaseException|BufferError|BytesWarning|DeprecationWarning|'
@@ -263,6 +280,8 @@ class Python3Lexer(RegexLexer):
         # newlines are an error (use "nl" state)
     ]
 
+    analyse_hint = r'\A#!'
+
     def analyse_text(text):
         return shebang_matches(text, r'pythonw?3(\.\d)?')
 
@@ -757,6 +776,8 @@ class RubyLexer(ExtendedRegexLexer):
     }
     tokens.update(gen_rubystrings_rules())
 
+    analyse_hint = r'\A#!'
+
     def analyse_text(text):
         return shebang_matches(text, r'ruby(1\.\d)?')
 
@@ -857,33 +878,43 @@ class PerlLexer(RegexLexer):
             (r'm(?=[/!\\{<\[\(@%\$])', String.Regex, 'balanced-regex'),
             (r'((?<==~)|(?<=\())\s*/(\\\\|\\/|[^/])*/[gcimosx]*', String.Regex),
             (r'\s+', Text),
-            (r'(abs|accept|alarm|atan2|bind|binmode|bless|caller|chdir|'
-             r'chmod|chomp|chop|chown|chr|chroot|close|closedir|connect|'
-             r'continue|cos|crypt|dbmclose|dbmopen|defined|delete|die|'
-             r'dump|each|endgrent|endhostent|endnetent|endprotoent|'
-             r'endpwent|endservent|eof|eval|exec|exists|exit|exp|fcntl|'
-             r'fileno|flock|fork|format|formline|getc|getgrent|getgrgid|'
-             r'getgrnam|gethostbyaddr|gethostbyname|gethostent|getlogin|'
-             r'getnetbyaddr|getnetbyname|getnetent|getpeername|getpgrp|'
-             r'getppid|getpriority|getprotobyname|getprotobynumber|'
-             r'getprotoent|getpwent|getpwnam|getpwuid|getservbyname|'
-             r'getservbyport|getservent|getsockname|getsockopt|glob|gmtime|'
-             r'goto|grep|hex|import|index|int|ioctl|join|keys|kill|last|'
-             r'lc|lcfirst|length|link|listen|local|localtime|log|lstat|'
-             r'map|mkdir|msgctl|msgget|msgrcv|msgsnd|my|next|no|oct|open|'
-             r'opendir|ord|our|pack|package|pipe|pop|pos|printf|'
-             r'prototype|push|quotemeta|rand|read|readdir|'
-             r'readline|readlink|readpipe|recv|redo|ref|rename|require|'
-             r'reverse|rewinddir|rindex|rmdir|scalar|seek|seekdir|'
-             r'select|semctl|semget|semop|send|setgrent|sethostent|setnetent|'
-             r'setpgrp|setpriority|setprotoent|setpwent|setservent|'
-             r'setsockopt|shift|shmctl|shmget|shmread|shmwrite|shutdown|'
-             r'sin|sleep|socket|socketpair|sort|splice|split|sprintf|sqrt|'
-             r'srand|stat|study|substr|symlink|syscall|sysopen|sysread|'
-             r'sysseek|system|syswrite|tell|telldir|tie|tied|time|times|tr|'
-             r'truncate|uc|ucfirst|umask|undef|unlink|unpack|unshift|untie|'
-             r'utime|values|vec|wait|waitpid|wantarray|warn|write'
-             r')\b', Name.Builtin),
+            (words((
+                'abs', 'accept', 'alarm', 'atan2', 'bind', 'binmode', 'bless',
+                'caller', 'chdir', 'chmod', 'chomp', 'chop', 'chown', 'chr',
+                'chroot', 'close', 'closedir', 'connect', 'continue', 'cos',
+                'crypt', 'dbmclose', 'dbmopen', 'defined', 'delete', 'die',
+                'dump', 'each', 'endgrent', 'endhostent', 'endnetent',
+                'endprotoent', 'endpwent', 'endservent', 'eof', 'eval', 'exec',
+                'exists', 'exit', 'exp', 'fcntl', 'fileno', 'flock', 'fork',
+                'format', 'formline', 'getc', 'getgrent', 'getgrgid',
+                'getgrnam', 'gethostbyaddr', 'gethostbyname', 'gethostent',
+                'getlogin', 'getnetbyaddr', 'getnetbyname', 'getnetent',
+                'getpeername', 'getpgrp', 'getppid', 'getpriority',
+                'getprotobyname', 'getprotobynumber', 'getprotoent',
+                'getpwent', 'getpwnam', 'getpwuid', 'getservbyname',
+                'getservbyport', 'getservent', 'getsockname', 'getsockopt',
+                'glob', 'gmtime', 'goto', 'grep', 'hex', 'import', 'index',
+                'int', 'ioctl', 'join', 'keys', 'kill', 'last', 'lc',
+                'lcfirst', 'length', 'link', 'listen', 'local', 'localtime',
+                'log', 'lstat', 'map', 'mkdir', 'msgctl', 'msgget', 'msgrcv',
+                'msgsnd', 'my', 'next', 'no', 'oct', 'open', 'opendir', 'ord',
+                'our', 'pack', 'package', 'pipe', 'pop', 'pos', 'printf',
+                'prototype', 'push', 'quotemeta', 'rand', 'read', 'readdir',
+                'readline', 'readlink', 'readpipe', 'recv', 'redo', 'ref',
+                'rename', 'require', 'reverse', 'rewinddir', 'rindex', 'rmdir',
+                'scalar', 'seek', 'seekdir', 'select', 'semctl', 'semget',
+                'semop', 'send', 'setgrent', 'sethostent', 'setnetent',
+                'setpgrp', 'setpriority', 'setprotoent', 'setpwent',
+                'setservent', 'setsockopt', 'shift', 'shmctl', 'shmget',
+                'shmread', 'shmwrite', 'shutdown', 'sin', 'sleep', 'socket',
+                'socketpair', 'sort', 'splice', 'split', 'sprintf', 'sqrt',
+                'srand', 'stat', 'study', 'substr', 'symlink', 'syscall',
+                'sysopen', 'sysread', 'sysseek', 'system', 'syswrite', 'tell',
+                'telldir', 'tie', 'tied', 'time', 'times', 'tr', 'truncate',
+                'uc', 'ucfirst', 'umask', 'undef', 'unlink', 'unpack',
+                'unshift', 'untie', 'utime', 'values', 'vec', 'wait',
+                'waitpid', 'wantarray', 'warn', 'write'),
+                suffix=r'\b'), Name.Builtin),
             (r'((__(DATA|DIE|WARN)__)|(STD(IN|OUT|ERR)))\b', Name.Builtin.Pseudo),
             (r'<<([\'"]?)([a-zA-Z_][a-zA-Z0-9_]*)\1;?\n.*?\n\2\n', String),
             (r'__END__', Comment.Preproc, 'end-part'),
@@ -973,6 +1004,9 @@ class PerlLexer(RegexLexer):
         ]
     }
 
+    analyse_hint = r'\A#!|my \$'
+    analyse_default = 0.1
+
     def analyse_text(text):
         if shebang_matches(text, r'perl(\d\.\d\.\d)?'):
             return True
@@ -1083,12 +1117,11 @@ class LuaLexer(RegexLexer):
             options, 'func_name_highlighting', True)
         self.disabled_modules = get_list_opt(options, 'disabled_modules', [])
 
-        self._functions = set()
         if self.func_name_highlighting:
-            from pygments.lexers._luabuiltins import MODULES
-            for mod, func in MODULES.iteritems():
-                if mod not in self.disabled_modules:
-                    self._functions.update(func)
+            self._functions = builtin_names('_luabuiltins', 'MODULES',
+                                            self.disabled_modules)
+        else:
+            self._functions = frozenset()
         RegexLexer.__init__(self, **options)
 
     def get_tokens_unprocessed(self, text):
@@ -1345,6 +1378,8 @@ class TclLexer(RegexLexer):
         ],
     }
 
+    analyse_hint = r'\A#!'
+
     def analyse_text(text):
         return shebang_matches(text, r'(tcl)')
 
@@ -11,7 +11,8 @@
 
 import re
 
-from pygments.lexer import RegexLexer, include, bygroups, using, DelegatingLexer
+from pygments.lexer import RegexLexer, include, bygroups, using, \
+     DelegatingLexer, words
 from pygments.lexers.compiled import DLexer, CppLexer, CLexer
 from pygments.token import *
 
@@ -87,8 +88,10 @@ class GasLexer(RegexLexer):
         ]
     }
 
+    analyse_hint = r'\A\.\w'
+
     def analyse_text(text):
-        return re.match(r'^\.\w+', text, re.M)
+        return re.match(r'^\.\w+', text, re.M) is not None
 
 class ObjdumpLexer(RegexLexer):
     """
@@ -225,51 +228,35 @@ class LlvmLexer(RegexLexer):
         ],
         'keyword': [
             # Regular keywords
-            (r'(begin|end'
-             r'|true|false'
-             r'|declare|define'
-             r'|global|constant'
-
-             r'|private|linker_private|internal|available_externally|linkonce'
-             r'|linkonce_odr|weak|weak_odr|appending|dllimport|dllexport'
-             r'|common|default|hidden|protected|extern_weak|external'
-             r'|thread_local|zeroinitializer|undef|null|to|tail|target|triple'
-             r'|deplibs|datalayout|volatile|nuw|nsw|exact|inbounds|align'
-             r'|addrspace|section|alias|module|asm|sideeffect|gc|dbg'
-
-             r'|ccc|fastcc|coldcc|x86_stdcallcc|x86_fastcallcc|arm_apcscc'
-             r'|arm_aapcscc|arm_aapcs_vfpcc'
-
-             r'|cc|c'
-
-             r'|signext|zeroext|inreg|sret|nounwind|noreturn|noalias|nocapture'
-             r'|byval|nest|readnone|readonly'
-
-             r'|inlinehint|noinline|alwaysinline|optsize|ssp|sspreq|noredzone'
-             r'|noimplicitfloat|naked'
-
-             r'|type|opaque'
-
-             r'|eq|ne|slt|sgt|sle'
-             r'|sge|ult|ugt|ule|uge'
-             r'|oeq|one|olt|ogt|ole'
-             r'|oge|ord|uno|ueq|une'
-             r'|x'
-
-             # instructions
-             r'|add|fadd|sub|fsub|mul|fmul|udiv|sdiv|fdiv|urem|srem|frem|shl'
-             r'|lshr|ashr|and|or|xor|icmp|fcmp'
-
-             r'|phi|call|trunc|zext|sext|fptrunc|fpext|uitofp|sitofp|fptoui'
-             r'fptosi|inttoptr|ptrtoint|bitcast|select|va_arg|ret|br|switch'
-             r'|invoke|unwind|unreachable'
-
-             r'|malloc|alloca|free|load|store|getelementptr'
-
-             r'|extractelement|insertelement|shufflevector|getresult'
-             r'|extractvalue|insertvalue'
-
-             r')\b', Keyword),
+            (words((
+                'begin', 'end', 'true', 'false', 'declare', 'define', 'global',
+                'constant', 'private', 'linker_private', 'internal',
+                'available_externally', 'linkonce', 'linkonce_odr', 'weak',
+                'weak_odr', 'appending', 'dllimport', 'dllexport', 'common',
+                'default', 'hidden', 'protected', 'extern_weak', 'external',
+                'thread_local', 'zeroinitializer', 'undef', 'null', 'to',
+                'tail', 'target', 'triple', 'deplibs', 'datalayout',
+                'volatile', 'nuw', 'nsw', 'exact', 'inbounds', 'align',
+                'addrspace', 'section', 'alias', 'module', 'asm', 'sideeffect',
+                'gc', 'dbg', 'ccc', 'fastcc', 'coldcc', 'x86_stdcallcc',
+                'x86_fastcallcc', 'arm_apcscc', 'arm_aapcscc',
+                'arm_aapcs_vfpcc', 'cc', 'c', 'signext', 'zeroext', 'inreg',
+                'sret', 'nounwind', 'noreturn', 'noalias', 'nocapture',
+                'byval', 'nest', 'readnone', 'readonly', 'inlinehint',
+                'noinline', 'alwaysinline', 'optsize', 'ssp', 'sspreq',
+                'noredzone', 'noimplicitfloat', 'naked', 'type', 'opaque',
+                'eq', 'ne', 'slt', 'sgt', 'sle', 'sge', 'ult', 'ugt', 'ule',
+                'uge', 'oeq', 'one', 'olt', 'ogt', 'ole', 'oge', 'ord', 'uno',
+                'ueq', 'une', 'x', 'add', 'fadd', 'sub', 'fsub', 'mul', 'fmul',
+                'udiv', 'sdiv', 'fdiv', 'urem', 'srem', 'frem', 'shl', 'lshr',
+                'ashr', 'and', 'or', 'xor', 'icmp', 'fcmp', 'phi', 'call',
+                'trunc', 'zext', 'sext', 'fptrunc', 'fpext', 'uitofp',
+                'sitofp', 'fptouifptosi', 'inttoptr', 'ptrtoint', 'bitcast',
+                'select', 'va_arg', 'ret', 'br', 'switch', 'invoke', 'unwind',
+                'unreachable', 'malloc', 'alloca', 'free', 'load', 'store',
+                'getelementptr', 'extractelement', 'insertelement',
+                'shufflevector', 'getresult', 'extractvalue', 'insertvalue'),
+                suffix=r'\b'), Keyword),
 
             # Types
             (r'void|float|double|x86_fp80|fp128|ppc_fp128|label|metadata',
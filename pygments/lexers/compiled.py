@@ -13,7 +13,7 @@ import re
 
 from pygments.scanner import Scanner
 from pygments.lexer import Lexer, RegexLexer, include, bygroups, using, \
-                           this, combined
+                           this, combined, words
 from pygments.util import get_bool_opt, get_list_opt
 from pygments.token import \
      Text, Comment, Operator, Keyword, Name, String, Number, Punctuation, \
@@ -188,13 +188,17 @@ class CppLexer(RegexLexer):
             (r'\*/', Error),
             (r'[~!%^&*+=|?:<>/-]', Operator),
             (r'[()\[\],.;]', Punctuation),
-            (r'(asm|auto|break|case|catch|const|const_cast|continue|'
-             r'default|delete|do|dynamic_cast|else|enum|explicit|export|'
-             r'extern|for|friend|goto|if|mutable|namespace|new|operator|'
-             r'private|protected|public|register|reinterpret_cast|return|'
-             r'restrict|sizeof|static|static_cast|struct|switch|template|'
-             r'this|throw|throws|try|typedef|typeid|typename|union|using|'
-             r'volatile|virtual|while)\b', Keyword),
+            (words((
+                'asm', 'auto', 'break', 'case', 'catch', 'const', 'const_cast',
+                'continue', 'default', 'delete', 'do', 'dynamic_cast', 'else',
+                'enum', 'explicit', 'export', 'extern', 'for', 'friend',
+                'goto', 'if', 'mutable', 'namespace', 'new', 'operator',
+                'private', 'protected', 'public', 'register',
+                'reinterpret_cast', 'return', 'restrict', 'sizeof', 'static',
+                'static_cast', 'struct', 'switch', 'template', 'this', 'throw',
+                'throws', 'try', 'typedef', 'typeid', 'typename', 'union',
+                'using', 'volatile', 'virtual', 'while'),
+                suffix=r'\b'), Keyword),
             (r'(class)(\s+)', bygroups(Keyword, Text), 'classname'),
             (r'(bool|int|long|float|short|double|char|unsigned|signed|'
              r'void|wchar_t)\b', Keyword.Type),
@@ -258,15 +262,20 @@ class DLexer(RegexLexer):
             (r'/(\\\n)?[*](.|\n)*?[*](\\\n)?/', Comment.Multiline),
             (r'/\+', Comment.Multiline, 'nested_comment'),
             # Keywords
-            (r'(abstract|alias|align|asm|assert|auto|body|break|case|cast'
-             r'|catch|class|const|continue|debug|default|delegate|delete'
-             r'|deprecated|do|else|enum|export|extern|finally|final'
-             r'|foreach_reverse|foreach|for|function|goto|if|import|inout'
-             r'|interface|invariant|in|is|lazy|mixin|module|new|nothrow|out'
-             r'|override|package|pragma|private|protected|public|pure|ref|return'
-             r'|scope|static|struct|super|switch|synchronized|template|this'
-             r'|throw|try|typedef|typeid|typeof|union|unittest|version|volatile'
-             r'|while|with|__traits)\b', Keyword
+            (words((
+                'abstract', 'alias', 'align', 'asm', 'assert', 'auto', 'body',
+                'break', 'case', 'cast', 'catch', 'class', 'const', 'continue',
+                'debug', 'default', 'delegate', 'delete', 'deprecated', 'do',
+                'else', 'enum', 'export', 'extern', 'finally', 'final',
+                'foreach_reverse', 'foreach', 'for', 'function', 'goto', 'if',
+                'import', 'inout', 'interface', 'invariant', 'in', 'is',
+                'lazy', 'mixin', 'module', 'new', 'nothrow', 'out', 'override',
+                'package', 'pragma', 'private', 'protected', 'public', 'pure',
+                'ref', 'return', 'scope', 'static', 'struct', 'super',
+                'switch', 'synchronized', 'template', 'this', 'throw', 'try',
+                'typedef', 'typeid', 'typeof', 'union', 'unittest', 'version',
+                'volatile', 'while', 'with', '__traits'),
+                suffix=r'\b'), Keyword
             ),
             (r'(bool|byte|cdouble|cent|cfloat|char|creal|dchar|double|float'
              r'|idouble|ifloat|int|ireal|long|real|short|ubyte|ucent|uint|ulong'
@@ -1200,6 +1209,8 @@ class ObjectiveCLexer(RegexLexer):
         ]
     }
 
+    analyse_hint = r'@"|\A\['
+
     def analyse_text(text):
         if '@"' in text: # strings
             return True
@@ -1237,15 +1248,22 @@ class FortranLexer(RegexLexer):
         ],
         'core': [
             # Statements
-            (r'\b(ACCEPT|ALLOCATABLE|ALLOCATE|ARRAY|ASSIGN|BACKSPACE|BLOCK DATA|'
-             r'BYTE|CALL|CASE|CLOSE|COMMON|CONTAINS|CONTINUE|CYCLE|DATA|'
-             r'DEALLOCATE|DECODE|DIMENSION|DO|ENCODE|END FILE|ENDIF|END|ENTRY|'
-             r'EQUIVALENCE|EXIT|EXTERNAL|EXTRINSIC|FORALL|FORMAT|FUNCTION|GOTO|'
-             r'IF|IMPLICIT|INCLUDE|INQUIRE|INTENT|INTERFACE|INTRINSIC|MODULE|'
-             r'NAMELIST|NULLIFY|NONE|OPEN|OPTIONAL|OPTIONS|PARAMETER|PAUSE|'
-             r'POINTER|PRINT|PRIVATE|PROGRAM|PUBLIC|PURE|READ|RECURSIVE|RETURN|'
-             r'REWIND|SAVE|SELECT|SEQUENCE|STOP|SUBROUTINE|TARGET|TYPE|USE|'
-             r'VOLATILE|WHERE|WRITE|WHILE|THEN|ELSE|ENDIF)\s*\b',
+            (words((
+                'ACCEPT', 'ALLOCATABLE', 'ALLOCATE', 'ARRAY', 'ASSIGN',
+                'BACKSPACE', 'BLOCK DATA', 'BYTE', 'CALL', 'CASE', 'CLOSE',
+                'COMMON', 'CONTAINS', 'CONTINUE', 'CYCLE', 'DATA',
+                'DEALLOCATE', 'DECODE', 'DIMENSION', 'DO', 'ENCODE',
+                'END FILE', 'ENDIF', 'END', 'ENTRY', 'EQUIVALENCE', 'EXIT',
+                'EXTERNAL', 'EXTRINSIC', 'FORALL', 'FORMAT', 'FUNCTION',
+                'GOTO', 'IF', 'IMPLICIT', 'INCLUDE', 'INQUIRE', 'INTENT',
+                'INTERFACE', 'INTRINSIC', 'MODULE', 'NAMELIST', 'NULLIFY',
+                'NONE', 'OPEN', 'OPTIONAL', 'OPTIONS', 'PARAMETER', 'PAUSE',
+                'POINTER', 'PRINT', 'PRIVATE', 'PROGRAM', 'PUBLIC', 'PURE',
+                'READ', 'RECURSIVE', 'RETURN', 'REWIND', 'SAVE', 'SELECT',
+                'SEQUENCE', 'STOP', 'SUBROUTINE', 'TARGET', 'TYPE', 'USE',
+                'VOLATILE', 'WHERE', 'WRITE', 'WHILE', 'THEN', 'ELSE',
+                'ENDIF'),
+                prefix=r'\b', suffix=r'\s*\b'),
              Keyword),
 
             # Data Types
@@ -1261,32 +1279,45 @@ class FortranLexer(RegexLexer):
             (r'[(),:&%;]', Punctuation),
 
             # Intrinsics
-            (r'\b(Abort|Abs|Access|AChar|ACos|AdjustL|AdjustR|AImag|AInt|Alarm|'
-             r'All|Allocated|ALog|AMax|AMin|AMod|And|ANInt|Any|'
-             r'ASin|Associated|ATan|BesJ|BesJN|BesY|BesYN|'
-             r'Bit_Size|BTest|CAbs|CCos|Ceiling|CExp|Char|ChDir|ChMod|CLog|'
-             r'Cmplx|Complex|Conjg|Cos|CosH|Count|CPU_Time|CShift|CSin|CSqRt|'
-             r'CTime|DAbs|DACos|DASin|DATan|Date_and_Time|DbesJ|'
-             r'DbesJ|DbesJN|DbesY|DbesY|DbesYN|Dble|DCos|DCosH|DDiM|DErF|DErFC|'
-             r'DExp|Digits|DiM|DInt|DLog|DLog|DMax|DMin|DMod|DNInt|Dot_Product|'
-             r'DProd|DSign|DSinH|DSin|DSqRt|DTanH|DTan|DTime|EOShift|Epsilon|'
-             r'ErF|ErFC|ETime|Exit|Exp|Exponent|FDate|FGet|FGetC|Float|'
-             r'Floor|Flush|FNum|FPutC|FPut|Fraction|FSeek|FStat|FTell|'
-             r'GError|GetArg|GetCWD|GetEnv|GetGId|GetLog|GetPId|GetUId|'
-             r'GMTime|HostNm|Huge|IAbs|IAChar|IAnd|IArgC|IBClr|IBits|'
-             r'IBSet|IChar|IDate|IDiM|IDInt|IDNInt|IEOr|IErrNo|IFix|Imag|'
-             r'ImagPart|Index|Int|IOr|IRand|IsaTty|IShft|IShftC|ISign|'
-             r'ITime|Kill|Kind|LBound|Len|Len_Trim|LGe|LGt|Link|LLe|LLt|LnBlnk|'
-             r'Loc|Log|Log|Logical|Long|LShift|LStat|LTime|MatMul|Max|'
-             r'MaxExponent|MaxLoc|MaxVal|MClock|Merge|Min|MinExponent|MinLoc|'
-             r'MinVal|Mod|Modulo|MvBits|Nearest|NInt|Not|Or|Pack|PError|'
-             r'Precision|Present|Product|Radix|Rand|Random_Number|Random_Seed|'
-             r'Range|Real|RealPart|Rename|Repeat|Reshape|RRSpacing|RShift|Scale|'
-             r'Scan|Second|Selected_Int_Kind|Selected_Real_Kind|Set_Exponent|'
-             r'Shape|Short|Sign|Signal|SinH|Sin|Sleep|Sngl|Spacing|Spread|SqRt|'
-             r'SRand|Stat|Sum|SymLnk|System|System_Clock|Tan|TanH|Time|'
-             r'Tiny|Transfer|Transpose|Trim|TtyNam|UBound|UMask|Unlink|Unpack|'
-             r'Verify|XOr|ZAbs|ZCos|ZExp|ZLog|ZSin|ZSqRt)\s*\b',
+            (words((
+                'Abort', 'Abs', 'Access', 'AChar', 'ACos', 'AdjustL',
+                'AdjustR', 'AImag', 'AInt', 'Alarm', 'All', 'Allocated',
+                'ALog', 'AMax', 'AMin', 'AMod', 'And', 'ANInt', 'Any', 'ASin',
+                'Associated', 'ATan', 'BesJ', 'BesJN', 'BesY', 'BesYN',
+                'Bit_Size', 'BTest', 'CAbs', 'CCos', 'Ceiling', 'CExp', 'Char',
+                'ChDir', 'ChMod', 'CLog', 'Cmplx', 'Complex', 'Conjg', 'Cos',
+                'CosH', 'Count', 'CPU_Time', 'CShift', 'CSin', 'CSqRt',
+                'CTime', 'DAbs', 'DACos', 'DASin', 'DATan', 'Date_and_Time',
+                'DbesJ', 'DbesJ', 'DbesJN', 'DbesY', 'DbesY', 'DbesYN', 'Dble',
+                'DCos', 'DCosH', 'DDiM', 'DErF', 'DErFC', 'DExp', 'Digits',
+                'DiM', 'DInt', 'DLog', 'DLog', 'DMax', 'DMin', 'DMod', 'DNInt',
+                'Dot_Product', 'DProd', 'DSign', 'DSinH', 'DSin', 'DSqRt',
+                'DTanH', 'DTan', 'DTime', 'EOShift', 'Epsilon', 'ErF', 'ErFC',
+                'ETime', 'Exit', 'Exp', 'Exponent', 'FDate', 'FGet', 'FGetC',
+                'Float', 'Floor', 'Flush', 'FNum', 'FPutC', 'FPut', 'Fraction',
+                'FSeek', 'FStat', 'FTell', 'GError', 'GetArg', 'GetCWD',
+                'GetEnv', 'GetGId', 'GetLog', 'GetPId', 'GetUId', 'GMTime',
+                'HostNm', 'Huge', 'IAbs', 'IAChar', 'IAnd', 'IArgC', 'IBClr',
+                'IBits', 'IBSet', 'IChar', 'IDate', 'IDiM', 'IDInt', 'IDNInt',
+                'IEOr', 'IErrNo', 'IFix', 'Imag', 'ImagPart', 'Index', 'Int',
+                'IOr', 'IRand', 'IsaTty', 'IShft', 'IShftC', 'ISign', 'ITime',
+                'Kill', 'Kind', 'LBound', 'Len', 'Len_Trim', 'LGe', 'LGt',
+                'Link', 'LLe', 'LLt', 'LnBlnk', 'Loc', 'Log', 'Log', 'Logical',
+                'Long', 'LShift', 'LStat', 'LTime', 'MatMul', 'Max',
+                'MaxExponent', 'MaxLoc', 'MaxVal', 'MClock', 'Merge', 'Min',
+                'MinExponent', 'MinLoc', 'MinVal', 'Mod', 'Modulo', 'MvBits',
+                'Nearest', 'NInt', 'Not', 'Or', 'Pack', 'PError', 'Precision',
+                'Present', 'Product', 'Radix', 'Rand', 'Random_Number',
+                'Random_Seed', 'Range', 'Real', 'RealPart', 'Rename', 'Repeat',
+                'Reshape', 'RRSpacing', 'RShift', 'Scale', 'Scan', 'Second',
+                'Selected_Int_Kind', 'Selected_Real_Kind', 'Set_Exponent',
+                'Shape', 'Short', 'Sign', 'Signal', 'SinH', 'Sin', 'Sleep',
+                'Sngl', 'Spacing', 'Spread', 'SqRt', 'SRand', 'Stat', 'Sum',
+                'SymLnk', 'System', 'System_Clock', 'Tan', 'TanH', 'Time',
+                'Tiny', 'Transfer', 'Transpose', 'Trim', 'TtyNam', 'UBound',
+                'UMask', 'Unlink', 'Unpack', 'Verify', 'XOr', 'ZAbs', 'ZCos',
+                'ZExp', 'ZLog', 'ZSin', 'ZSqRt'),
+                prefix=r'\b', suffix=r'\s*\b'),
              Name.Builtin),
 
             # Booleans
@@ -1406,6 +1437,8 @@ class PrologLexer(RegexLexer):
         ],
     }
 
+    analyse_hint = r':-'
+
     def analyse_text(text):
         return ':-' in text
 
@@ -1465,15 +1498,21 @@ class CythonLexer(RegexLexer):
             (r'(DEF|IF|ELIF|ELSE)\b', Comment.Preproc),
         ],
         'builtins': [
-            (r'(?<!\.)(__import__|abs|all|any|apply|basestring|bin|bool|buffer|'
-             r'bytearray|bytes|callable|chr|classmethod|cmp|coerce|compile|'
-             r'complex|delattr|dict|dir|divmod|enumerate|eval|execfile|exit|'
-             r'file|filter|float|frozenset|getattr|globals|hasattr|hash|hex|id|'
-             r'input|int|intern|isinstance|issubclass|iter|len|list|locals|'
-             r'long|map|max|min|next|object|oct|open|ord|pow|property|range|'
-             r'raw_input|reduce|reload|repr|reversed|round|set|setattr|slice|'
-             r'sorted|staticmethod|str|sum|super|tuple|type|unichr|unicode|'
-             r'vars|xrange|zip)\b', Name.Builtin),
+            (words((
+                '__import__', 'abs', 'all', 'any', 'apply', 'basestring',
+                'bin', 'bool', 'buffer', 'bytearray', 'bytes', 'callable',
+                'chr', 'classmethod', 'cmp', 'coerce', 'compile', 'complex',
+                'delattr', 'dict', 'dir', 'divmod', 'enumerate', 'eval',
+                'execfile', 'exit', 'file', 'filter', 'float', 'frozenset',
+                'getattr', 'globals', 'hasattr', 'hash', 'hex', 'id', 'input',
+                'int', 'intern', 'isinstance', 'issubclass', 'iter', 'len',
+                'list', 'locals', 'long', 'map', 'max', 'min', 'next',
+                'object', 'oct', 'open', 'ord', 'pow', 'property', 'range',
+                'raw_input', 'reduce', 'reload', 'repr', 'reversed', 'round',
+                'set', 'setattr', 'slice', 'sorted', 'staticmethod', 'str',
+                'sum', 'super', 'tuple', 'type', 'unichr', 'unicode', 'vars',
+                'xrange', 'zip'),
+                prefix=r'(?<!\.)', suffix=r'\b'), Name.Builtin),
             (r'(?<!\.)(self|None|Ellipsis|NotImplemented|False|True|NULL'
              r')\b', Name.Builtin.Pseudo),
             (r'(?<!\.)(ArithmeticError|AssertionError|AttributeError|'
@@ -2091,13 +2130,17 @@ class AdaLexer(RegexLexer):
             (r'<<[a-z0-9_]+>>', Name.Label),
             (r'([a-z0-9_]+)(\s*)(:)(\s*)(declare|begin|loop|for|while)',
              bygroups(Name.Label, Text, Punctuation, Text, Keyword.Reserved)),
-            (r'\b(abort|abs|abstract|accept|access|aliased|all|array|at|begin|'
-             r'body|case|constant|declare|delay|delta|digits|do|else|elsif|end|'
-             r'entry|exception|exit|interface|for|goto|if|is|limited|loop|new|'
-             r'null|of|or|others|out|overriding|pragma|protected|raise|range|'
-             r'record|renames|requeue|return|reverse|select|separate|subtype|'
-             r'synchronized|task|tagged|terminate|then|type|until|when|while|'
-             r'xor)\b',
+            (words((
+                'abort', 'abs', 'abstract', 'accept', 'access', 'aliased',
+                'all', 'array', 'at', 'begin', 'body', 'case', 'constant',
+                'declare', 'delay', 'delta', 'digits', 'do', 'else', 'elsif',
+                'end', 'entry', 'exception', 'exit', 'interface', 'for',
+                'goto', 'if', 'is', 'limited', 'loop', 'new', 'null', 'of',
+                'or', 'others', 'out', 'overriding', 'pragma', 'protected',
+                'raise', 'range', 'record', 'renames', 'requeue', 'return',
+                'reverse', 'select', 'separate', 'subtype', 'synchronized',
+                'task', 'tagged', 'terminate', 'then', 'type', 'until', 'when',
+                'while', 'xor'), prefix=r'\b', suffix=r'\b'),
              Keyword.Reserved),
             (r'"[^"]*"', String),
             include('attribute'),
@@ -10,7 +10,8 @@
 """
 import re
 
-from pygments.lexer import RegexLexer, DelegatingLexer, bygroups, using, this
+from pygments.lexer import RegexLexer, DelegatingLexer, bygroups, using, \
+     this, words
 from pygments.token import Punctuation, \
      Text, Comment, Operator, Keyword, Name, String, Number, Literal, Other
 from pygments.util import get_choice_opt
@@ -160,13 +161,16 @@ class BooLexer(RegexLexer):
             (r'/(\\\\|\\/|[^/\s])/', String.Regex),
             (r'@/(\\\\|\\/|[^/])*/', String.Regex),
             (r'=~|!=|==|<<|>>|[-+/*%=<>&^|]', Operator),
-            (r'(as|abstract|callable|constructor|destructor|do|import|'
-             r'enum|event|final|get|interface|internal|of|override|'
-             r'partial|private|protected|public|return|set|static|'
-             r'struct|transient|virtual|yield|super|and|break|cast|'
-             r'continue|elif|else|ensure|except|for|given|goto|if|in|'
-             r'is|isa|not|or|otherwise|pass|raise|ref|try|unless|when|'
-             r'while|from|as)\b', Keyword),
+            (words((
+                'as', 'abstract', 'callable', 'constructor', 'destructor',
+                'do', 'import', 'enum', 'event', 'final', 'get', 'interface',
+                'internal', 'of', 'override', 'partial', 'private',
+                'protected', 'public', 'return', 'set', 'static', 'struct',
+                'transient', 'virtual', 'yield', 'super', 'and', 'break',
+                'cast', 'continue', 'elif', 'else', 'ensure', 'except', 'for',
+                'given', 'goto', 'if', 'in', 'is', 'isa', 'not', 'or',
+                'otherwise', 'pass', 'raise', 'ref', 'try', 'unless', 'when',
+                'while', 'from', 'as'), suffix=r'\b'), Keyword),
             (r'def(?=\s+\(.*?\))', Keyword),
             (r'(def)(\s+)', bygroups(Keyword, Text), 'funcname'),
             (r'(class)(\s+)', bygroups(Keyword, Text), 'classname'),
@@ -232,25 +236,28 @@ class VbNetLexer(RegexLexer):
             (r'[\(\){}!#,.:]', Punctuation),
             (r'Option\s+(Strict|Explicit|Compare)\s+'
              r'(On|Off|Binary|Text)', Keyword.Declaration),
-            (r'(?<!\.)(AddHandler|Alias|'
-             r'ByRef|ByVal|Call|Case|Catch|CBool|CByte|CChar|CDate|'
-             r'CDec|CDbl|CInt|CLng|CObj|Const|Continue|CSByte|CShort|'
-             r'CSng|CStr|CType|CUInt|CULng|CUShort|Declare|'
-             r'Default|Delegate|Dim|DirectCast|Do|Each|Else|ElseIf|'
-             r'End|EndIf|Enum|Erase|Error|Event|Exit|False|Finally|For|'
-             r'Friend|Function|Get|Global|GoSub|GoTo|Handles|If|'
-             r'Implements|Imports|Inherits|Interface|'
-             r'Let|Lib|Loop|Me|Module|MustInherit|'
-             r'MustOverride|MyBase|MyClass|Namespace|Narrowing|New|Next|'
-             r'Not|Nothing|NotInheritable|NotOverridable|Of|On|'
-             r'Operator|Option|Optional|Overloads|Overridable|'
-             r'Overrides|ParamArray|Partial|Private|Property|Protected|'
-             r'Public|RaiseEvent|ReadOnly|ReDim|RemoveHandler|Resume|'
-             r'Return|Select|Set|Shadows|Shared|Single|'
-             r'Static|Step|Stop|Structure|Sub|SyncLock|Then|'
-             r'Throw|To|True|Try|TryCast|Wend|'
-             r'Using|When|While|Widening|With|WithEvents|'
-             r'WriteOnly)\b', Keyword),
+            (words((
+                'AddHandler', 'Alias', 'ByRef', 'ByVal', 'Call', 'Case',
+                'Catch', 'CBool', 'CByte', 'CChar', 'CDate', 'CDec', 'CDbl',
+                'CInt', 'CLng', 'CObj', 'Const', 'Continue', 'CSByte',
+                'CShort', 'CSng', 'CStr', 'CType', 'CUInt', 'CULng', 'CUShort',
+                'Declare', 'Default', 'Delegate', 'Dim', 'DirectCast', 'Do',
+                'Each', 'Else', 'ElseIf', 'End', 'EndIf', 'Enum', 'Erase',
+                'Error', 'Event', 'Exit', 'False', 'Finally', 'For', 'Friend',
+                'Function', 'Get', 'Global', 'GoSub', 'GoTo', 'Handles', 'If',
+                'Implements', 'Imports', 'Inherits', 'Interface', 'Let', 'Lib',
+                'Loop', 'Me', 'Module', 'MustInherit', 'MustOverride',
+                'MyBase', 'MyClass', 'Namespace', 'Narrowing', 'New', 'Next',
+                'Not', 'Nothing', 'NotInheritable', 'NotOverridable', 'Of',
+                'On', 'Operator', 'Option', 'Optional', 'Overloads',
+                'Overridable', 'Overrides', 'ParamArray', 'Partial', 'Private',
+                'Property', 'Protected', 'Public', 'RaiseEvent', 'ReadOnly',
+                'ReDim', 'RemoveHandler', 'Resume', 'Return', 'Select', 'Set',
+                'Shadows', 'Shared', 'Single', 'Static', 'Step', 'Stop',
+                'Structure', 'Sub', 'SyncLock', 'Then', 'Throw', 'To', 'True',
+                'Try', 'TryCast', 'Wend', 'Using', 'When', 'While', 'Widening',
+                'With', 'WithEvents', 'WriteOnly'),
+                prefix=r'(?<!\.)', suffix=r'\b'), Keyword),
             (r'(?<!\.)(Function|Sub|Property)(\s+)',
              bygroups(Keyword, Text), 'funcname'),
             (r'(?<!\.)(Class|Structure|Enum)(\s+)',
@@ -327,6 +334,9 @@ class CSharpAspxLexer(DelegatingLexer):
         super(CSharpAspxLexer, self).__init__(CSharpLexer,GenericAspxLexer,
                                               **options)
 
+    analyse_hint = r'(?i)language'
+    analyse_default = 0.001
+
     def analyse_text(text):
         if re.search(r'Page\s*Language="C#"', text, re.I) is not None:
             return 0.2
@@ -348,6 +358,8 @@ class VbNetAspxLexer(DelegatingLexer):
         super(VbNetAspxLexer, self).__init__(VbNetLexer,GenericAspxLexer,
                                               **options)
 
+    analyse_hint = r'(?i)language'
+
     def analyse_text(text):
         if re.search(r'Page\s*Language="Vb"', text, re.I) is not None:
             return 0.2
@@ -11,7 +11,8 @@
 
 import re
 
-from pygments.lexer import Lexer, RegexLexer, bygroups, include, do_insertions
+from pygments.lexer import Lexer, RegexLexer, bygroups, include, \
+     do_insertions, builtin_names, words
 from pygments.token import Text, Comment, Operator, Keyword, Name, \
      String, Number, Punctuation, Literal, Generic
 
@@ -121,10 +122,7 @@ class SchemeLexer(RegexLexer):
             (r"('|#|`|,@|,|\.)", Operator),
 
             # highlight the keywords
-            ('(%s)' % '|'.join([
-                re.escape(entry) + ' ' for entry in keywords]),
-                Keyword
-            ),
+            (words(keywords, suffix=' '), Keyword),
 
             # first variable in a quoted string like
             # '(this is syntactic sugar)
@@ -132,10 +130,7 @@ class SchemeLexer(RegexLexer):
             (r"(?<=#\()" + valid_name, Name.Variable),
 
             # highlight the builtins
-            ("(?<=\()(%s)" % '|'.join([
-                re.escape(entry) + ' ' for entry in builtins]),
-                Name.Builtin
-            ),
+            (words(builtins, prefix=r'(?<=\()', suffix=' '), Name.Builtin),
 
             # the remaining functions
             (r'(?<=\()' + valid_name, Name.Function),
@@ -173,16 +168,15 @@ class CommonLispLexer(RegexLexer):
     symbol = r'(\|[^|]+\||(?:%s)(?:%s)*)' % (nonmacro, constituent)
 
     def __init__(self, **options):
-        from pygments.lexers._clbuiltins import BUILTIN_FUNCTIONS, \
-            SPECIAL_FORMS, MACROS, LAMBDA_LIST_KEYWORDS, DECLARATIONS, \
-            BUILTIN_TYPES, BUILTIN_CLASSES
-        self.builtin_function = BUILTIN_FUNCTIONS
-        self.special_forms = SPECIAL_FORMS
-        self.macros = MACROS
-        self.lambda_list_keywords = LAMBDA_LIST_KEYWORDS
-        self.declarations = DECLARATIONS
-        self.builtin_types = BUILTIN_TYPES
-        self.builtin_classes = BUILTIN_CLASSES
+        self.builtin_function = builtin_names('_clbuiltins',
+                                              'BUILTIN_FUNCTIONS')
+        self.special_forms = builtin_names('_clbuiltins', 'SPECIAL_FORMS')
+        self.macros = builtin_names('_clbuiltins', 'MACROS')
+        self.lambda_list_keywords = builtin_names('_clbuiltins',
+                                                  'LAMBDA_LIST_KEYWORDS')
+        self.declarations = builtin_names('_clbuiltins', 'DECLARATIONS')
+        self.builtin_types = builtin_names('_clbuiltins', 'BUILTIN_TYPES')
+        self.builtin_classes = builtin_names('_clbuiltins', 'BUILTIN_CLASSES')
         RegexLexer.__init__(self, **options)
 
     def get_tokens_unprocessed(self, text):
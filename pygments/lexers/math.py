@@ -11,7 +11,8 @@
 
 import re
 
-from pygments.lexer import Lexer, RegexLexer, bygroups, include, do_insertions
+from pygments.lexer import Lexer, RegexLexer, bygroups, include, \
+     do_insertions, words
 from pygments.token import Comment, String, Punctuation, Keyword, Name, \
     Operator, Number, Text, Generic
 
@@ -158,7 +159,7 @@ class MatlabLexer(RegexLexer):
              r'global|if|otherwise|parfor|persistent|return|switch|try|while)\b',
              Keyword),
 
-            ("(" + "|".join(elfun+specfun+elmat) + r')\b',  Name.Builtin),
+            (words(elfun + specfun + elmat, suffix=r'\b'), Name.Builtin),
 
             # operators:
             (r'-|==|~=|<|>|<=|>=|&&|&|~|\|\|?', Operator),
@@ -188,6 +189,9 @@ class MatlabLexer(RegexLexer):
         ],
     }
 
+    analyse_hint = r'\A\s*%|\A!\w'
+    analyse_default = 0.1
+
     def analyse_text(text):
         if re.match('^\s*%', text, re.M): # comment
             return 0.9
@@ -457,5 +461,7 @@ class SLexer(RegexLexer):
         ],
     }
 
+    analyse_hint = r'<-'
+
     def analyse_text(text):
         return '<-' in text
@@ -12,7 +12,7 @@
 import re
 
 from pygments.lexer import Lexer, RegexLexer, include, bygroups, using, \
-     this, do_insertions
+     this, do_insertions, builtin_names, words
 from pygments.token import Error, Punctuation, \
      Text, Comment, Operator, Keyword, Name, String, Number, Generic
 from pygments.util import shebang_matches
@@ -46,81 +46,107 @@ class SqlLexer(RegexLexer):
             (r'\s+', Text),
             (r'--.*?\n', Comment.Single),
             (r'/\*', Comment.Multiline, 'multiline-comments'),
-            (r'(ABORT|ABS|ABSOLUTE|ACCESS|ADA|ADD|ADMIN|AFTER|AGGREGATE|'
-             r'ALIAS|ALL|ALLOCATE|ALTER|ANALYSE|ANALYZE|AND|ANY|ARE|AS|'
-             r'ASC|ASENSITIVE|ASSERTION|ASSIGNMENT|ASYMMETRIC|AT|ATOMIC|'
-             r'AUTHORIZATION|AVG|BACKWARD|BEFORE|BEGIN|BETWEEN|BITVAR|'
-             r'BIT_LENGTH|BOTH|BREADTH|BY|C|CACHE|CALL|CALLED|CARDINALITY|'
-             r'CASCADE|CASCADED|CASE|CAST|CATALOG|CATALOG_NAME|CHAIN|'
-             r'CHARACTERISTICS|CHARACTER_LENGTH|CHARACTER_SET_CATALOG|'
-             r'CHARACTER_SET_NAME|CHARACTER_SET_SCHEMA|CHAR_LENGTH|CHECK|'
-             r'CHECKED|CHECKPOINT|CLASS|CLASS_ORIGIN|CLOB|CLOSE|CLUSTER|'
-             r'COALSECE|COBOL|COLLATE|COLLATION|COLLATION_CATALOG|'
-             r'COLLATION_NAME|COLLATION_SCHEMA|COLUMN|COLUMN_NAME|'
-             r'COMMAND_FUNCTION|COMMAND_FUNCTION_CODE|COMMENT|COMMIT|'
-             r'COMMITTED|COMPLETION|CONDITION_NUMBER|CONNECT|CONNECTION|'
-             r'CONNECTION_NAME|CONSTRAINT|CONSTRAINTS|CONSTRAINT_CATALOG|'
-             r'CONSTRAINT_NAME|CONSTRAINT_SCHEMA|CONSTRUCTOR|CONTAINS|'
-             r'CONTINUE|CONVERSION|CONVERT|COPY|CORRESPONTING|COUNT|'
-             r'CREATE|CREATEDB|CREATEUSER|CROSS|CUBE|CURRENT|CURRENT_DATE|'
-             r'CURRENT_PATH|CURRENT_ROLE|CURRENT_TIME|CURRENT_TIMESTAMP|'
-             r'CURRENT_USER|CURSOR|CURSOR_NAME|CYCLE|DATA|DATABASE|'
-             r'DATETIME_INTERVAL_CODE|DATETIME_INTERVAL_PRECISION|DAY|'
-             r'DEALLOCATE|DECLARE|DEFAULT|DEFAULTS|DEFERRABLE|DEFERRED|'
-             r'DEFINED|DEFINER|DELETE|DELIMITER|DELIMITERS|DEREF|DESC|'
-             r'DESCRIBE|DESCRIPTOR|DESTROY|DESTRUCTOR|DETERMINISTIC|'
-             r'DIAGNOSTICS|DICTIONARY|DISCONNECT|DISPATCH|DISTINCT|DO|'
-             r'DOMAIN|DROP|DYNAMIC|DYNAMIC_FUNCTION|DYNAMIC_FUNCTION_CODE|'
-             r'EACH|ELSE|ENCODING|ENCRYPTED|END|END-EXEC|EQUALS|ESCAPE|EVERY|'
-             r'EXCEPT|ESCEPTION|EXCLUDING|EXCLUSIVE|EXEC|EXECUTE|EXISTING|'
-             r'EXISTS|EXPLAIN|EXTERNAL|EXTRACT|FALSE|FETCH|FINAL|FIRST|FOR|'
-             r'FORCE|FOREIGN|FORTRAN|FORWARD|FOUND|FREE|FREEZE|FROM|FULL|'
-             r'FUNCTION|G|GENERAL|GENERATED|GET|GLOBAL|GO|GOTO|GRANT|GRANTED|'
-             r'GROUP|GROUPING|HANDLER|HAVING|HIERARCHY|HOLD|HOST|IDENTITY|'
-             r'IGNORE|ILIKE|IMMEDIATE|IMMUTABLE|IMPLEMENTATION|IMPLICIT|IN|'
-             r'INCLUDING|INCREMENT|INDEX|INDITCATOR|INFIX|INHERITS|INITIALIZE|'
-             r'INITIALLY|INNER|INOUT|INPUT|INSENSITIVE|INSERT|INSTANTIABLE|'
-             r'INSTEAD|INTERSECT|INTO|INVOKER|IS|ISNULL|ISOLATION|ITERATE|JOIN|'
-             r'KEY|KEY_MEMBER|KEY_TYPE|LANCOMPILER|LANGUAGE|LARGE|LAST|'
-             r'LATERAL|LEADING|LEFT|LENGTH|LESS|LEVEL|LIKE|LIMIT|LISTEN|LOAD|'
-             r'LOCAL|LOCALTIME|LOCALTIMESTAMP|LOCATION|LOCATOR|LOCK|LOWER|'
-             r'MAP|MATCH|MAX|MAXVALUE|MESSAGE_LENGTH|MESSAGE_OCTET_LENGTH|'
-             r'MESSAGE_TEXT|METHOD|MIN|MINUTE|MINVALUE|MOD|MODE|MODIFIES|'
-             r'MODIFY|MONTH|MORE|MOVE|MUMPS|NAMES|NATIONAL|NATURAL|NCHAR|'
-             r'NCLOB|NEW|NEXT|NO|NOCREATEDB|NOCREATEUSER|NONE|NOT|NOTHING|'
-             r'NOTIFY|NOTNULL|NULL|NULLABLE|NULLIF|OBJECT|OCTET_LENGTH|OF|OFF|'
-             r'OFFSET|OIDS|OLD|ON|ONLY|OPEN|OPERATION|OPERATOR|OPTION|OPTIONS|'
-             r'OR|ORDER|ORDINALITY|OUT|OUTER|OUTPUT|OVERLAPS|OVERLAY|OVERRIDING|'
-             r'OWNER|PAD|PARAMETER|PARAMETERS|PARAMETER_MODE|PARAMATER_NAME|'
-             r'PARAMATER_ORDINAL_POSITION|PARAMETER_SPECIFIC_CATALOG|'
-             r'PARAMETER_SPECIFIC_NAME|PARAMATER_SPECIFIC_SCHEMA|PARTIAL|'
-             r'PASCAL|PENDANT|PLACING|PLI|POSITION|POSTFIX|PRECISION|PREFIX|'
-             r'PREORDER|PREPARE|PRESERVE|PRIMARY|PRIOR|PRIVILEGES|PROCEDURAL|'
-             r'PROCEDURE|PUBLIC|READ|READS|RECHECK|RECURSIVE|REF|REFERENCES|'
-             r'REFERENCING|REINDEX|RELATIVE|RENAME|REPEATABLE|REPLACE|RESET|'
-             r'RESTART|RESTRICT|RESULT|RETURN|RETURNED_LENGTH|'
-             r'RETURNED_OCTET_LENGTH|RETURNED_SQLSTATE|RETURNS|REVOKE|RIGHT|'
-             r'ROLE|ROLLBACK|ROLLUP|ROUTINE|ROUTINE_CATALOG|ROUTINE_NAME|'
-             r'ROUTINE_SCHEMA|ROW|ROWS|ROW_COUNT|RULE|SAVE_POINT|SCALE|SCHEMA|'
-             r'SCHEMA_NAME|SCOPE|SCROLL|SEARCH|SECOND|SECURITY|SELECT|SELF|'
-             r'SENSITIVE|SERIALIZABLE|SERVER_NAME|SESSION|SESSION_USER|SET|'
-             r'SETOF|SETS|SHARE|SHOW|SIMILAR|SIMPLE|SIZE|SOME|SOURCE|SPACE|'
-             r'SPECIFIC|SPECIFICTYPE|SPECIFIC_NAME|SQL|SQLCODE|SQLERROR|'
-             r'SQLEXCEPTION|SQLSTATE|SQLWARNINIG|STABLE|START|STATE|STATEMENT|'
-             r'STATIC|STATISTICS|STDIN|STDOUT|STORAGE|STRICT|STRUCTURE|STYPE|'
-             r'SUBCLASS_ORIGIN|SUBLIST|SUBSTRING|SUM|SYMMETRIC|SYSID|SYSTEM|'
-             r'SYSTEM_USER|TABLE|TABLE_NAME| TEMP|TEMPLATE|TEMPORARY|TERMINATE|'
-             r'THAN|THEN|TIMESTAMP|TIMEZONE_HOUR|TIMEZONE_MINUTE|TO|TOAST|'
-             r'TRAILING|TRANSATION|TRANSACTIONS_COMMITTED|'
-             r'TRANSACTIONS_ROLLED_BACK|TRANSATION_ACTIVE|TRANSFORM|'
-             r'TRANSFORMS|TRANSLATE|TRANSLATION|TREAT|TRIGGER|TRIGGER_CATALOG|'
-             r'TRIGGER_NAME|TRIGGER_SCHEMA|TRIM|TRUE|TRUNCATE|TRUSTED|TYPE|'
-             r'UNCOMMITTED|UNDER|UNENCRYPTED|UNION|UNIQUE|UNKNOWN|UNLISTEN|'
-             r'UNNAMED|UNNEST|UNTIL|UPDATE|UPPER|USAGE|USER|'
-             r'USER_DEFINED_TYPE_CATALOG|USER_DEFINED_TYPE_NAME|'
-             r'USER_DEFINED_TYPE_SCHEMA|USING|VACUUM|VALID|VALIDATOR|VALUES|'
-             r'VARIABLE|VERBOSE|VERSION|VIEW|VOLATILE|WHEN|WHENEVER|WHERE|'
-             r'WITH|WITHOUT|WORK|WRITE|YEAR|ZONE)\b', Keyword),
+            (words((
+                'ABORT', 'ABS', 'ABSOLUTE', 'ACCESS', 'ADA', 'ADD', 'ADMIN',
+                'AFTER', 'AGGREGATE', 'ALIAS', 'ALL', 'ALLOCATE', 'ALTER',
+                'ANALYSE', 'ANALYZE', 'AND', 'ANY', 'ARE', 'AS', 'ASC',
+                'ASENSITIVE', 'ASSERTION', 'ASSIGNMENT', 'ASYMMETRIC', 'AT',
+                'ATOMIC', 'AUTHORIZATION', 'AVG', 'BACKWARD', 'BEFORE',
+                'BEGIN', 'BETWEEN', 'BITVAR', 'BIT_LENGTH', 'BOTH', 'BREADTH',
+                'BY', 'C', 'CACHE', 'CALL', 'CALLED', 'CARDINALITY', 'CASCADE',
+                'CASCADED', 'CASE', 'CAST', 'CATALOG', 'CATALOG_NAME', 'CHAIN',
+                'CHARACTERISTICS', 'CHARACTER_LENGTH', 'CHARACTER_SET_CATALOG',
+                'CHARACTER_SET_NAME', 'CHARACTER_SET_SCHEMA', 'CHAR_LENGTH',
+                'CHECK', 'CHECKED', 'CHECKPOINT', 'CLASS', 'CLASS_ORIGIN',
+                'CLOB', 'CLOSE', 'CLUSTER', 'COALSECE', 'COBOL', 'COLLATE',
+                'COLLATION', 'COLLATION_CATALOG', 'COLLATION_NAME',
+                'COLLATION_SCHEMA', 'COLUMN', 'COLUMN_NAME',
+                'COMMAND_FUNCTION', 'COMMAND_FUNCTION_CODE', 'COMMENT',
+                'COMMIT', 'COMMITTED', 'COMPLETION', 'CONDITION_NUMBER',
+                'CONNECT', 'CONNECTION', 'CONNECTION_NAME', 'CONSTRAINT',
+                'CONSTRAINTS', 'CONSTRAINT_CATALOG', 'CONSTRAINT_NAME',
+                'CONSTRAINT_SCHEMA', 'CONSTRUCTOR', 'CONTAINS', 'CONTINUE',
+                'CONVERSION', 'CONVERT', 'COPY', 'CORRESPONTING', 'COUNT',
+                'CREATE', 'CREATEDB', 'CREATEUSER', 'CROSS', 'CUBE', 'CURRENT',
+                'CURRENT_DATE', 'CURRENT_PATH', 'CURRENT_ROLE', 'CURRENT_TIME',
+                'CURRENT_TIMESTAMP', 'CURRENT_USER', 'CURSOR', 'CURSOR_NAME',
+                'CYCLE', 'DATA', 'DATABASE', 'DATETIME_INTERVAL_CODE',
+                'DATETIME_INTERVAL_PRECISION', 'DAY', 'DEALLOCATE', 'DECLARE',
+                'DEFAULT', 'DEFAULTS', 'DEFERRABLE', 'DEFERRED', 'DEFINED',
+                'DEFINER', 'DELETE', 'DELIMITER', 'DELIMITERS', 'DEREF',
+                'DESC', 'DESCRIBE', 'DESCRIPTOR', 'DESTROY', 'DESTRUCTOR',
+                'DETERMINISTIC', 'DIAGNOSTICS', 'DICTIONARY', 'DISCONNECT',
+                'DISPATCH', 'DISTINCT', 'DO', 'DOMAIN', 'DROP', 'DYNAMIC',
+                'DYNAMIC_FUNCTION', 'DYNAMIC_FUNCTION_CODE', 'EACH', 'ELSE',
+                'ENCODING', 'ENCRYPTED', 'END', 'EQUALS', 'ESCAPE', 'EVERY',
+                'EXCEPT', 'ESCEPTION', 'EXCLUDING', 'EXCLUSIVE', 'EXEC',
+                'EXECUTE', 'EXISTING', 'EXISTS', 'EXPLAIN', 'EXTERNAL',
+                'EXTRACT', 'FALSE', 'FETCH', 'FINAL', 'FIRST', 'FOR', 'FORCE',
+                'FOREIGN', 'FORTRAN', 'FORWARD', 'FOUND', 'FREE', 'FREEZE',
+                'FROM', 'FULL', 'FUNCTION', 'G', 'GENERAL', 'GENERATED', 'GET',
+                'GLOBAL', 'GO', 'GOTO', 'GRANT', 'GRANTED', 'GROUP',
+                'GROUPING', 'HANDLER', 'HAVING', 'HIERARCHY', 'HOLD', 'HOST',
+                'IDENTITY', 'IGNORE', 'ILIKE', 'IMMEDIATE', 'IMMUTABLE',
+                'IMPLEMENTATION', 'IMPLICIT', 'IN', 'INCLUDING', 'INCREMENT',
+                'INDEX', 'INDITCATOR', 'INFIX', 'INHERITS', 'INITIALIZE',
+                'INITIALLY', 'INNER', 'INOUT', 'INPUT', 'INSENSITIVE',
+                'INSERT', 'INSTANTIABLE', 'INSTEAD', 'INTERSECT', 'INTO',
+                'INVOKER', 'IS', 'ISNULL', 'ISOLATION', 'ITERATE', 'JOIN',
+                'KEY', 'KEY_MEMBER', 'KEY_TYPE', 'LANCOMPILER', 'LANGUAGE',
+                'LARGE', 'LAST', 'LATERAL', 'LEADING', 'LEFT', 'LENGTH',
+                'LESS', 'LEVEL', 'LIKE', 'LIMIT', 'LISTEN', 'LOAD', 'LOCAL',
+                'LOCALTIME', 'LOCALTIMESTAMP', 'LOCATION', 'LOCATOR', 'LOCK',
+                'LOWER', 'MAP', 'MATCH', 'MAX', 'MAXVALUE', 'MESSAGE_LENGTH',
+                'MESSAGE_OCTET_LENGTH', 'MESSAGE_TEXT', 'METHOD', 'MIN',
+                'MINUTE', 'MINVALUE', 'MOD', 'MODE', 'MODIFIES', 'MODIFY',
+                'MONTH', 'MORE', 'MOVE', 'MUMPS', 'NAMES', 'NATIONAL',
+                'NATURAL', 'NCHAR', 'NCLOB', 'NEW', 'NEXT', 'NO', 'NOCREATEDB',
+                'NOCREATEUSER', 'NONE', 'NOT', 'NOTHING', 'NOTIFY', 'NOTNULL',
+                'NULL', 'NULLABLE', 'NULLIF', 'OBJECT', 'OCTET_LENGTH', 'OF',
+                'OFF', 'OFFSET', 'OIDS', 'OLD', 'ON', 'ONLY', 'OPEN',
+                'OPERATION', 'OPERATOR', 'OPTION', 'OPTIONS', 'OR', 'ORDER',
+                'ORDINALITY', 'OUT', 'OUTER', 'OUTPUT', 'OVERLAPS', 'OVERLAY',
+                'OVERRIDING', 'OWNER', 'PAD', 'PARAMETER', 'PARAMETERS',
+                'PARAMETER_MODE', 'PARAMATER_NAME',
+                'PARAMATER_ORDINAL_POSITION', 'PARAMETER_SPECIFIC_CATALOG',
+                'PARAMETER_SPECIFIC_NAME', 'PARAMATER_SPECIFIC_SCHEMA',
+                'PARTIAL', 'PASCAL', 'PENDANT', 'PLACING', 'PLI', 'POSITION',
+                'POSTFIX', 'PRECISION', 'PREFIX', 'PREORDER', 'PREPARE',
+                'PRESERVE', 'PRIMARY', 'PRIOR', 'PRIVILEGES', 'PROCEDURAL',
+                'PROCEDURE', 'PUBLIC', 'READ', 'READS', 'RECHECK', 'RECURSIVE',
+                'REF', 'REFERENCES', 'REFERENCING', 'REINDEX', 'RELATIVE',
+                'RENAME', 'REPEATABLE', 'REPLACE', 'RESET', 'RESTART',
+                'RESTRICT', 'RESULT', 'RETURN', 'RETURNED_LENGTH',
+                'RETURNED_OCTET_LENGTH', 'RETURNED_SQLSTATE', 'RETURNS',
+                'REVOKE', 'RIGHT', 'ROLE', 'ROLLBACK', 'ROLLUP', 'ROUTINE',
+                'ROUTINE_CATALOG', 'ROUTINE_NAME', 'ROUTINE_SCHEMA', 'ROW',
+                'ROWS', 'ROW_COUNT', 'RULE', 'SAVE_POINT', 'SCALE', 'SCHEMA',
+                'SCHEMA_NAME', 'SCOPE', 'SCROLL', 'SEARCH', 'SECOND',
+                'SECURITY', 'SELECT', 'SELF', 'SENSITIVE', 'SERIALIZABLE',
+                'SERVER_NAME', 'SESSION', 'SESSION_USER', 'SET', 'SETOF',
+                'SETS', 'SHARE', 'SHOW', 'SIMILAR', 'SIMPLE', 'SIZE', 'SOME',
+                'SOURCE', 'SPACE', 'SPECIFIC', 'SPECIFICTYPE', 'SPECIFIC_NAME',
+                'SQL', 'SQLCODE', 'SQLERROR', 'SQLEXCEPTION', 'SQLSTATE',
+                'SQLWARNINIG', 'STABLE', 'START', 'STATE', 'STATEMENT',
+                'STATIC', 'STATISTICS', 'STDIN', 'STDOUT', 'STORAGE', 'STRICT',
+                'STRUCTURE', 'STYPE', 'SUBCLASS_ORIGIN', 'SUBLIST',
+                'SUBSTRING', 'SUM', 'SYMMETRIC', 'SYSID', 'SYSTEM',
+                'SYSTEM_USER', 'TABLE', 'TABLE_NAME', ' TEMP', 'TEMPLATE',
+                'TEMPORARY', 'TERMINATE', 'THAN', 'THEN', 'TIMESTAMP',
+                'TIMEZONE_HOUR', 'TIMEZONE_MINUTE', 'TO', 'TOAST', 'TRAILING',
+                'TRANSATION', 'TRANSACTIONS_COMMITTED',
+                'TRANSACTIONS_ROLLED_BACK', 'TRANSATION_ACTIVE', 'TRANSFORM',
+                'TRANSFORMS', 'TRANSLATE', 'TRANSLATION', 'TREAT', 'TRIGGER',
+                'TRIGGER_CATALOG', 'TRIGGER_NAME', 'TRIGGER_SCHEMA', 'TRIM',
+                'TRUE', 'TRUNCATE', 'TRUSTED', 'TYPE', 'UNCOMMITTED', 'UNDER',
+                'UNENCRYPTED', 'UNION', 'UNIQUE', 'UNKNOWN', 'UNLISTEN',
+                'UNNAMED', 'UNNEST', 'UNTIL', 'UPDATE', 'UPPER', 'USAGE',
+                'USER', 'USER_DEFINED_TYPE_CATALOG', 'USER_DEFINED_TYPE_NAME',
+                'USER_DEFINED_TYPE_SCHEMA', 'USING', 'VACUUM', 'VALID',
+                'VALIDATOR', 'VALUES', 'VARIABLE', 'VERBOSE', 'VERSION',
+                'VIEW', 'VOLATILE', 'WHEN', 'WHENEVER', 'WHERE', 'WITH',
+                'WITHOUT', 'WORK', 'WRITE', 'YEAR', 'ZONE'),
+                suffix=r'\b'), Keyword),
             (r'(ARRAY|BIGINT|BINARY|BIT|BLOB|BOOLEAN|CHAR|CHARACTER|DATE|'
              r'DEC|DECIMAL|FLOAT|INT|INTEGER|INTERVAL|NUMBER|NUMERIC|REAL|'
              r'SERIAL|SMALLINT|VARCHAR|VARYING|INT8|SERIAL8|TEXT)\b',
@@ -170,34 +196,46 @@ class MySqlLexer(RegexLexer):
              r'precision|real|numeric|dec|decimal|timestamp|year|char|'
              r'varchar|varbinary|varcharacter|enum|set)(\b\s*)(\()?',
              bygroups(Keyword.Type, Text, Punctuation)),
-            (r'\b(add|all|alter|analyze|and|as|asc|asensitive|before|between|'
-             r'bigint|binary|blob|both|by|call|cascade|case|change|char|'
-             r'character|check|collate|column|condition|constraint|continue|'
-             r'convert|create|cross|current_date|current_time|'
-             r'current_timestamp|current_user|cursor|database|databases|'
-             r'day_hour|day_microsecond|day_minute|day_second|dec|decimal|'
-             r'declare|default|delayed|delete|desc|describe|deterministic|'
-             r'distinct|distinctrow|div|double|drop|dual|each|else|elseif|'
-             r'enclosed|escaped|exists|exit|explain|fetch|float|float4|float8'
-             r'|for|force|foreign|from|fulltext|grant|group|having|'
-             r'high_priority|hour_microsecond|hour_minute|hour_second|if|'
-             r'ignore|in|index|infile|inner|inout|insensitive|insert|int|'
-             r'int1|int2|int3|int4|int8|integer|interval|into|is|iterate|'
-             r'join|key|keys|kill|leading|leave|left|like|limit|lines|load|'
-             r'localtime|localtimestamp|lock|long|loop|low_priority|match|'
-             r'minute_microsecond|minute_second|mod|modifies|natural|'
-             r'no_write_to_binlog|not|numeric|on|optimize|option|optionally|'
-             r'or|order|out|outer|outfile|precision|primary|procedure|purge|'
-             r'raid0|read|reads|real|references|regexp|release|rename|repeat|'
-             r'replace|require|restrict|return|revoke|right|rlike|schema|'
-             r'schemas|second_microsecond|select|sensitive|separator|set|'
-             r'show|smallint|soname|spatial|specific|sql|sql_big_result|'
-             r'sql_calc_found_rows|sql_small_result|sqlexception|sqlstate|'
-             r'sqlwarning|ssl|starting|straight_join|table|terminated|then|'
-             r'to|trailing|trigger|undo|union|unique|unlock|unsigned|update|'
-             r'usage|use|using|utc_date|utc_time|utc_timestamp|values|'
-             r'varying|when|where|while|with|write|x509|xor|year_month|'
-             r'zerofill)\b', Keyword),
+            (words((
+                'add', 'all', 'alter', 'analyze', 'and', 'as', 'asc',
+                'asensitive', 'before', 'between', 'bigint', 'binary', 'blob',
+                'both', 'by', 'call', 'cascade', 'case', 'change', 'char',
+                'character', 'check', 'collate', 'column', 'condition',
+                'constraint', 'continue', 'convert', 'create', 'cross',
+                'current_date', 'current_time', 'current_timestamp',
+                'current_user', 'cursor', 'database', 'databases', 'day_hour',
+                'day_microsecond', 'day_minute', 'day_second', 'dec',
+                'decimal', 'declare', 'default', 'delayed', 'delete', 'desc',
+                'describe', 'deterministic', 'distinct', 'distinctrow', 'div',
+                'double', 'drop', 'dual', 'each', 'else', 'elseif', 'enclosed',
+                'escaped', 'exists', 'exit', 'explain', 'fetch', 'float',
+                'float4', 'float8', 'for', 'force', 'foreign', 'from',
+                'fulltext', 'grant', 'group', 'having', 'high_priority',
+                'hour_microsecond', 'hour_minute', 'hour_second', 'if',
+                'ignore', 'in', 'index', 'infile', 'inner', 'inout',
+                'insensitive', 'insert', 'int', 'int1', 'int2', 'int3', 'int4',
+                'int8', 'integer', 'interval', 'into', 'is', 'iterate', 'join',
+                'key', 'keys', 'kill', 'leading', 'leave', 'left', 'like',
+                'limit', 'lines', 'load', 'localtime', 'localtimestamp',
+                'lock', 'long', 'loop', 'low_priority', 'match',
+                'minute_microsecond', 'minute_second', 'mod', 'modifies',
+                'natural', 'no_write_to_binlog', 'not', 'numeric', 'on',
+                'optimize', 'option', 'optionally', 'or', 'order', 'out',
+                'outer', 'outfile', 'precision', 'primary', 'procedure',
+                'purge', 'raid0', 'read', 'reads', 'real', 'references',
+                'regexp', 'release', 'rename', 'repeat', 'replace', 'require',
+                'restrict', 'return', 'revoke', 'right', 'rlike', 'schema',
+                'schemas', 'second_microsecond', 'select', 'sensitive',
+                'separator', 'set', 'show', 'smallint', 'soname', 'spatial',
+                'specific', 'sql', 'sql_big_result', 'sql_calc_found_rows',
+                'sql_small_result', 'sqlexception', 'sqlstate', 'sqlwarning',
+                'ssl', 'starting', 'straight_join', 'table', 'terminated',
+                'then', 'to', 'trailing', 'trigger', 'undo', 'union', 'unique',
+                'unlock', 'unsigned', 'update', 'usage', 'use', 'using',
+                'utc_date', 'utc_time', 'utc_timestamp', 'values', 'varying',
+                'when', 'where', 'while', 'with', 'write', 'x509', 'xor',
+                'year_month', 'zerofill'),
+                prefix=r'\b', suffix=r'\b'), Keyword),
             # TODO: this list is not complete
             (r'\b(auto_increment|engine|charset|tables)\b', Keyword.Pseudo),
             (r'(true|false|null)', Name.Constant),
@@ -344,12 +382,16 @@ class BashLexer(RegexLexer):
             (r'\b(if|fi|else|while|do|done|for|then|return|function|case|'
              r'select|continue|until|esac|elif)\s*\b',
              Keyword),
-            (r'\b(alias|bg|bind|break|builtin|caller|cd|command|compgen|'
-             r'complete|declare|dirs|disown|echo|enable|eval|exec|exit|'
-             r'export|false|fc|fg|getopts|hash|help|history|jobs|kill|let|'
-             r'local|logout|popd|printf|pushd|pwd|read|readonly|set|shift|'
-             r'shopt|source|suspend|test|time|times|trap|true|type|typeset|'
-             r'ulimit|umask|unalias|unset|wait)\s*\b(?!\.)',
+            (words((
+                'alias', 'bg', 'bind', 'break', 'builtin', 'caller', 'cd',
+                'command', 'compgen', 'complete', 'declare', 'dirs', 'disown',
+                'echo', 'enable', 'eval', 'exec', 'exit', 'export', 'false',
+                'fc', 'fg', 'getopts', 'hash', 'help', 'history', 'jobs',
+                'kill', 'let', 'local', 'logout', 'popd', 'printf', 'pushd',
+                'pwd', 'read', 'readonly', 'set', 'shift', 'shopt', 'source',
+                'suspend', 'test', 'time', 'times', 'trap', 'true', 'type',
+                'typeset', 'ulimit', 'umask', 'unalias', 'unset', 'wait'),
+                prefix=r'\b', suffix=r'\s*\b(?!\.)'),
              Name.Builtin),
             (r'#.*\n', Comment),
             (r'\\[\w\W]', String.Escape),
@@ -392,6 +434,8 @@ class BashLexer(RegexLexer):
         ],
     }
 
+    analyse_hint = r'\A#!'
+
     def analyse_text(text):
         return shebang_matches(text, r'(ba|z|)sh')
 
@@ -728,15 +772,21 @@ class TcshLexer(RegexLexer):
             (r'\b(if|endif|else|while|then|foreach|case|default|'
              r'continue|goto|breaksw|end|switch|endsw)\s*\b',
              Keyword),
-            (r'\b(alias|alloc|bg|bindkey|break|builtins|bye|caller|cd|chdir|'
-             r'complete|dirs|echo|echotc|eval|exec|exit|'
-             r'fg|filetest|getxvers|glob|getspath|hashstat|history|hup|inlib|jobs|kill|'
-             r'limit|log|login|logout|ls-F|migrate|newgrp|nice|nohup|notify|'
-             r'onintr|popd|printenv|pushd|rehash|repeat|rootnode|popd|pushd|set|shift|'
-             r'sched|setenv|setpath|settc|setty|setxvers|shift|source|stop|suspend|'
-             r'source|suspend|telltc|time|'
-             r'umask|unalias|uncomplete|unhash|universe|unlimit|unset|unsetenv|'
-             r'ver|wait|warp|watchlog|where|which)\s*\b',
+            (words((
+                'alias', 'alloc', 'bg', 'bindkey', 'break', 'builtins', 'bye',
+                'caller', 'cd', 'chdir', 'complete', 'dirs', 'echo', 'echotc',
+                'eval', 'exec', 'exit', 'fg', 'filetest', 'getxvers', 'glob',
+                'getspath', 'hashstat', 'history', 'hup', 'inlib', 'jobs',
+                'kill', 'limit', 'log', 'login', 'logout', 'ls-F', 'migrate',
+                'newgrp', 'nice', 'nohup', 'notify', 'onintr', 'popd',
+                'printenv', 'pushd', 'rehash', 'repeat', 'rootnode', 'popd',
+                'pushd', 'set', 'shift', 'sched', 'setenv', 'setpath', 'settc',
+                'setty', 'setxvers', 'shift', 'source', 'stop', 'suspend',
+                'source', 'suspend', 'telltc', 'time', 'umask', 'unalias',
+                'uncomplete', 'unhash', 'universe', 'unlimit', 'unset',
+                'unsetenv', 'ver', 'wait', 'warp', 'watchlog', 'where',
+                'which'),
+                prefix=r'\b', suffix=r'\s*\b'),
              Name.Builtin),
             (r'#.*\n', Comment),
             (r'\\[\w\W]', String.Escape),
@@ -801,77 +851,81 @@ class LogtalkLexer(RegexLexer):
             (r'\d+\.?\d*((e|E)(\+|-)?\d+)?', Number),
             # Variables
             (r'([A-Z_][a-zA-Z0-9_]*)', Name.Variable),
-            # Event handlers
-            (r'(after|before)(?=[(])', Keyword),
-            # Execution-context methods
-            (r'(parameter|this|se(lf|nder))(?=[(])', Keyword),
-            # Reflection
-            (r'(current_predicate|predicate_property)(?=[(])', Keyword),
-            # DCGs and term expansion
-            (r'(expand_(goal|term)|(goal|term)_expansion|phrase)(?=[(])',
-             Keyword),
-            # Entity
-            (r'(abolish|c(reate|urrent))_(object|protocol|category)(?=[(])',
-             Keyword),
-            (r'(object|protocol|category)_property(?=[(])', Keyword),
-            # Entity relations
-            (r'complements_object(?=[(])', Keyword),
-            (r'extends_(object|protocol|category)(?=[(])', Keyword),
-            (r'imp(lements_protocol|orts_category)(?=[(])', Keyword),
-            (r'(instantiat|specializ)es_class(?=[(])', Keyword),
-            # Events
-            (r'(current_event|(abolish|define)_events)(?=[(])', Keyword),
-            # Flags
-            (r'(current|set)_logtalk_flag(?=[(])', Keyword),
-            # Compiling, loading, and library paths
-            (r'logtalk_(compile|l(ibrary_path|oad))(?=[(])', Keyword),
-            # Database
-            (r'(clause|retract(all)?)(?=[(])', Keyword),
-            (r'a(bolish|ssert(a|z))(?=[(])', Keyword),
+            # Built-in predicates and methods
+            (words((
+                # Event handlers
+                'after', 'before',
+                # Execution-context methods
+                'parameter', 'this', 'self', 'sender',
+                # Reflection
+                'current_predicate', 'predicate_property',
+                # DCGs and term expansion
+                'expand_goal', 'expand_term', 'goal_expansion',
+                'term_expansion', 'phrase',
+                # Entity
+                'abolish_object', 'abolish_protocol', 'abolish_category',
+                'create_object', 'create_protocol', 'create_category',
+                'current_object', 'current_protocol', 'current_category',
+                'object_property', 'protocol_property', 'category_property',
+                # Entity relations
+                'complements_object', 'extends_object', 'extends_protocol',
+                'extends_category', 'implements_protocol', 'imports_category',
+                'instantiates_class', 'specializes_class',
+                # Events
+                'current_event', 'abolish_events', 'define_events',
+                # Flags
+                'current_logtalk_flag', 'set_logtalk_flag',
+                # Compiling, loading, and library paths
+                'logtalk_compile', 'logtalk_library_path', 'logtalk_load',
+                # Database
+                'clause', 'retract', 'retractall', 'abolish', 'asserta',
+                'assertz',
+                # Control
+                'call', 'catch', 'throw',
+                # All solutions
+                'bagof', 'setof', 'findall', 'forall',
+                # Multi-threading meta-predicates
+                'threaded', 'threaded_call', 'threaded_once',
+                'threaded_ignore', 'threaded_exit', 'threaded_peek',
+                'threaded_wait', 'threaded_notify',
+                # Term unification
+                'unify_with_occurs_check',
+                # Term creation and decomposition
+                'functor', 'arg', 'copy_term',
+                # Evaluable functors
+                'rem', 'mod', 'abs', 'sign', 'float', 'float_integer_part',
+                'float_fractional_part', 'floor', 'truncate', 'round',
+                'ceiling',
+                # Other arithmetic functors
+                'cos', 'atan', 'exp', 'log', 'sin', 'sqrt',
+                # Term testing
+                'var', 'atom', 'atomic', 'integer', 'compound', 'nonvar',
+                'number',
+                # Stream selection and control
+                'current_input', 'current_output', 'set_input', 'set_output',
+                'open', 'close', 'flush_output', 'stream_property',
+                'at_end_of_stream', 'set_stream_position',
+                # Character and byte input/output
+                'nl', 'get_byte', 'get_char', 'get_code', 'peek_byte',
+                'peek_char', 'peek_code', 'put_byte', 'put_char', 'put_code',
+                # Term input/output
+                'read', 'read_term', 'write', 'writeq', 'write_canonical',
+                'write_term', 'op', 'current_op', 'char_conversion',
+                'current_char_conversion',
+                # Atomic term processing
+                'atom_length', 'atom_chars', 'atom_concat', 'atom_codes',
+                'char_code', 'sub_atom', 'number_chars', 'number_codes',
+                # Implementation defined hooks functions
+                'set_prolog_flag', 'current_prolog_flag', 'halt'),
+                suffix=r'(?=[(])'), Keyword),
             # Control
-            (r'(ca(ll|tch)|throw)(?=[(])', Keyword),
             (r'(fail|true)\b', Keyword),
-            # All solutions
-            (r'((bag|set)of|f(ind|or)all)(?=[(])', Keyword),
-            # Multi-threading meta-predicates
-            (r'threaded(_(call|once|ignore|exit|peek|wait|notify))?(?=[(])',
-             Keyword),
-            # Term unification
-            (r'unify_with_occurs_check(?=[(])', Keyword),
-            # Term creation and decomposition
-            (r'(functor|arg|copy_term)(?=[(])', Keyword),
-            # Evaluable functors
-            (r'(rem|mod|abs|sign)(?=[(])', Keyword),
-            (r'float(_(integer|fractional)_part)?(?=[(])', Keyword),
-            (r'(floor|truncate|round|ceiling)(?=[(])', Keyword),
-            # Other arithmetic functors
-            (r'(cos|atan|exp|log|s(in|qrt))(?=[(])', Keyword),
-            # Term testing
-            (r'(var|atom(ic)?|integer|float|compound|n(onvar|umber))(?=[(])',
-             Keyword),
             # Stream selection and control
-            (r'(curren|se)t_(in|out)put(?=[(])', Keyword),
-            (r'(open|close)(?=[(])', Keyword),
-            (r'flush_output(?=[(])', Keyword),
             (r'(at_end_of_stream|flush_output)\b', Keyword),
-            (r'(stream_property|at_end_of_stream|set_stream_position)(?=[(])',
-             Keyword),
             # Character and byte input/output
-            (r'(nl|(get|peek|put)_(byte|c(har|ode)))(?=[(])', Keyword),
             (r'\bnl\b', Keyword),
-            # Term input/output
-            (r'read(_term)?(?=[(])', Keyword),
-            (r'write(q|_(canonical|term))?(?=[(])', Keyword),
-            (r'(current_)?op(?=[(])', Keyword),
-            (r'(current_)?char_conversion(?=[(])', Keyword),
-            # Atomic term processing
-            (r'atom_(length|c(hars|o(ncat|des)))(?=[(])', Keyword),
-            (r'(char_code|sub_atom)(?=[(])', Keyword),
-            (r'number_c(har|ode)s(?=[(])', Keyword),
             # Implementation defined hooks functions
-            (r'(se|curren)t_prolog_flag(?=[(])', Keyword),
             (r'\bhalt\b', Keyword),
-            (r'halt(?=[(])', Keyword),
             # Message sending operators
             (r'(::|:|\^\^)', Operator),
             # External call
@@ -973,6 +1027,8 @@ class LogtalkLexer(RegexLexer):
         ]
     }
 
+    analyse_hint = r':- '
+
     def analyse_text(text):
         if ':- object(' in text:
             return True
@@ -1169,54 +1225,70 @@ class PovrayLexer(RegexLexer):
              r'include|range|read|render|statistics|switch|undef|version|'
              r'warning|while|write|define|macro|local|declare)',
              Comment.Preproc),
-            (r'\b(aa_level|aa_threshold|abs|acos|acosh|adaptive|adc_bailout|'
-             r'agate|agate_turb|all|alpha|ambient|ambient_light|angle|'
-             r'aperture|arc_angle|area_light|asc|asin|asinh|assumed_gamma|'
-             r'atan|atan2|atanh|atmosphere|atmospheric_attenuation|'
-             r'attenuating|average|background|black_hole|blue|blur_samples|'
-             r'bounded_by|box_mapping|bozo|break|brick|brick_size|'
-             r'brightness|brilliance|bumps|bumpy1|bumpy2|bumpy3|bump_map|'
-             r'bump_size|case|caustics|ceil|checker|chr|clipped_by|clock|'
-             r'color|color_map|colour|colour_map|component|composite|concat|'
-             r'confidence|conic_sweep|constant|control0|control1|cos|cosh|'
-             r'count|crackle|crand|cube|cubic_spline|cylindrical_mapping|'
-             r'debug|declare|default|degrees|dents|diffuse|direction|'
-             r'distance|distance_maximum|div|dust|dust_type|eccentricity|'
-             r'else|emitting|end|error|error_bound|exp|exponent|'
-             r'fade_distance|fade_power|falloff|falloff_angle|false|'
-             r'file_exists|filter|finish|fisheye|flatness|flip|floor|'
-             r'focal_point|fog|fog_alt|fog_offset|fog_type|frequency|gif|'
-             r'global_settings|glowing|gradient|granite|gray_threshold|'
-             r'green|halo|hexagon|hf_gray_16|hierarchy|hollow|hypercomplex|'
-             r'if|ifdef|iff|image_map|incidence|include|int|interpolate|'
-             r'inverse|ior|irid|irid_wavelength|jitter|lambda|leopard|'
-             r'linear|linear_spline|linear_sweep|location|log|looks_like|'
-             r'look_at|low_error_factor|mandel|map_type|marble|material_map|'
-             r'matrix|max|max_intersections|max_iteration|max_trace_level|'
-             r'max_value|metallic|min|minimum_reuse|mod|mortar|'
-             r'nearest_count|no|normal|normal_map|no_shadow|number_of_waves|'
-             r'octaves|off|offset|omega|omnimax|on|once|onion|open|'
-             r'orthographic|panoramic|pattern1|pattern2|pattern3|'
-             r'perspective|pgm|phase|phong|phong_size|pi|pigment|'
-             r'pigment_map|planar_mapping|png|point_at|pot|pow|ppm|'
-             r'precision|pwr|quadratic_spline|quaternion|quick_color|'
-             r'quick_colour|quilted|radial|radians|radiosity|radius|rainbow|'
-             r'ramp_wave|rand|range|reciprocal|recursion_limit|red|'
-             r'reflection|refraction|render|repeat|rgb|rgbf|rgbft|rgbt|'
-             r'right|ripples|rotate|roughness|samples|scale|scallop_wave|'
-             r'scattering|seed|shadowless|sin|sine_wave|sinh|sky|sky_sphere|'
-             r'slice|slope_map|smooth|specular|spherical_mapping|spiral|'
-             r'spiral1|spiral2|spotlight|spotted|sqr|sqrt|statistics|str|'
-             r'strcmp|strength|strlen|strlwr|strupr|sturm|substr|switch|sys|'
-             r't|tan|tanh|test_camera_1|test_camera_2|test_camera_3|'
-             r'test_camera_4|texture|texture_map|tga|thickness|threshold|'
-             r'tightness|tile2|tiles|track|transform|translate|transmit|'
-             r'triangle_wave|true|ttf|turbulence|turb_depth|type|'
-             r'ultra_wide_angle|up|use_color|use_colour|use_index|u_steps|'
-             r'val|variance|vaxis_rotate|vcross|vdot|version|vlength|'
-             r'vnormalize|volume_object|volume_rendered|vol_with_light|'
-             r'vrotate|v_steps|warning|warp|water_level|waves|while|width|'
-             r'wood|wrinkles|yes)\b', Keyword),
+            (words((
+                'aa_level', 'aa_threshold', 'abs', 'acos', 'acosh', 'adaptive',
+                'adc_bailout', 'agate', 'agate_turb', 'all', 'alpha',
+                'ambient', 'ambient_light', 'angle', 'aperture', 'arc_angle',
+                'area_light', 'asc', 'asin', 'asinh', 'assumed_gamma', 'atan',
+                'atan2', 'atanh', 'atmosphere', 'atmospheric_attenuation',
+                'attenuating', 'average', 'background', 'black_hole', 'blue',
+                'blur_samples', 'bounded_by', 'box_mapping', 'bozo', 'break',
+                'brick', 'brick_size', 'brightness', 'brilliance', 'bumps',
+                'bumpy1', 'bumpy2', 'bumpy3', 'bump_map', 'bump_size', 'case',
+                'caustics', 'ceil', 'checker', 'chr', 'clipped_by', 'clock',
+                'color', 'color_map', 'colour', 'colour_map', 'component',
+                'composite', 'concat', 'confidence', 'conic_sweep', 'constant',
+                'control0', 'control1', 'cos', 'cosh', 'count', 'crackle',
+                'crand', 'cube', 'cubic_spline', 'cylindrical_mapping',
+                'debug', 'declare', 'default', 'degrees', 'dents', 'diffuse',
+                'direction', 'distance', 'distance_maximum', 'div', 'dust',
+                'dust_type', 'eccentricity', 'else', 'emitting', 'end',
+                'error', 'error_bound', 'exp', 'exponent', 'fade_distance',
+                'fade_power', 'falloff', 'falloff_angle', 'false',
+                'file_exists', 'filter', 'finish', 'fisheye', 'flatness',
+                'flip', 'floor', 'focal_point', 'fog', 'fog_alt', 'fog_offset',
+                'fog_type', 'frequency', 'gif', 'global_settings', 'glowing',
+                'gradient', 'granite', 'gray_threshold', 'green', 'halo',
+                'hexagon', 'hf_gray_16', 'hierarchy', 'hollow', 'hypercomplex',
+                'if', 'ifdef', 'iff', 'image_map', 'incidence', 'include',
+                'int', 'interpolate', 'inverse', 'ior', 'irid',
+                'irid_wavelength', 'jitter', 'lambda', 'leopard', 'linear',
+                'linear_spline', 'linear_sweep', 'location', 'log',
+                'looks_like', 'look_at', 'low_error_factor', 'mandel',
+                'map_type', 'marble', 'material_map', 'matrix', 'max',
+                'max_intersections', 'max_iteration', 'max_trace_level',
+                'max_value', 'metallic', 'min', 'minimum_reuse', 'mod',
+                'mortar', 'nearest_count', 'no', 'normal', 'normal_map',
+                'no_shadow', 'number_of_waves', 'octaves', 'off', 'offset',
+                'omega', 'omnimax', 'on', 'once', 'onion', 'open',
+                'orthographic', 'panoramic', 'pattern1', 'pattern2',
+                'pattern3', 'perspective', 'pgm', 'phase', 'phong',
+                'phong_size', 'pi', 'pigment', 'pigment_map', 'planar_mapping',
+                'png', 'point_at', 'pot', 'pow', 'ppm', 'precision', 'pwr',
+                'quadratic_spline', 'quaternion', 'quick_color',
+                'quick_colour', 'quilted', 'radial', 'radians', 'radiosity',
+                'radius', 'rainbow', 'ramp_wave', 'rand', 'range',
+                'reciprocal', 'recursion_limit', 'red', 'reflection',
+                'refraction', 'render', 'repeat', 'rgb', 'rgbf', 'rgbft',
+                'rgbt', 'right', 'ripples', 'rotate', 'roughness', 'samples',
+                'scale', 'scallop_wave', 'scattering', 'seed', 'shadowless',
+                'sin', 'sine_wave', 'sinh', 'sky', 'sky_sphere', 'slice',
+                'slope_map', 'smooth', 'specular', 'spherical_mapping',
+                'spiral', 'spiral1', 'spiral2', 'spotlight', 'spotted', 'sqr',
+                'sqrt', 'statistics', 'str', 'strcmp', 'strength', 'strlen',
+                'strlwr', 'strupr', 'sturm', 'substr', 'switch', 'sys', 't',
+                'tan', 'tanh', 'test_camera_1', 'test_camera_2',
+                'test_camera_3', 'test_camera_4', 'texture', 'texture_map',
+                'tga', 'thickness', 'threshold', 'tightness', 'tile2', 'tiles',
+                'track', 'transform', 'translate', 'transmit', 'triangle_wave',
+                'true', 'ttf', 'turbulence', 'turb_depth', 'type',
+                'ultra_wide_angle', 'up', 'use_color', 'use_colour',
+                'use_index', 'u_steps', 'val', 'variance', 'vaxis_rotate',
+                'vcross', 'vdot', 'version', 'vlength', 'vnormalize',
+                'volume_object', 'volume_rendered', 'vol_with_light',
+                'vrotate', 'v_steps', 'warning', 'warp', 'water_level',
+                'waves', 'while', 'width', 'wood', 'wrinkles', 'yes'),
+                prefix=r'\b', suffix=r'\b'), Keyword),
             (r'bicubic_patch|blob|box|camera|cone|cubic|cylinder|difference|'
              r'disc|height_field|intersection|julia_fractal|lathe|'
              r'light_source|merge|mesh|object|plane|poly|polygon|prism|'
@@ -1254,89 +1326,89 @@ class AppleScriptLexer(RegexLexer):
 
     Identifiers = r'[a-zA-Z]\w*'
     Literals = ['AppleScript', 'current application', 'false', 'linefeed',
-                'missing value', 'pi','quote', 'result', 'return', 'space',
+                'missing value', 'pi', 'quote', 'result', 'return', 'space',
                 'tab', 'text item delimiters', 'true', 'version']
     Classes = ['alias ', 'application ', 'boolean ', 'class ', 'constant ',
                'date ', 'file ', 'integer ', 'list ', 'number ', 'POSIX file ',
                'real ', 'record ', 'reference ', 'RGB color ', 'script ',
-               'text ', 'unit types', '(Unicode )?text', 'string']
+               'text ', 'unit types', 'Unicode text', 'text', 'string']
     BuiltIn = ['attachment', 'attribute run', 'character', 'day', 'month',
                'paragraph', 'word', 'year']
     HandlerParams = ['about', 'above', 'against', 'apart from', 'around',
                      'aside from', 'at', 'below', 'beneath', 'beside',
                      'between', 'for', 'given', 'instead of', 'on', 'onto',
                      'out of', 'over', 'since']
-    Commands = ['ASCII (character|number)', 'activate', 'beep', 'choose URL',
-                'choose application', 'choose color', 'choose file( name)?',
-                'choose folder', 'choose from list',
-                'choose remote application', 'clipboard info',
-                'close( access)?', 'copy', 'count', 'current date', 'delay',
-                'delete', 'display (alert|dialog)', 'do shell script',
-                'duplicate', 'exists', 'get eof', 'get volume settings',
-                'info for', 'launch', 'list (disks|folder)', 'load script',
-                'log', 'make', 'mount volume', 'new', 'offset',
-                'open( (for access|location))?', 'path to', 'print', 'quit',
-                'random number', 'read', 'round', 'run( script)?',
-                'say', 'scripting components',
-                'set (eof|the clipboard to|volume)', 'store script',
-                'summarize', 'system attribute', 'system info',
-                'the clipboard', 'time to GMT', 'write', 'quoted form']
-    References = ['(in )?back of', '(in )?front of', '[0-9]+(st|nd|rd|th)',
-                  'first', 'second', 'third', 'fourth', 'fifth', 'sixth',
-                  'seventh', 'eighth', 'ninth', 'tenth', 'after', 'back',
-                  'before', 'behind', 'every', 'front', 'index', 'last',
-                  'middle', 'some', 'that', 'through', 'thru', 'where', 'whose']
-    Operators = ["and", "or", "is equal", "equals", "(is )?equal to", "is not",
-                 "isn't", "isn't equal( to)?", "is not equal( to)?",
-                 "doesn't equal", "does not equal", "(is )?greater than",
-                 "comes after", "is not less than or equal( to)?",
-                 "isn't less than or equal( to)?", "(is )?less than",
-                 "comes before", "is not greater than or equal( to)?",
-                 "isn't greater than or equal( to)?",
-                 "(is  )?greater than or equal( to)?", "is not less than",
-                 "isn't less than", "does not come before",
-                 "doesn't come before", "(is )?less than or equal( to)?",
-                 "is not greater than", "isn't greater than",
-                 "does not come after", "doesn't come after", "starts? with",
-                 "begins? with", "ends? with", "contains?", "does not contain",
-                 "doesn't contain", "is in", "is contained by", "is not in",
-                 "is not contained by", "isn't contained by", "div", "mod",
-                 "not", "(a  )?(ref( to)?|reference to)", "is", "does"]
+    Commands = ['ASCII character', 'ASCII number', 'activate', 'beep',
+                'choose URL', 'choose application', 'choose color',
+                'choose file name', 'choose file', 'choose folder',
+                'choose from list', 'choose remote application',
+                'clipboard info', 'close access', 'close', 'copy', 'count',
+                'current date', 'delay', 'delete', 'display alert',
+                'display dialog', 'do shell script', 'duplicate', 'exists',
+                'get eof', 'get volume settings', 'info for', 'launch',
+                'list disks', 'list folder', 'load script', 'log', 'make',
+                'mount volume', 'new', 'offset', 'open for access',
+                'open location', 'open', 'path to', 'print', 'quit',
+                'random number', 'read', 'round', 'run script', 'run', 'say',
+                'scripting components', 'set eof', 'set the clipboard to',
+                'set volume', 'store script', 'summarize', 'system attribute',
+                'system info', 'the clipboard', 'time to GMT', 'write',
+                'quoted form']
+    References = ['in back of', 'back of', 'in front of', 'front of', 'first',
+                  'second', 'third', 'fourth', 'fifth', 'sixth', 'seventh',
+                  'eighth', 'ninth', 'tenth', 'after', 'back', 'before',
+                  'behind', 'every', 'front', 'index', 'last', 'middle',
+                  'some', 'that', 'through', 'thru', 'where', 'whose']
+    Operators = ['and', 'or', 'is equal', 'equals', 'equal to', 'is not',
+                 "isn't", "doesn't equal", 'does not equal', 'is greater than',
+                 'greater than', 'comes after', 'is less than', 'less than',
+                 'comes before', 'is  greater than or equal to',
+                 'is  greater than or equal', 'does not come before',
+                 "doesn't come before", 'does not come after',
+                 "doesn't come after", 'starts with', 'start with',
+                 'begins with', 'begin with', 'ends with', 'end with',
+                 'contains', 'contain', 'does not contain', "doesn't contain",
+                 'is in', 'is contained by', 'div', 'mod', 'not', 'a  ref to',
+                 'a  ref', 'a  reference to', 'ref to', 'ref', 'reference to',
+                 'is', 'does']
     Control = ['considering', 'else', 'error', 'exit', 'from', 'if',
                'ignoring', 'in', 'repeat', 'tell', 'then', 'times', 'to',
                'try', 'until', 'using terms from', 'while', 'whith',
-               'with timeout( of)?', 'with transaction', 'by', 'continue',
-               'end', 'its?', 'me', 'my', 'return', 'of' , 'as']
-    Declarations = ['global', 'local', 'prop(erty)?', 'set', 'get']
+               'with timeout of', 'with timeout', 'with transaction', 'by',
+               'continue', 'end', 'its', 'it', 'me', 'my', 'return', 'of',
+               'as']
+    Declarations = ['global', 'local', 'property', 'prop', 'set', 'get']
     Reserved = ['but', 'put', 'returning', 'the']
     StudioClasses = ['action cell', 'alert reply', 'application', 'box',
-                     'browser( cell)?', 'bundle', 'button( cell)?', 'cell',
-                     'clip view', 'color well', 'color-panel',
-                     'combo box( item)?', 'control',
-                     'data( (cell|column|item|row|source))?', 'default entry',
-                     'dialog reply', 'document', 'drag info', 'drawer',
-                     'event', 'font(-panel)?', 'formatter',
-                     'image( (cell|view))?', 'matrix', 'menu( item)?', 'item',
-                     'movie( view)?', 'open-panel', 'outline view', 'panel',
+                     'browser cell', 'browser', 'bundle', 'button cell',
+                     'button', 'cell', 'clip view', 'color well',
+                     'color-panel', 'combo box item', 'combo box', 'control',
+                     'data cell', 'data column', 'data item', 'data row',
+                     'data source', 'data', 'default entry', 'dialog reply',
+                     'document', 'drag info', 'drawer', 'event', 'font-panel',
+                     'font', 'formatter', 'image cell', 'image view', 'image',
+                     'matrix', 'menu item', 'menu', 'item', 'movie view',
+                     'movie', 'open-panel', 'outline view', 'panel',
                      'pasteboard', 'plugin', 'popup button',
                      'progress indicator', 'responder', 'save-panel',
-                     'scroll view', 'secure text field( cell)?', 'slider',
-                     'sound', 'split view', 'stepper', 'tab view( item)?',
-                     'table( (column|header cell|header view|view))',
-                     'text( (field( cell)?|view))?', 'toolbar( item)?',
-                     'user-defaults', 'view', 'window']
+                     'scroll view', 'secure text field cell',
+                     'secure text field', 'slider', 'sound', 'split view',
+                     'stepper', 'tab view item', 'tab view', 'table column',
+                     'table header cell', 'table header view', 'table view',
+                     'text field cell', 'text field', 'text view', 'text',
+                     'toolbar item', 'toolbar', 'user-defaults', 'view',
+                     'window']
     StudioEvents = ['accept outline drop', 'accept table drop', 'action',
                     'activated', 'alert ended', 'awake from nib', 'became key',
                     'became main', 'begin editing', 'bounds changed',
-                    'cell value', 'cell value changed', 'change cell value',
-                    'change item value', 'changed', 'child of item',
-                    'choose menu item', 'clicked', 'clicked toolbar item',
+                    'cell value', 'change cell value', 'change item value',
+                    'changed', 'child of item', 'choose menu item', 'clicked',
                     'closed', 'column clicked', 'column moved',
                     'column resized', 'conclude drop', 'data representation',
                     'deminiaturized', 'dialog ended', 'document nib name',
-                    'double clicked', 'drag( (entered|exited|updated))?',
-                    'drop', 'end editing', 'exposed', 'idle', 'item expandable',
-                    'item value', 'item value changed', 'items changed',
+                    'double clicked', 'drag entered', 'drag exited',
+                    'drag updated', 'drag', 'drop', 'end editing', 'exposed',
+                    'idle', 'item expandable', 'item value', 'items changed',
                     'keyboard down', 'keyboard up', 'launched',
                     'load data representation', 'miniaturized', 'mouse down',
                     'mouse dragged', 'mouse entered', 'mouse exited',
@@ -1347,15 +1419,15 @@ class AppleScriptLexer(RegexLexer):
                     'prepare outline drag', 'prepare outline drop',
                     'prepare table drag', 'prepare table drop',
                     'read from file', 'resigned active', 'resigned key',
-                    'resigned main', 'resized( sub views)?',
+                    'resigned main', 'resized sub views', 'resized',
                     'right mouse down', 'right mouse dragged',
                     'right mouse up', 'rows changed', 'scroll wheel',
                     'selected tab view item', 'selection changed',
                     'selection changing', 'should begin editing',
                     'should close', 'should collapse item',
                     'should end editing', 'should expand item',
-                    'should open( untitled)?',
-                    'should quit( after last window closed)?',
+                    'should open untitled', 'should open',
+                    'should quit after last window closed', 'should quit',
                     'should select column', 'should select item',
                     'should select row', 'should select tab view item',
                     'should selection change', 'should zoom', 'shown',
@@ -1366,17 +1438,16 @@ class AppleScriptLexer(RegexLexer):
                     'will display item cell', 'will display outline cell',
                     'will finish launching', 'will hide', 'will miniaturize',
                     'will move', 'will open', 'will pop up', 'will quit',
-                    'will resign active', 'will resize( sub views)?',
-                    'will select tab view item', 'will show', 'will zoom',
-                    'write to file', 'zoomed']
+                    'will resign active', 'will resize sub views',
+                    'will resize', 'will select tab view item', 'will show',
+                    'will zoom', 'write to file', 'zoomed']
     StudioCommands = ['animate', 'append', 'call method', 'center',
-                      'close drawer', 'close panel', 'display',
-                      'display alert', 'display dialog', 'display panel', 'go',
-                      'hide', 'highlight', 'increment', 'item for',
-                      'load image', 'load movie', 'load nib', 'load panel',
-                      'load sound', 'localized string', 'lock focus', 'log',
-                      'open drawer', 'path for', 'pause', 'perform action',
-                      'play', 'register', 'resume', 'scroll', 'select( all)?',
+                      'close drawer', 'close panel', 'display', 'go', 'hide',
+                      'highlight', 'increment', 'item for', 'load image',
+                      'load movie', 'load nib', 'load panel', 'load sound',
+                      'localized string', 'lock focus', 'log', 'open drawer',
+                      'path for', 'pause', 'perform action', 'play',
+                      'register', 'resume', 'scroll', 'select all', 'select',
                       'show', 'size to fit', 'start', 'step back',
                       'step forward', 'stop', 'synchronize', 'unlock focus',
                       'update']
@@ -1388,86 +1459,94 @@ class AppleScriptLexer(RegexLexer):
                         'allows editing text attributes',
                         'allows empty selection', 'allows mixed state',
                         'allows multiple selection', 'allows reordering',
-                        'allows undo', 'alpha( value)?', 'alternate image',
-                        'alternate increment value', 'alternate title',
-                        'animation delay', 'associated file name',
-                        'associated object', 'auto completes', 'auto display',
-                        'auto enables items', 'auto repeat',
-                        'auto resizes( outline column)?',
-                        'auto save expanded items', 'auto save name',
-                        'auto save table columns', 'auto saves configuration',
-                        'auto scroll', 'auto sizes all columns to fit',
-                        'auto sizes cells', 'background color', 'bezel state',
-                        'bezel style', 'bezeled', 'border rect', 'border type',
-                        'bordered', 'bounds( rotation)?', 'box type',
+                        'allows undo', 'alpha value', 'alpha',
+                        'alternate image', 'alternate increment value',
+                        'alternate title', 'animation delay',
+                        'associated file name', 'associated object',
+                        'auto completes', 'auto display', 'auto enables items',
+                        'auto repeat', 'auto resizes outline column',
+                        'auto resizes', 'auto save expanded items',
+                        'auto save name', 'auto save table columns',
+                        'auto saves configuration', 'auto scroll',
+                        'auto sizes all columns to fit', 'auto sizes cells',
+                        'background color', 'bezel state', 'bezel style',
+                        'bezeled', 'border rect', 'border type', 'bordered',
+                        'bounds rotation', 'bounds', 'box type',
                         'button returned', 'button type',
                         'can choose directories', 'can choose files',
-                        'can draw', 'can hide',
-                        'cell( (background color|size|type))?', 'characters',
-                        'class', 'click count', 'clicked( data)? column',
-                        'clicked data item', 'clicked( data)? row',
-                        'closeable', 'collating', 'color( (mode|panel))',
-                        'command key down', 'configuration',
-                        'content(s| (size|view( margins)?))?', 'context',
-                        'continuous', 'control key down', 'control size',
-                        'control tint', 'control view',
+                        'can draw', 'can hide', 'cell background color',
+                        'cell size', 'cell type', 'cell', 'characters',
+                        'class', 'click count', 'clicked data column',
+                        'clicked column', 'clicked data item',
+                        'clicked data row', 'clicked row', 'closeable',
+                        'collating', 'color mode', 'color panel',
+                        'command key down', 'configuration', 'contents',
+                        'content size', 'content view margins', 'content view',
+                        'content', 'context', 'continuous', 'control key down',
+                        'control size', 'control tint', 'control view',
                         'controller visible', 'coordinate system',
-                        'copies( on scroll)?', 'corner view', 'current cell',
-                        'current column', 'current( field)?  editor',
-                        'current( menu)? item', 'current row',
+                        'copies on scroll', 'copies', 'corner view',
+                        'current cell', 'current column',
+                        'current field  editor', 'current  editor',
+                        'current menu item', 'current item', 'current row',
                         'current tab view item', 'data source',
-                        'default identifiers', 'delta (x|y|z)',
+                        'default identifiers', 'delta x', 'delta y', 'delta z',
                         'destination window', 'directory', 'display mode',
-                        'displayed cell', 'document( (edited|rect|view))?',
-                        'double value', 'dragged column', 'dragged distance',
-                        'dragged items', 'draws( cell)? background',
+                        'displayed cell', 'document edited', 'document rect',
+                        'document view', 'document', 'double value',
+                        'dragged column', 'dragged distance', 'dragged items',
+                        'draws cell background', 'draws background',
                         'draws grid', 'dynamically scrolls', 'echos bullets',
-                        'edge', 'editable', 'edited( data)? column',
-                        'edited data item', 'edited( data)? row', 'enabled',
-                        'enclosing scroll view', 'ending page',
-                        'error handling', 'event number', 'event type',
-                        'excluded from windows menu', 'executable path',
-                        'expanded', 'fax number', 'field editor', 'file kind',
-                        'file name', 'file type', 'first responder',
-                        'first visible column', 'flipped', 'floating',
-                        'font( panel)?', 'formatter', 'frameworks path',
-                        'frontmost', 'gave up', 'grid color', 'has data items',
-                        'has horizontal ruler', 'has horizontal scroller',
-                        'has parent data item', 'has resize indicator',
-                        'has shadow', 'has sub menu', 'has vertical ruler',
-                        'has vertical scroller', 'header cell', 'header view',
-                        'hidden', 'hides when deactivated', 'highlights by',
+                        'edge', 'editable', 'edited data column',
+                        'edited column', 'edited data item', 'edited data row',
+                        'edited row', 'enabled', 'enclosing scroll view',
+                        'ending page', 'error handling', 'event number',
+                        'event type', 'excluded from windows menu',
+                        'executable path', 'expanded', 'fax number',
+                        'field editor', 'file kind', 'file name', 'file type',
+                        'first responder', 'first visible column', 'flipped',
+                        'floating', 'font panel', 'font', 'formatter',
+                        'frameworks path', 'frontmost', 'gave up',
+                        'grid color', 'has data items', 'has horizontal ruler',
+                        'has horizontal scroller', 'has parent data item',
+                        'has resize indicator', 'has shadow', 'has sub menu',
+                        'has vertical ruler', 'has vertical scroller',
+                        'header cell', 'header view', 'hidden',
+                        'hides when deactivated', 'highlights by',
                         'horizontal line scroll', 'horizontal page scroll',
                         'horizontal ruler view', 'horizontally resizable',
                         'icon image', 'id', 'identifier',
-                        'ignores multiple clicks',
-                        'image( (alignment|dims when disabled|frame style|'
-                            'scaling))?',
-                        'imports graphics', 'increment value',
-                        'indentation per level', 'indeterminate', 'index',
-                        'integer value', 'intercell spacing', 'item height',
-                        'key( (code|equivalent( modifier)?|window))?',
-                        'knob thickness', 'label', 'last( visible)? column',
-                        'leading offset', 'leaf', 'level', 'line scroll',
-                        'loaded', 'localized sort', 'location', 'loop mode',
-                        'main( (bunde|menu|window))?', 'marker follows cell',
-                        'matrix mode', 'maximum( content)? size',
-                        'maximum visible columns',
-                        'menu( form representation)?', 'miniaturizable',
-                        'miniaturized', 'minimized image', 'minimized title',
-                        'minimum column width', 'minimum( content)? size',
-                        'modal', 'modified', 'mouse down state',
-                        'movie( (controller|file|rect))?', 'muted', 'name',
+                        'ignores multiple clicks', 'image alignment',
+                        'image dims when disabled', 'image frame style',
+                        'image scaling', 'image', 'imports graphics',
+                        'increment value', 'indentation per level',
+                        'indeterminate', 'index', 'integer value',
+                        'intercell spacing', 'item height', 'key code',
+                        'key equivalent modifier', 'key equivalent',
+                        'key window', 'key', 'knob thickness', 'label',
+                        'last visible column', 'last column', 'leading offset',
+                        'leaf', 'level', 'line scroll', 'loaded',
+                        'localized sort', 'location', 'loop mode',
+                        'main bunde', 'main menu', 'main window', 'main',
+                        'marker follows cell', 'matrix mode',
+                        'maximum content size', 'maximum size',
+                        'maximum visible columns', 'menu form representation',
+                        'menu', 'miniaturizable', 'miniaturized',
+                        'minimized image', 'minimized title',
+                        'minimum column width', 'minimum content size',
+                        'minimum size', 'modal', 'modified',
+                        'mouse down state', 'movie controller', 'movie file',
+                        'movie rect', 'movie', 'muted', 'name',
                         'needs display', 'next state', 'next text',
                         'number of tick marks', 'only tick mark values',
                         'opaque', 'open panel', 'option key down',
                         'outline table column', 'page scroll', 'pages across',
                         'pages down', 'palette label', 'pane splitter',
                         'parent data item', 'parent window', 'pasteboard',
-                        'path( (names|separator))?', 'playing',
-                        'plays every frame', 'plays selection only', 'position',
-                        'preferred edge', 'preferred type', 'pressure',
-                        'previous text', 'prompt', 'properties',
+                        'path names', 'path separator', 'path', 'playing',
+                        'plays every frame', 'plays selection only',
+                        'position', 'preferred edge', 'preferred type',
+                        'pressure', 'previous text', 'prompt', 'properties',
                         'prototype cell', 'pulls down', 'rate',
                         'released when closed', 'repeated',
                         'requested print time', 'required file type',
@@ -1475,38 +1554,44 @@ class AppleScriptLexer(RegexLexer):
                         'returns records', 'reuses columns', 'rich text',
                         'roll over', 'row height', 'rulers visible',
                         'save panel', 'scripts path', 'scrollable',
-                        'selectable( identifiers)?', 'selected cell',
-                        'selected( data)? columns?', 'selected data items?',
-                        'selected( data)? rows?', 'selected item identifier',
-                        'selection by rect', 'send action on arrow key',
+                        'selectable identifiers', 'selectable',
+                        'selected cell', 'selected data columns',
+                        'selected data column', 'selected columns',
+                        'selected column', 'selected data items',
+                        'selected data item', 'selected data rows',
+                        'selected data row', 'selected rows', 'selected row',
+                        'selected item identifier', 'selection by rect',
+                        'send action on arrow key',
                         'sends action when done editing', 'separates columns',
                         'separator item', 'sequence number', 'services menu',
                         'shared frameworks path', 'shared support path',
                         'sheet', 'shift key down', 'shows alpha',
-                        'shows state by', 'size( mode)?',
+                        'shows state by', 'size mode', 'size',
                         'smart insert delete enabled', 'sort case sensitivity',
                         'sort column', 'sort order', 'sort type',
-                        'sorted( data rows)?', 'sound', 'source( mask)?',
-                        'spell checking enabled', 'starting page', 'state',
-                        'string value', 'sub menu', 'super menu', 'super view',
-                        'tab key traverses cells', 'tab state', 'tab type',
-                        'tab view', 'table view', 'tag', 'target( printer)?',
-                        'text color', 'text container insert',
-                        'text container origin', 'text returned',
-                        'tick mark position', 'time stamp',
-                        'title(d| (cell|font|height|position|rect))?',
-                        'tool tip', 'toolbar', 'trailing offset', 'transparent',
+                        'sorted data rows', 'sorted', 'sound', 'source mask',
+                        'source', 'spell checking enabled', 'starting page',
+                        'state', 'string value', 'sub menu', 'super menu',
+                        'super view', 'tab key traverses cells', 'tab state',
+                        'tab type', 'tab view', 'table view', 'tag',
+                        'target printer', 'target', 'text color',
+                        'text container insert', 'text container origin',
+                        'text returned', 'tick mark position', 'time stamp',
+                        'titled', 'title cell', 'title font', 'title height',
+                        'title position', 'title rect', 'title', 'tool tip',
+                        'toolbar', 'trailing offset', 'transparent',
                         'treat packages as directories', 'truncated labels',
                         'types', 'unmodified characters', 'update views',
                         'use sort indicator', 'user defaults',
                         'uses data source', 'uses ruler',
                         'uses threaded animation',
                         'uses title from previous column', 'value wraps',
-                        'version',
-                        'vertical( (line scroll|page scroll|ruler view))?',
-                        'vertically resizable', 'view',
-                        'visible( document rect)?', 'volume', 'width', 'window',
-                        'windows menu', 'wraps', 'zoomable', 'zoomed']
+                        'version', 'vertical line scroll',
+                        'vertical page scroll', 'vertical ruler view',
+                        'vertical', 'vertically resizable', 'view',
+                        'visible document rect', 'visible', 'volume', 'width',
+                        'window', 'windows menu', 'wraps', 'zoomable',
+                        'zoomed']
 
     tokens = {
         'root': [
@@ -1523,24 +1608,25 @@ class AppleScriptLexer(RegexLexer):
              r'numeric strings|punctuation|white space)',
              bygroups(Keyword, Name.Builtin)),
             (ur'(-|\*|\+|&|≠|>=?|<=?|=|≥|≤|/|÷|\^)', Operator),
-            (r"\b(%s)\b" % '|'.join(Operators), Operator.Word),
-            (r'^(\s*(?:on|end)\s+)'
-             r'(%s)' % '|'.join(StudioEvents),
+            (words(Operators, prefix=r'\b', suffix=r'\b'), Operator.Word),
+            (words(StudioEvents, prefix=r'^(\s*(?:on|end)\s+)'),
              bygroups(Keyword, Name.Function)),
             (r'^(\s*)(in|on|script|to)(\s+)', bygroups(Text, Keyword, Text)),
-            (r'\b(as )(%s)\b' % '|'.join(Classes),
+            (words(Classes, prefix=r'\b(as )', suffix=r'\b'),
              bygroups(Keyword, Name.Class)),
-            (r'\b(%s)\b' % '|'.join(Literals), Name.Constant),
-            (r'\b(%s)\b' % '|'.join(Commands), Name.Builtin),
-            (r'\b(%s)\b' % '|'.join(Control), Keyword),
-            (r'\b(%s)\b' % '|'.join(Declarations), Keyword),
-            (r'\b(%s)\b' % '|'.join(Reserved), Name.Builtin),
-            (r'\b(%s)s?\b' % '|'.join(BuiltIn), Name.Builtin),
-            (r'\b(%s)\b' % '|'.join(HandlerParams), Name.Builtin),
-            (r'\b(%s)\b' % '|'.join(StudioProperties), Name.Attribute),
-            (r'\b(%s)s?\b' % '|'.join(StudioClasses), Name.Builtin),
-            (r'\b(%s)\b' % '|'.join(StudioCommands), Name.Builtin),
-            (r'\b(%s)\b' % '|'.join(References), Name.Builtin),
+            (words(Literals, prefix=r'\b', suffix=r'\b'), Name.Constant),
+            (words(Commands, prefix=r'\b', suffix=r'\b'), Name.Builtin),
+            (words(Control, prefix=r'\b', suffix=r'\b'), Keyword),
+            (words(Declarations, prefix=r'\b', suffix=r'\b'), Keyword),
+            (words(Reserved, prefix=r'\b', suffix=r'\b'), Name.Builtin),
+            (words(BuiltIn, prefix=r'\b', suffix=r's?\b'), Name.Builtin),
+            (words(HandlerParams, prefix=r'\b', suffix=r'\b'), Name.Builtin),
+            (words(StudioProperties, prefix=r'\b', suffix=r'\b'),
+             Name.Attribute),
+            (words(StudioClasses, prefix=r'\b', suffix=r's?\b'), Name.Builtin),
+            (words(StudioCommands, prefix=r'\b', suffix=r'\b'), Name.Builtin),
+            (words(References, prefix=r'\b', suffix=r'\b'), Name.Builtin),
+            (r'\b[0-9]+(st|nd|rd|th)\b', Name.Builtin),
             (r'"(\\\\|\\"|[^"])*"', String.Double),
             (r'\b(%s)\b' % Identifiers, Name.Variable),
             (r'[-+]?(\d+\.\d*|\d*\.\d+)(E[-+][0-9]+)?', Number.Float),
@@ -1999,23 +2085,21 @@ class ABAPLexer(RegexLexer):
              r'WAIT|WHEN|WHERE|WHILE|WITH|WINDOW|WRITE)\b', Keyword),
 
              # builtins
-            (r'(abs|acos|asin|atan|'
-             r'boolc|boolx|bit_set|'
-             r'char_off|charlen|ceil|cmax|cmin|condense|contains|'
-             r'contains_any_of|contains_any_not_of|concat_lines_of|cos|cosh|'
-             r'count|count_any_of|count_any_not_of|'
-             r'dbmaxlen|distance|'
-             r'escape|exp|'
-             r'find|find_end|find_any_of|find_any_not_of|floor|frac|from_mixed|'
-             r'insert|'
-             r'lines|log|log10|'
-             r'match|matches|'
-             r'nmax|nmin|numofchar|'
-             r'repeat|replace|rescale|reverse|round|'
-             r'segment|shift_left|shift_right|sign|sin|sinh|sqrt|strlen|'
-             r'substring|substring_after|substring_from|substring_before|substring_to|'
-             r'tan|tanh|to_upper|to_lower|to_mixed|translate|trunc|'
-             r'xstrlen)(\()\b', bygroups(Name.Builtin, Punctuation)),
+            (words((
+                'abs', 'acos', 'asin', 'atan', 'boolc', 'boolx', 'bit_set',
+                'char_off', 'charlen', 'ceil', 'cmax', 'cmin', 'condense',
+                'contains', 'contains_any_of', 'contains_any_not_of',
+                'concat_lines_of', 'cos', 'cosh', 'count', 'count_any_of',
+                'count_any_not_of', 'dbmaxlen', 'distance', 'escape', 'exp',
+                'find', 'find_end', 'find_any_of', 'find_any_not_of', 'floor',
+                'frac', 'from_mixed', 'insert', 'lines', 'log', 'log10',
+                'match', 'matches', 'nmax', 'nmin', 'numofchar', 'repeat',
+                'replace', 'rescale', 'reverse', 'round', 'segment',
+                'shift_left', 'shift_right', 'sign', 'sin', 'sinh', 'sqrt',
+                'strlen', 'substring', 'substring_after', 'substring_from',
+                'substring_before', 'substring_to', 'tan', 'tanh', 'to_upper',
+                'to_lower', 'to_mixed', 'translate', 'trunc', 'xstrlen'),
+                suffix=r'(\()\b'), bygroups(Name.Builtin, Punctuation)),
 
             (r'&[0-9]', Name),
             (r'[0-9]+', Number.Integer),
@@ -2240,16 +2324,21 @@ class AsymptoteLexer(RegexLexer):
             # in the following we test if the string "  [a-zA-Z]" follows
             # the Keyword.Type.
             # Of course it is not perfect !
-            (r'(Braid|FitResult|Label|Legend|TreeNode|abscissa|arc|arrowhead|'
-             r'binarytree|binarytreeNode|block|bool|bool3|bounds|bqe|circle|'
-             r'conic|coord|coordsys|cputime|ellipse|file|filltype|frame|grid3|'
-             r'guide|horner|hsv|hyperbola|indexedTransform|int|inversion|key|'
-             r'light|line|linefit|marginT|marker|mass|object|pair|parabola|path|'
-             r'path3|pen|picture|point|position|projection|real|revolution|'
-             r'scaleT|scientific|segment|side|slice|splitface|string|surface|'
-             r'tensionSpecifier|ticklocate|ticksgridT|tickvalues|transform|'
-             r'transformation|tree|triangle|trilinear|triple|vector|'
-             r'vertex|void)(?=([ ]{1,}[a-zA-Z]))', Keyword.Type),
+            (words((
+                'Braid', 'FitResult', 'Label', 'Legend', 'TreeNode',
+                'abscissa', 'arc', 'arrowhead', 'binarytree', 'binarytreeNode',
+                'block', 'bool', 'bool3', 'bounds', 'bqe', 'circle', 'conic',
+                'coord', 'coordsys', 'cputime', 'ellipse', 'file', 'filltype',
+                'frame', 'grid3', 'guide', 'horner', 'hsv', 'hyperbola',
+                'indexedTransform', 'int', 'inversion', 'key', 'light', 'line',
+                'linefit', 'marginT', 'marker', 'mass', 'object', 'pair',
+                'parabola', 'path', 'path3', 'pen', 'picture', 'point',
+                'position', 'projection', 'real', 'revolution', 'scaleT',
+                'scientific', 'segment', 'side', 'slice', 'splitface',
+                'string', 'surface', 'tensionSpecifier', 'ticklocate',
+                'ticksgridT', 'tickvalues', 'transform', 'transformation',
+                'tree', 'triangle', 'trilinear', 'triple', 'vector', 'vertex',
+                'void'), suffix='(?=([ ]{1,}[a-zA-Z]))'), Keyword.Type),
             # Now the asy-type-name which are not asy-function-name
             # except yours !
             # Perhaps useless
@@ -2304,7 +2393,8 @@ class AsymptoteLexer(RegexLexer):
         }
 
     def get_tokens_unprocessed(self, text):
-        from pygments.lexers._asybuiltins import ASYFUNCNAME, ASYVARNAME
+        ASYFUNCNAME = builtin_names('_asybuiltins', 'ASYFUNCNAME')
+        ASYVARNAME = builtin_names('_asybuiltins', 'ASYVARNAME')
         for index, token, value in \
                RegexLexer.get_tokens_unprocessed(self, text):
            if token is Name and value in ASYFUNCNAME:
@@ -203,6 +203,9 @@ class RagelEmbeddedLexer(RegexLexer):
         ]
     }
 
+    analyse_hint = r'@LANG: indep'
+    analyse_default = 0.1
+
     def analyse_text(text):
         return '@LANG: indep' in text or 0.1
 
@@ -222,6 +225,8 @@ class RagelRubyLexer(DelegatingLexer):
         super(RagelRubyLexer, self).__init__(RubyLexer, RagelEmbeddedLexer,
                                               **options)
 
+    analyse_hint = r'@LANG: '
+
     def analyse_text(text):
         return '@LANG: ruby' in text
 
@@ -241,6 +246,8 @@ class RagelCLexer(DelegatingLexer):
         super(RagelCLexer, self).__init__(CLexer, RagelEmbeddedLexer,
                                           **options)
 
+    analyse_hint = r'@LANG: '
+
     def analyse_text(text):
         return '@LANG: c' in text
 
@@ -259,6 +266,8 @@ class RagelDLexer(DelegatingLexer):
     def __init__(self, **options):
         super(RagelDLexer, self).__init__(DLexer, RagelEmbeddedLexer, **options)
 
+    analyse_hint = r'@LANG: '
+
     def analyse_text(text):
         return '@LANG: d' in text
 
@@ -277,6 +286,8 @@ class RagelCppLexer(DelegatingLexer):
     def __init__(self, **options):
         super(RagelCppLexer, self).__init__(CppLexer, RagelEmbeddedLexer, **options)
 
+    analyse_hint = r'@LANG: '
+
     def analyse_text(text):
         return '@LANG: c++' in text
 
@@ -297,6 +308,8 @@ class RagelObjectiveCLexer(DelegatingLexer):
                                                    RagelEmbeddedLexer,
                                                    **options)
 
+    analyse_hint = r'@LANG: '
+
     def analyse_text(text):
         return '@LANG: objc' in text
 
@@ -316,6 +329,8 @@ class RagelJavaLexer(DelegatingLexer):
         super(RagelJavaLexer, self).__init__(JavaLexer, RagelEmbeddedLexer,
                                              **options)
 
+    analyse_hint = r'@LANG: '
+
     def analyse_text(text):
         return '@LANG: java' in text
 
@@ -509,8 +524,11 @@ class AntlrLexer(RegexLexer):
         ]
     }
 
+    analyse_hint = r'grammar'
+
     def analyse_text(text):
-        return re.search(r'^\s*grammar\s+[a-zA-Z0-9]+\s*;', text, re.M)
+        return re.search(r'^\s*grammar\s+[a-zA-Z0-9]+\s*;', text,
+                         re.M) is not None
 
 # http://www.antlr.org/wiki/display/ANTLR3/Code+Generation+Targets
 
@@ -550,9 +568,12 @@ class AntlrCppLexer(DelegatingLexer):
     def __init__(self, **options):
         super(AntlrCppLexer, self).__init__(CppLexer, AntlrLexer, **options)
 
+    analyse_hint = r'grammar'
+
     def analyse_text(text):
         return AntlrLexer.analyse_text(text) and \
-               re.search(r'^\s*language\s*=\s*C\s*;', text, re.M)
+               re.search(r'^\s*language\s*=\s*C\s*;', text,
+                         re.M) is not None
 
 
 class AntlrObjectiveCLexer(DelegatingLexer):
@@ -570,9 +591,11 @@ class AntlrObjectiveCLexer(DelegatingLexer):
         super(AntlrObjectiveCLexer, self).__init__(ObjectiveCLexer,
                                                    AntlrLexer, **options)
 
+    analyse_hint = r'grammar'
+
     def analyse_text(text):
         return AntlrLexer.analyse_text(text) and \
-               re.search(r'^\s*language\s*=\s*ObjC\s*;', text)
+               re.search(r'^\s*language\s*=\s*ObjC\s*;', text) is not None
 
 
 class AntlrCSharpLexer(DelegatingLexer):
@@ -590,9 +613,12 @@ class AntlrCSharpLexer(DelegatingLexer):
         super(AntlrCSharpLexer, self).__init__(CSharpLexer, AntlrLexer,
                                                **options)
 
+    analyse_hint = r'grammar'
+
     def analyse_text(text):
         return AntlrLexer.analyse_text(text) and \
-               re.search(r'^\s*language\s*=\s*CSharp2\s*;', text, re.M)
+               re.search(r'^\s*language\s*=\s*CSharp2\s*;', text,
+                         re.M) is not None
 
 
 class AntlrPythonLexer(DelegatingLexer):
@@ -610,9 +636,12 @@ class AntlrPythonLexer(DelegatingLexer):
         super(AntlrPythonLexer, self).__init__(PythonLexer, AntlrLexer,
                                                **options)
 
+    analyse_hint = r'grammar'
+
     def analyse_text(text):
         return AntlrLexer.analyse_text(text) and \
-               re.search(r'^\s*language\s*=\s*Python\s*;', text, re.M)
+               re.search(r'^\s*language\s*=\s*Python\s*;', text,
+                         re.M) is not None
 
 
 class AntlrJavaLexer(DelegatingLexer):
@@ -630,6 +659,8 @@ class AntlrJavaLexer(DelegatingLexer):
         super(AntlrJavaLexer, self).__init__(JavaLexer, AntlrLexer,
                                              **options)
 
+    analyse_hint = r'grammar'
+
     def analyse_text(text):
         # Antlr language is Java by default
         return AntlrLexer.analyse_text(text) and 0.9
@@ -650,9 +681,12 @@ class AntlrRubyLexer(DelegatingLexer):
         super(AntlrRubyLexer, self).__init__(RubyLexer, AntlrLexer,
                                              **options)
 
+    analyse_hint = r'grammar'
+
     def analyse_text(text):
         return AntlrLexer.analyse_text(text) and \
-               re.search(r'^\s*language\s*=\s*Ruby\s*;', text, re.M)
+               re.search(r'^\s*language\s*=\s*Ruby\s*;', text,
+                         re.M) is not None
 
 
 class AntlrPerlLexer(DelegatingLexer):
@@ -670,9 +704,12 @@ class AntlrPerlLexer(DelegatingLexer):
         super(AntlrPerlLexer, self).__init__(PerlLexer, AntlrLexer,
                                              **options)
 
+    analyse_hint = r'grammar'
+
     def analyse_text(text):
         return AntlrLexer.analyse_text(text) and \
-               re.search(r'^\s*language\s*=\s*Perl5\s*;', text, re.M)
+               re.search(r'^\s*language\s*=\s*Perl5\s*;', text,
+                         re.M) is not None
 
 
 class AntlrActionScriptLexer(DelegatingLexer):
@@ -690,6 +727,9 @@ class AntlrActionScriptLexer(DelegatingLexer):
         super(AntlrActionScriptLexer, self).__init__(ActionScriptLexer,
                                                      AntlrLexer, **options)
 
+    analyse_hint = r'grammar'
+
     def analyse_text(text):
         return AntlrLexer.analyse_text(text) and \
-               re.search(r'^\s*language\s*=\s*ActionScript\s*;', text, re.M)
+               re.search(r'^\s*language\s*=\s*ActionScript\s*;', text,
+                         re.M) is not None
@@ -128,6 +128,8 @@ class ErbLexer(Lexer):
         except IndexError:
             return
 
+    analyse_hint = r'<%'
+
     def analyse_text(text):
         if '<%' in text and '%>' in text:
             return 0.4
@@ -175,6 +177,8 @@ class SmartyLexer(RegexLexer):
         ]
     }
 
+    analyse_hint = r'\{'
+
     def analyse_text(text):
         rv = 0.0
         if re.search('\{if\s+.*?\}.*?\{/if\}', text):
@@ -260,6 +264,8 @@ class DjangoLexer(RegexLexer):
         ]
     }
 
+    analyse_hint = r'\{[%{]'
+
     def analyse_text(text):
         rv = 0.0
         if re.search(r'\{%\s*(block|extends)', text) is not None:
@@ -748,6 +754,8 @@ class HtmlGenshiLexer(DelegatingLexer):
         super(HtmlGenshiLexer, self).__init__(HtmlLexer, GenshiMarkupLexer,
                                               **options)
 
+    analyse_hint = r'\$\{|py:|<!DOCTYPE'
+
     def analyse_text(text):
         rv = 0.0
         if re.search('\$\{.*?\}', text) is not None:
@@ -773,6 +781,8 @@ class GenshiLexer(DelegatingLexer):
         super(GenshiLexer, self).__init__(XmlLexer, GenshiMarkupLexer,
                                           **options)
 
+    analyse_hint = r'\$\{|py:|<'
+
     def analyse_text(text):
         rv = 0.0
         if re.search('\$\{.*?\}', text) is not None:
@@ -800,6 +810,8 @@ class JavascriptGenshiLexer(DelegatingLexer):
                                                     GenshiTextLexer,
                                                     **options)
 
+    analyse_hint = r'\$\{|py:|<'
+
     def analyse_text(text):
         return GenshiLexer.analyse_text(text) - 0.05
 
@@ -818,6 +830,8 @@ class CssGenshiLexer(DelegatingLexer):
         super(CssGenshiLexer, self).__init__(CssLexer, GenshiTextLexer,
                                              **options)
 
+    analyse_hint = r'\$\{|py:|<'
+
     def analyse_text(text):
         return GenshiLexer.analyse_text(text) - 0.05
 
@@ -839,6 +853,8 @@ class RhtmlLexer(DelegatingLexer):
     def __init__(self, **options):
         super(RhtmlLexer, self).__init__(HtmlLexer, ErbLexer, **options)
 
+    analyse_hint = r'<%|<!DOCTYPE'
+
     def analyse_text(text):
         rv = ErbLexer.analyse_text(text) - 0.01
         if html_doctype_matches(text):
@@ -861,6 +877,8 @@ class XmlErbLexer(DelegatingLexer):
     def __init__(self, **options):
         super(XmlErbLexer, self).__init__(XmlLexer, ErbLexer, **options)
 
+    analyse_hint = r'<'
+
     def analyse_text(text):
         rv = ErbLexer.analyse_text(text) - 0.01
         if looks_like_xml(text):
@@ -881,6 +899,8 @@ class CssErbLexer(DelegatingLexer):
     def __init__(self, **options):
         super(CssErbLexer, self).__init__(CssLexer, ErbLexer, **options)
 
+    analyse_hint = r'<%'
+
     def analyse_text(text):
         return ErbLexer.analyse_text(text) - 0.05
 
@@ -902,6 +922,8 @@ class JavascriptErbLexer(DelegatingLexer):
         super(JavascriptErbLexer, self).__init__(JavascriptLexer, ErbLexer,
                                                  **options)
 
+    analyse_hint = r'<%'
+
     def analyse_text(text):
         return ErbLexer.analyse_text(text) - 0.05
 
@@ -925,6 +947,8 @@ class HtmlPhpLexer(DelegatingLexer):
     def __init__(self, **options):
         super(HtmlPhpLexer, self).__init__(HtmlLexer, PhpLexer, **options)
 
+    analyse_hint = r'<\?|\?>|<!DOCTYPE'
+
     def analyse_text(text):
         rv = PhpLexer.analyse_text(text) - 0.01
         if html_doctype_matches(text):
@@ -945,6 +969,8 @@ class XmlPhpLexer(DelegatingLexer):
     def __init__(self, **options):
         super(XmlPhpLexer, self).__init__(XmlLexer, PhpLexer, **options)
 
+    analyse_hint = r'\?>|<'
+
     def analyse_text(text):
         rv = PhpLexer.analyse_text(text) - 0.01
         if looks_like_xml(text):
@@ -965,6 +991,8 @@ class CssPhpLexer(DelegatingLexer):
     def __init__(self, **options):
         super(CssPhpLexer, self).__init__(CssLexer, PhpLexer, **options)
 
+    analyse_hint = r'<\?|\?>'
+
     def analyse_text(text):
         return PhpLexer.analyse_text(text) - 0.05
 
@@ -986,6 +1014,8 @@ class JavascriptPhpLexer(DelegatingLexer):
         super(JavascriptPhpLexer, self).__init__(JavascriptLexer, PhpLexer,
                                                  **options)
 
+    analyse_hint = r'<\?|\?>'
+
     def analyse_text(text):
         return PhpLexer.analyse_text(text)
 
@@ -1006,6 +1036,8 @@ class HtmlSmartyLexer(DelegatingLexer):
     def __init__(self, **options):
         super(HtmlSmartyLexer, self).__init__(HtmlLexer, SmartyLexer, **options)
 
+    analyse_hint = r'\{|<!DOCTYPE'
+
     def analyse_text(text):
         rv = SmartyLexer.analyse_text(text) - 0.01
         if html_doctype_matches(text):
@@ -1027,6 +1059,8 @@ class XmlSmartyLexer(DelegatingLexer):
     def __init__(self, **options):
         super(XmlSmartyLexer, self).__init__(XmlLexer, SmartyLexer, **options)
 
+    analyse_hint = r'\{|<'
+
     def analyse_text(text):
         rv = SmartyLexer.analyse_text(text) - 0.01
         if looks_like_xml(text):
@@ -1048,6 +1082,8 @@ class CssSmartyLexer(DelegatingLexer):
     def __init__(self, **options):
         super(CssSmartyLexer, self).__init__(CssLexer, SmartyLexer, **options)
 
+    analyse_hint = r'\{'
+
     def analyse_text(text):
         return SmartyLexer.analyse_text(text) - 0.05
 
@@ -1069,6 +1105,8 @@ class JavascriptSmartyLexer(DelegatingLexer):
         super(JavascriptSmartyLexer, self).__init__(JavascriptLexer, SmartyLexer,
                                                     **options)
 
+    analyse_hint = r'\{'
+
     def analyse_text(text):
         return SmartyLexer.analyse_text(text) - 0.05
 
@@ -1089,6 +1127,8 @@ class HtmlDjangoLexer(DelegatingLexer):
     def __init__(self, **options):
         super(HtmlDjangoLexer, self).__init__(HtmlLexer, DjangoLexer, **options)
 
+    analyse_hint = r'\{[%{]|<!DOCTYPE'
+
     def analyse_text(text):
         rv = DjangoLexer.analyse_text(text) - 0.01
         if html_doctype_matches(text):
@@ -1110,6 +1150,8 @@ class XmlDjangoLexer(DelegatingLexer):
     def __init__(self, **options):
         super(XmlDjangoLexer, self).__init__(XmlLexer, DjangoLexer, **options)
 
+    analyse_hint = r'\{[%{]|<'
+
     def analyse_text(text):
         rv = DjangoLexer.analyse_text(text) - 0.01
         if looks_like_xml(text):
@@ -1131,6 +1173,8 @@ class CssDjangoLexer(DelegatingLexer):
     def __init__(self, **options):
         super(CssDjangoLexer, self).__init__(CssLexer, DjangoLexer, **options)
 
+    analyse_hint = r'\{[%{]'
+
     def analyse_text(text):
         return DjangoLexer.analyse_text(text) - 0.05
 
@@ -1156,6 +1200,8 @@ class JavascriptDjangoLexer(DelegatingLexer):
         super(JavascriptDjangoLexer, self).__init__(JavascriptLexer, DjangoLexer,
                                                     **options)
 
+    analyse_hint = r'\{[%{]'
+
     def analyse_text(text):
         return DjangoLexer.analyse_text(text) - 0.05
 
@@ -1199,6 +1245,8 @@ class JspLexer(DelegatingLexer):
     def __init__(self, **options):
         super(JspLexer, self).__init__(XmlLexer, JspRootLexer, **options)
 
+    analyse_hint = r'<'
+
     def analyse_text(text):
         rv = JavaLexer.analyse_text(text) - 0.01
         if looks_like_xml(text):
@@ -47,6 +47,8 @@ class IniLexer(RegexLexer):
         ]
     }
 
+    analyse_hint = r'\A\['
+
     def analyse_text(text):
         npos = text.find('\n')
         if npos < 3:
@@ -95,6 +97,8 @@ class SourcesListLexer(RegexLexer):
         ]
     }
 
+    analyse_hint = r'(?u)\A\s*(#|deb(-src)? |$)'
+
     def analyse_text(text):
         for line in text.split('\n'):
             line = line.strip()
@@ -213,6 +217,8 @@ class DiffLexer(RegexLexer):
         ]
     }
 
+    analyse_hint = r'\A(Index: |diff |--- )'
+
     def analyse_text(text):
         if text[:7] == 'Index: ':
             return True
@@ -423,6 +429,8 @@ class TexLexer(RegexLexer):
         ],
     }
 
+    analyse_hint = r'\A\\(documentclass|input|documentstyle|relax)'
+
     def analyse_text(text):
         for start in ("\\documentclass", "\\input", "\\documentstyle",
                       "\\relax"):
@@ -474,6 +482,8 @@ class GroffLexer(RegexLexer):
         ],
     }
 
+    analyse_hint = r'\A\.'
+
     def analyse_text(text):
         if text[:1] != '.':
             return False
@@ -719,6 +729,8 @@ class RstLexer(RegexLexer):
         self.handlecodeblocks = get_bool_opt(options, 'handlecodeblocks', True)
         RegexLexer.__init__(self, **options)
 
+    analyse_hint = r'\A\.\.|\n[-=]'
+
     def analyse_text(text):
         if text[:2] == '..' and text[2:3] != '.':
             return 0.3
@@ -13,7 +13,7 @@ import re
 import copy
 
 from pygments.lexer import RegexLexer, ExtendedRegexLexer, bygroups, using, \
-     include, this
+     include, this, builtin_names, words
 from pygments.token import \
      Text, Comment, Operator, Keyword, Name, String, Number, Other, Punctuation
 from pygments.util import get_bool_opt, get_list_opt, looks_like_xml, \
@@ -117,44 +117,63 @@ class ActionScriptLexer(RegexLexer):
              Keyword.Declaration),
             (r'(true|false|null|NaN|Infinity|-Infinity|undefined|Void)\b',
              Keyword.Constant),
-            (r'(Accessibility|AccessibilityProperties|ActionScriptVersion|'
-             r'ActivityEvent|AntiAliasType|ApplicationDomain|AsBroadcaster|Array|'
-             r'AsyncErrorEvent|AVM1Movie|BevelFilter|Bitmap|BitmapData|'
-             r'BitmapDataChannel|BitmapFilter|BitmapFilterQuality|BitmapFilterType|'
-             r'BlendMode|BlurFilter|Boolean|ByteArray|Camera|Capabilities|CapsStyle|'
-             r'Class|Color|ColorMatrixFilter|ColorTransform|ContextMenu|'
-             r'ContextMenuBuiltInItems|ContextMenuEvent|ContextMenuItem|'
-             r'ConvultionFilter|CSMSettings|DataEvent|Date|DefinitionError|'
-             r'DeleteObjectSample|Dictionary|DisplacmentMapFilter|DisplayObject|'
-             r'DisplacmentMapFilterMode|DisplayObjectContainer|DropShadowFilter|'
-             r'Endian|EOFError|Error|ErrorEvent|EvalError|Event|EventDispatcher|'
-             r'EventPhase|ExternalInterface|FileFilter|FileReference|'
-             r'FileReferenceList|FocusDirection|FocusEvent|Font|FontStyle|FontType|'
-             r'FrameLabel|FullScreenEvent|Function|GlowFilter|GradientBevelFilter|'
-             r'GradientGlowFilter|GradientType|Graphics|GridFitType|HTTPStatusEvent|'
-             r'IBitmapDrawable|ID3Info|IDataInput|IDataOutput|IDynamicPropertyOutput'
-             r'IDynamicPropertyWriter|IEventDispatcher|IExternalizable|'
-             r'IllegalOperationError|IME|IMEConversionMode|IMEEvent|int|'
-             r'InteractiveObject|InterpolationMethod|InvalidSWFError|InvokeEvent|'
-             r'IOError|IOErrorEvent|JointStyle|Key|Keyboard|KeyboardEvent|KeyLocation|'
-             r'LineScaleMode|Loader|LoaderContext|LoaderInfo|LoadVars|LocalConnection|'
-             r'Locale|Math|Matrix|MemoryError|Microphone|MorphShape|Mouse|MouseEvent|'
-             r'MovieClip|MovieClipLoader|Namespace|NetConnection|NetStatusEvent|'
-             r'NetStream|NewObjectSample|Number|Object|ObjectEncoding|PixelSnapping|'
-             r'Point|PrintJob|PrintJobOptions|PrintJobOrientation|ProgressEvent|Proxy|'
-             r'QName|RangeError|Rectangle|ReferenceError|RegExp|Responder|Sample|Scene|'
-             r'ScriptTimeoutError|Security|SecurityDomain|SecurityError|'
-             r'SecurityErrorEvent|SecurityPanel|Selection|Shape|SharedObject|'
-             r'SharedObjectFlushStatus|SimpleButton|Socket|Sound|SoundChannel|'
-             r'SoundLoaderContext|SoundMixer|SoundTransform|SpreadMethod|Sprite|'
-             r'StackFrame|StackOverflowError|Stage|StageAlign|StageDisplayState|'
-             r'StageQuality|StageScaleMode|StaticText|StatusEvent|String|StyleSheet|'
-             r'SWFVersion|SyncEvent|SyntaxError|System|TextColorType|TextField|'
-             r'TextFieldAutoSize|TextFieldType|TextFormat|TextFormatAlign|'
-             r'TextLineMetrics|TextRenderer|TextSnapshot|Timer|TimerEvent|Transform|'
-             r'TypeError|uint|URIError|URLLoader|URLLoaderDataFormat|URLRequest|'
-             r'URLRequestHeader|URLRequestMethod|URLStream|URLVariabeles|VerifyError|'
-             r'Video|XML|XMLDocument|XMLList|XMLNode|XMLNodeType|XMLSocket|XMLUI)\b',
+            (words((
+                'Accessibility', 'AccessibilityProperties',
+                'ActionScriptVersion', 'ActivityEvent', 'AntiAliasType',
+                'ApplicationDomain', 'AsBroadcaster', 'Array',
+                'AsyncErrorEvent', 'AVM1Movie', 'BevelFilter', 'Bitmap',
+                'BitmapData', 'BitmapDataChannel', 'BitmapFilter',
+                'BitmapFilterQuality', 'BitmapFilterType', 'BlendMode',
+                'BlurFilter', 'Boolean', 'ByteArray', 'Camera', 'Capabilities',
+                'CapsStyle', 'Class', 'Color', 'ColorMatrixFilter',
+                'ColorTransform', 'ContextMenu', 'ContextMenuBuiltInItems',
+                'ContextMenuEvent', 'ContextMenuItem', 'ConvultionFilter',
+                'CSMSettings', 'DataEvent', 'Date', 'DefinitionError',
+                'DeleteObjectSample', 'Dictionary', 'DisplacmentMapFilter',
+                'DisplayObject', 'DisplacmentMapFilterMode',
+                'DisplayObjectContainer', 'DropShadowFilter', 'Endian',
+                'EOFError', 'Error', 'ErrorEvent', 'EvalError', 'Event',
+                'EventDispatcher', 'EventPhase', 'ExternalInterface',
+                'FileFilter', 'FileReference', 'FileReferenceList',
+                'FocusDirection', 'FocusEvent', 'Font', 'FontStyle',
+                'FontType', 'FrameLabel', 'FullScreenEvent', 'Function',
+                'GlowFilter', 'GradientBevelFilter', 'GradientGlowFilter',
+                'GradientType', 'Graphics', 'GridFitType', 'HTTPStatusEvent',
+                'IBitmapDrawable', 'ID3Info', 'IDataInput', 'IDataOutput',
+                'IDynamicPropertyOutputIDynamicPropertyWriter',
+                'IEventDispatcher', 'IExternalizable', 'IllegalOperationError',
+                'IME', 'IMEConversionMode', 'IMEEvent', 'int',
+                'InteractiveObject', 'InterpolationMethod', 'InvalidSWFError',
+                'InvokeEvent', 'IOError', 'IOErrorEvent', 'JointStyle', 'Key',
+                'Keyboard', 'KeyboardEvent', 'KeyLocation', 'LineScaleMode',
+                'Loader', 'LoaderContext', 'LoaderInfo', 'LoadVars',
+                'LocalConnection', 'Locale', 'Math', 'Matrix', 'MemoryError',
+                'Microphone', 'MorphShape', 'Mouse', 'MouseEvent', 'MovieClip',
+                'MovieClipLoader', 'Namespace', 'NetConnection',
+                'NetStatusEvent', 'NetStream', 'NewObjectSample', 'Number',
+                'Object', 'ObjectEncoding', 'PixelSnapping', 'Point',
+                'PrintJob', 'PrintJobOptions', 'PrintJobOrientation',
+                'ProgressEvent', 'Proxy', 'QName', 'RangeError', 'Rectangle',
+                'ReferenceError', 'RegExp', 'Responder', 'Sample', 'Scene',
+                'ScriptTimeoutError', 'Security', 'SecurityDomain',
+                'SecurityError', 'SecurityErrorEvent', 'SecurityPanel',
+                'Selection', 'Shape', 'SharedObject',
+                'SharedObjectFlushStatus', 'SimpleButton', 'Socket', 'Sound',
+                'SoundChannel', 'SoundLoaderContext', 'SoundMixer',
+                'SoundTransform', 'SpreadMethod', 'Sprite', 'StackFrame',
+                'StackOverflowError', 'Stage', 'StageAlign',
+                'StageDisplayState', 'StageQuality', 'StageScaleMode',
+                'StaticText', 'StatusEvent', 'String', 'StyleSheet',
+                'SWFVersion', 'SyncEvent', 'SyntaxError', 'System',
+                'TextColorType', 'TextField', 'TextFieldAutoSize',
+                'TextFieldType', 'TextFormat', 'TextFormatAlign',
+                'TextLineMetrics', 'TextRenderer', 'TextSnapshot', 'Timer',
+                'TimerEvent', 'Transform', 'TypeError', 'uint', 'URIError',
+                'URLLoader', 'URLLoaderDataFormat', 'URLRequest',
+                'URLRequestHeader', 'URLRequestMethod', 'URLStream',
+                'URLVariabeles', 'VerifyError', 'Video', 'XML', 'XMLDocument',
+                'XMLList', 'XMLNode', 'XMLNodeType', 'XMLSocket', 'XMLUI'),
+                suffix=r'\b'),
              Name.Builtin),
             (r'(decodeURI|decodeURIComponent|encodeURI|escape|eval|isFinite|isNaN|'
              r'isXMLName|clearInterval|fscommand|getTimer|getURL|getVersion|'
@@ -169,6 +188,10 @@ class ActionScriptLexer(RegexLexer):
         ]
     }
 
+    # the result doesn't depend on the text
+    analyse_hint = r'(?!)'
+    analyse_default = 0.05
+
     def analyse_text(text):
         return 0.05
 
@@ -248,6 +271,9 @@ class ActionScript3Lexer(RegexLexer):
         ]
     }
 
+    analyse_hint = r'\A\w+\s*:\s*\w'
+    analyse_default = 0.1
+
     def analyse_text(text):
         if re.match(r'\w+\s*:\s*\w', text): return 0.3
         return 0.1
@@ -351,31 +377,39 @@ class CssLexer(RegexLexer):
              r'upper-alpha|upper-latin|upper-roman|uppercase|url|'
              r'visible|w-resize|wait|wider|x-fast|x-high|x-large|x-loud|'
              r'x-low|x-small|x-soft|xx-large|xx-small|yes)\b', Keyword),
-            (r'(indigo|gold|firebrick|indianred|yellow|darkolivegreen|'
-             r'darkseagreen|mediumvioletred|mediumorchid|chartreuse|'
-             r'mediumslateblue|black|springgreen|crimson|lightsalmon|brown|'
-             r'turquoise|olivedrab|cyan|silver|skyblue|gray|darkturquoise|'
-             r'goldenrod|darkgreen|darkviolet|darkgray|lightpink|teal|'
-             r'darkmagenta|lightgoldenrodyellow|lavender|yellowgreen|thistle|'
-             r'violet|navy|orchid|blue|ghostwhite|honeydew|cornflowerblue|'
-             r'darkblue|darkkhaki|mediumpurple|cornsilk|red|bisque|slategray|'
-             r'darkcyan|khaki|wheat|deepskyblue|darkred|steelblue|aliceblue|'
-             r'gainsboro|mediumturquoise|floralwhite|coral|purple|lightgrey|'
-             r'lightcyan|darksalmon|beige|azure|lightsteelblue|oldlace|'
-             r'greenyellow|royalblue|lightseagreen|mistyrose|sienna|'
-             r'lightcoral|orangered|navajowhite|lime|palegreen|burlywood|'
-             r'seashell|mediumspringgreen|fuchsia|papayawhip|blanchedalmond|'
-             r'peru|aquamarine|white|darkslategray|ivory|dodgerblue|'
-             r'lemonchiffon|chocolate|orange|forestgreen|slateblue|olive|'
-             r'mintcream|antiquewhite|darkorange|cadetblue|moccasin|'
-             r'limegreen|saddlebrown|darkslateblue|lightskyblue|deeppink|'
-             r'plum|aqua|darkgoldenrod|maroon|sandybrown|magenta|tan|'
-             r'rosybrown|pink|lightblue|palevioletred|mediumseagreen|'
-             r'dimgray|powderblue|seagreen|snow|mediumblue|midnightblue|'
-             r'paleturquoise|palegoldenrod|whitesmoke|darkorchid|salmon|'
-             r'lightslategray|lawngreen|lightgreen|tomato|hotpink|'
-             r'lightyellow|lavenderblush|linen|mediumaquamarine|green|'
-             r'blueviolet|peachpuff)\b', Name.Builtin),
+            (words((
+                'indigo', 'gold', 'firebrick', 'indianred', 'yellow',
+                'darkolivegreen', 'darkseagreen', 'mediumvioletred',
+                'mediumorchid', 'chartreuse', 'mediumslateblue', 'black',
+                'springgreen', 'crimson', 'lightsalmon', 'brown', 'turquoise',
+                'olivedrab', 'cyan', 'silver', 'skyblue', 'gray',
+                'darkturquoise', 'goldenrod', 'darkgreen', 'darkviolet',
+                'darkgray', 'lightpink', 'teal', 'darkmagenta',
+                'lightgoldenrodyellow', 'lavender', 'yellowgreen', 'thistle',
+                'violet', 'navy', 'orchid', 'blue', 'ghostwhite', 'honeydew',
+                'cornflowerblue', 'darkblue', 'darkkhaki', 'mediumpurple',
+                'cornsilk', 'red', 'bisque', 'slategray', 'darkcyan', 'khaki',
+                'wheat', 'deepskyblue', 'darkred', 'steelblue', 'aliceblue',
+                'gainsboro', 'mediumturquoise', 'floralwhite', 'coral',
+                'purple', 'lightgrey', 'lightcyan', 'darksalmon', 'beige',
+                'azure', 'lightsteelblue', 'oldlace', 'greenyellow',
+                'royalblue', 'lightseagreen', 'mistyrose', 'sienna',
+                'lightcoral', 'orangered', 'navajowhite', 'lime', 'palegreen',
+                'burlywood', 'seashell', 'mediumspringgreen', 'fuchsia',
+                'papayawhip', 'blanchedalmond', 'peru', 'aquamarine', 'white',
+                'darkslategray', 'ivory', 'dodgerblue', 'lemonchiffon',
+                'chocolate', 'orange', 'forestgreen', 'slateblue', 'olive',
+                'mintcream', 'antiquewhite', 'darkorange', 'cadetblue',
+                'moccasin', 'limegreen', 'saddlebrown', 'darkslateblue',
+                'lightskyblue', 'deeppink', 'plum', 'aqua', 'darkgoldenrod',
+                'maroon', 'sandybrown', 'magenta', 'tan', 'rosybrown', 'pink',
+                'lightblue', 'palevioletred', 'mediumseagreen', 'dimgray',
+                'powderblue', 'seagreen', 'snow', 'mediumblue', 'midnightblue',
+                'paleturquoise', 'palegoldenrod', 'whitesmoke', 'darkorchid',
+                'salmon', 'lightslategray', 'lawngreen', 'lightgreen',
+                'tomato', 'hotpink', 'lightyellow', 'lavenderblush', 'linen',
+                'mediumaquamarine', 'green', 'blueviolet', 'peachpuff'),
+                suffix=r'\b'), Name.Builtin),
             (r'\!important', Comment.Preproc),
             (r'/\*(?:.|\n)*?\*/', Comment),
             (r'\#[a-zA-Z0-9]{1,6}', Number),
@@ -606,6 +640,8 @@ class ObjectiveJLexer(RegexLexer):
         ]
     }
 
+    analyse_hint = r'@import'
+
     def analyse_text(text):
         if re.search('^\s*@import\s+[<"]', text, re.MULTILINE):
             # special directive found in most Objective-J files
@@ -664,6 +700,8 @@ class HtmlLexer(RegexLexer):
         ],
     }
 
+    analyse_hint = r'<!DOCTYPE'
+
     def analyse_text(text):
         if html_doctype_matches(text):
             return 0.5
@@ -735,16 +773,21 @@ class PhpLexer(RegexLexer):
               bygroups(Keyword, Text, Operator, Text), 'functionname'),
             (r'(const)(\s+)([a-zA-Z_][a-zA-Z0-9_]*)',
               bygroups(Keyword, Text, Name.Constant)),
-            (r'(and|E_PARSE|old_function|E_ERROR|or|as|E_WARNING|parent|'
-             r'eval|PHP_OS|break|exit|case|extends|PHP_VERSION|cfunction|'
-             r'FALSE|print|for|require|continue|foreach|require_once|'
-             r'declare|return|default|static|do|switch|die|stdClass|'
-             r'echo|else|TRUE|elseif|var|empty|if|xor|enddeclare|include|'
-             r'virtual|endfor|include_once|while|endforeach|global|__FILE__|'
-             r'endif|list|__LINE__|endswitch|new|__sleep|endwhile|not|'
-             r'array|__wakeup|E_ALL|NULL|final|php_user_filter|interface|'
-             r'implements|public|private|protected|abstract|clone|try|'
-             r'catch|throw|this|use|namespace)\b', Keyword),
+            (words((
+                'and', 'E_PARSE', 'old_function', 'E_ERROR', 'or', 'as',
+                'E_WARNING', 'parent', 'eval', 'PHP_OS', 'break', 'exit',
+                'case', 'extends', 'PHP_VERSION', 'cfunction', 'FALSE',
+                'print', 'for', 'require', 'continue', 'foreach',
+                'require_once', 'declare', 'return', 'default', 'static', 'do',
+                'switch', 'die', 'stdClass', 'echo', 'else', 'TRUE', 'elseif',
+                'var', 'empty', 'if', 'xor', 'enddeclare', 'include',
+                'virtual', 'endfor', 'include_once', 'while', 'endforeach',
+                'global', '__FILE__', 'endif', 'list', '__LINE__', 'endswitch',
+                'new', '__sleep', 'endwhile', 'not', 'array', '__wakeup',
+                'E_ALL', 'NULL', 'final', 'php_user_filter', 'interface',
+                'implements', 'public', 'private', 'protected', 'abstract',
+                'clone', 'try', 'catch', 'throw', 'this', 'use', 'namespace'),
+                suffix=r'\b'), Keyword),
             ('(true|false|null)\b', Keyword.Constant),
             (r'\$\{\$+[a-zA-Z_][a-zA-Z0-9_]*\}', Name.Variable),
             (r'\$+[a-zA-Z_][a-zA-Z0-9_]*', Name.Variable),
@@ -791,12 +834,11 @@ class PhpLexer(RegexLexer):
             self.startinline = options.pop('_startinline')
 
         # collect activated functions in a set
-        self._functions = set()
         if self.funcnamehighlighting:
-            from pygments.lexers._phpbuiltins import MODULES
-            for key, value in MODULES.iteritems():
-                if key not in self.disabledmodules:
-                    self._functions.update(value)
+            self._functions = builtin_names('_phpbuiltins', 'MODULES',
+                                            self.disabledmodules)
+        else:
+            self._functions = frozenset()
         RegexLexer.__init__(self, **options)
 
     def get_tokens_unprocessed(self, text):
@@ -811,6 +853,8 @@ class PhpLexer(RegexLexer):
                     continue
             yield index, token, value
 
+    analyse_hint = r'<\?|\?>'
+
     def analyse_text(text):
         rv = 0.0
         if re.search(r'<\?(?!xml)', text):
@@ -863,6 +907,8 @@ class XmlLexer(RegexLexer):
         ],
     }
 
+    analyse_hint = r'<'
+
     def analyse_text(text):
         if looks_like_xml(text):
             return 0.5
@@ -899,6 +945,8 @@ class XsltLexer(XmlLexer):
             else:
                 yield index, token, value
 
+    analyse_hint = r'<xsl'
+
     def analyse_text(text):
         if looks_like_xml(text) and '<xsl' in text:
             return 0.8
@@ -1167,6 +1215,8 @@ class HaxeLexer(RegexLexer):
         ],
     }
 
+    analyse_hint = r'\A\w+\s*:\s*\w'
+
     def analyse_text(text):
         if re.match(r'\w+\s*:\s*\w', text): return 0.3
 
@@ -21,6 +21,10 @@
     As you can see, you can define extensions for the formatter
     with a leading slash.
 
+    The entry points are loaded once per process, when they are first
+    needed.  Call `refresh_plugins()` to scan them again, or
+    `set_plugins_enabled(False)` to not use plugins at all.
+
     syntax plugins::
 
         [pygments.styles]
@@ -35,40 +39,89 @@
     :copyright: Copyright 2006-2010 by the Pygments team, see AUTHORS.
     :license: BSD, see LICENSE for details.
 """
-try:
-    import pkg_resources
-except ImportError:
-    pkg_resources = None
+import os
 
 LEXER_ENTRY_POINT = 'pygments.lexers'
 FORMATTER_ENTRY_POINT = 'pygments.formatters'
 STYLE_ENTRY_POINT = 'pygments.styles'
 FILTER_ENTRY_POINT = 'pygments.filters'
 
+#: loaded entry points by group, see _get_plugins()
+_plugins = {}
+
+#: functions clearing caches built from the plugins
+_refresh_hooks = []
+
+#: plugins can be switched off with an environment variable
+_enabled = not os.environ.get('PYGMENTS_NO_PLUGINS')
+
+
+def _get_plugins(group):
+    """
+    Return a list of ``(name, object)`` tuples for the entry points of
+    `group`.  setuptools is only imported, and the entry points are only
+    loaded, on the first call for each group.
+    """
+    try:
+        return _plugins[group]
+    except KeyError:
+        pass
+    result = []
+    if _enabled:
+        try:
+            import pkg_resources
+        except ImportError:
+            pkg_resources = None
+        if pkg_resources is not None:
+            for entrypoint in pkg_resources.iter_entry_points(group):
+                result.append((entrypoint.name, entrypoint.load()))
+    _plugins[group] = result
+    return result
+
+
+def refresh_plugins():
+    """
+    Forget the loaded plugins, so that the entry points are scanned again
+    when they are needed next, e.g. after installing a plugin.
+    """
+    _plugins.clear()
+    for hook in _refresh_hooks:
+        hook()
+
+
+def set_plugins_enabled(enabled):
+    """
+    Switch looking for plugins on or off.  They can also be switched off
+    by setting the environment variable ``PYGMENTS_NO_PLUGINS``.
+    """
+    global _enabled
+    _enabled = enabled
+    refresh_plugins()
+
+
+def on_refresh(hook):
+    """
+    Register a function that clears a cache built from the plugins; it is
+    called by `refresh_plugins()`.
+    """
+    _refresh_hooks.append(hook)
+
 
 def find_plugin_lexers():
-    if pkg_resources is None:
-        return
-    for entrypoint in pkg_resources.iter_entry_points(LEXER_ENTRY_POINT):
-        yield entrypoint.load()
+    for name, lexer in _get_plugins(LEXER_ENTRY_POINT):
+        yield lexer
 
 
 def find_plugin_formatters():
-    if pkg_resources is None:
-        return
-    for entrypoint in pkg_resources.iter_entry_points(FORMATTER_ENTRY_POINT):
-        yield entrypoint.name, entrypoint.load()
+    for name, formatter in _get_plugins(FORMATTER_ENTRY_POINT):
+        yield name, formatter
 
 
 def find_plugin_styles():
-    if pkg_resources is None:
-        return
-    for entrypoint in pkg_resources.iter_entry_points(STYLE_ENTRY_POINT):
-        yield entrypoint.name, entrypoint.load()
+    for name, style in _get_plugins(STYLE_ENTRY_POINT):
+        yield name, style
 
 
 def find_plugin_filters():
-    if pkg_resources is None:
-        return
-    for entrypoint in pkg_resources.iter_entry_points(FILTER_ENTRY_POINT):
-        yield entrypoint.name, entrypoint.load()
+    for name, filter in _get_plugins(FILTER_ENTRY_POINT):
+        yield name, filter
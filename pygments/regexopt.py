@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+    pygments.regexopt
+    ~~~~~~~~~~~~~~~~~
+
+    An algorithm that generates optimized regexes for matching long lists of
+    literal strings.
+
+    :copyright: Copyright 2006-2010 by the Pygments team, see AUTHORS.
+    :license: BSD, see LICENSE for details.
+"""
+
+import re
+from re import escape
+from os.path import commonprefix
+from itertools import groupby
+
+__all__ = ['regex_opt']
+
+
+CS_ESCAPE = re.compile(r'[\^\\\-\]]')
+
+
+def make_charset(letters):
+    return '[' + CS_ESCAPE.sub(lambda m: '\\' + m.group(), ''.join(letters)) \
+           + ']'
+
+
+def regex_opt_inner(strings, open_paren):
+    """
+    Return a regex that matches any string in the sorted list `strings`,
+    preferring longer matches, opened with `open_paren` if it needs a group.
+    """
+    close_paren = open_paren and ')' or ''
+    if not strings:
+        return ''
+    first = strings[0]
+    if len(strings) == 1:
+        return open_paren + escape(first) + close_paren
+    if not first:
+        # the empty string is optional after the others
+        return open_paren + regex_opt_inner(strings[1:], '(?:') \
+               + '?' + close_paren
+    if len(first) == 1:
+        # multiple one-char strings? make a charset
+        oneletter = []
+        rest = []
+        for s in strings:
+            if len(s) == 1:
+                oneletter.append(s)
+            else:
+                rest.append(s)
+        if len(oneletter) > 1:  # do we have more than one oneletter string?
+            if rest:
+                return open_paren + regex_opt_inner(rest, '') + '|' \
+                       + make_charset(oneletter) + close_paren
+            return open_paren + make_charset(oneletter) + close_paren
+    prefix = commonprefix(strings)
+    if prefix:
+        plen = len(prefix)
+        # we have a prefix for all strings
+        return open_paren + escape(prefix) \
+               + regex_opt_inner([s[plen:] for s in strings], '(?:') \
+               + close_paren
+    # is there a suffix?
+    strings_rev = [s[::-1] for s in strings]
+    suffix = commonprefix(strings_rev)
+    if suffix:
+        slen = len(suffix)
+        return open_paren \
+               + regex_opt_inner(sorted([s[:-slen] for s in strings]), '(?:') \
+               + escape(suffix[::-1]) + close_paren
+    # recurse on common 1-string prefixes
+    return open_paren + \
+           '|'.join([regex_opt_inner(list(group[1]), '')
+                     for group in groupby(strings, lambda s: s[0])]) \
+           + close_paren
+
+
+def regex_opt(strings, prefix='', suffix=''):
+    """
+    Return a regex string that matches any string in the given
+    list, with common prefixes and suffixes factored out and single
+    characters combined into character classes.
+
+    The strings to match must be literal strings, not regexes.  They will
+    be regex-escaped.  Where several strings match at a position, the
+    longest one is preferred, so `suffix` (e.g. ``r'\\b'``) should rule out
+    ambiguities if the strings are prefixes of each other.
+
+    The alternatives are put into one capturing group, so the result can
+    replace a regex like ``(foo|bar)`` without changing the group numbers.
+    `prefix` and `suffix` are prepended and appended unchanged.
+    """
+    strings = sorted(strings)
+    return prefix + regex_opt_inner(strings, '(') + suffix
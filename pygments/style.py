@@ -74,6 +74,12 @@ class StyleMeta(type):
                     else:
                         ndef[0] = colorformat(styledef)
 
+        # maps every token type seen so far to its effective style dict;
+        # other token types are added by `resolve_token` on first use
+        obj.resolved_styles = {}
+        for token in _styles:
+            obj.resolved_styles[token] = obj.style_for_token(token)
+
         return obj
 
     def style_for_token(cls, token):
@@ -90,6 +96,24 @@ class StyleMeta(type):
             'mono':         bool(t[8]) or None,
         }
 
+    def resolve_token(cls, ttype):
+        """
+        Return the style dict that applies to ``ttype``, i.e. the one of
+        its nearest ancestor that is defined by the style.  The result is
+        cached in the ``resolved_styles`` dict, which is shared by all
+        formatters using this style, so subsequent lookups are a single
+        dict access.  The returned dict must not be modified.
+        """
+        resolved = cls.resolved_styles
+        try:
+            return resolved[ttype]
+        except KeyError:
+            node = ttype
+            while node not in resolved:
+                node = node.parent
+            ndef = resolved[ttype] = resolved[node]
+            return ndef
+
     def list_styles(cls):
         return list(cls)
 
@@ -9,6 +9,10 @@
     :license: BSD, see LICENSE for details.
 """
 
+# Maps token type ids to token types, see `_TokenType.id`.
+_ttype_by_id = []
+
+
 class _TokenType(tuple):
     parent = None
 
@@ -24,11 +28,17 @@ class _TokenType(tuple):
     def __init__(self, *args):
         # no need to call super.__init__
         self.subtypes = set()
+        # small integer id, unique for this process; usable as an index
+        # into lists instead of hashing the token type
+        self.id = len(_ttype_by_id)
+        _ttype_by_id.append(self)
+        # ids of this type and all its parents, for fast subtype checks
+        self.ancestor_ids = frozenset([self.id])
 
     def __contains__(self, val):
         return self is val or (
             type(val) is self.__class__ and
-            val[:len(self)] == self
+            self.id in val.ancestor_ids
         )
 
     def __getattr__(self, val):
@@ -38,14 +48,20 @@ class _TokenType(tuple):
         setattr(self, val, new)
         self.subtypes.add(new)
         new.parent = self
+        new.ancestor_ids = self.ancestor_ids | new.ancestor_ids
         return new
 
-    def __hash__(self):
-        return hash(tuple(self))
+    # __hash__ is inherited from tuple: a Python-level override that
+    # returns the same value would only slow down every dict lookup
 
     def __repr__(self):
         return 'Token' + (self and '.' or '') + '.'.join(self)
 
+    def __reduce__(self):
+        # ids differ between processes, so unpickle (and copy) to the
+        # token type of the same name in this process
+        return string_to_tokentype, ('.'.join(self),)
+
 
 Token       = _TokenType()
 
@@ -85,6 +101,21 @@ def is_token_subtype(ttype, other):
     return ttype in other
 
 
+def id_to_tokentype(tid):
+    """
+    Return the token type with the id ``tid``::
+
+        >>> id_to_tokentype(String.id)
+        Token.Literal.String
+
+    Ids are assigned in creation order, so they are only stable within
+    one process.  Raise `IndexError` for unknown ids.
+    """
+    if tid < 0:
+        raise IndexError('invalid token type id %r' % tid)
+    return _ttype_by_id[tid]
+
+
 def string_to_tokentype(s):
     """
     Convert a string into a token type::
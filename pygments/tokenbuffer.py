@@ -0,0 +1,384 @@
+# -*- coding: utf-8 -*-
+"""
+    pygments.tokenbuffer
+    ~~~~~~~~~~~~~~~~~~~~
+
+    Compact storage for token streams.
+
+    :copyright: Copyright 2006-2010 by the Pygments team, see AUTHORS.
+    :license: BSD, see LICENSE for details.
+"""
+
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import izip, islice
+
+from pygments.lexer import _uses_regex_loop
+from pygments.token import _ttype_by_id, string_to_tokentype
+from pygments.util import b, SpanError
+
+__all__ = ['TokenBuffer', 'LineIndex', 'TokenStream', 'count_lines']
+
+
+# format version of `TokenBuffer.dumps()`
+_dump_version = 'TB1'
+
+
+def _types_array():
+    """
+    Return an empty array for token type ids, using 16-bit items unless
+    there are too many token types for that.
+    """
+    if len(_ttype_by_id) < 0xff00:
+        return array('H')
+    return array('I')
+
+
+def count_lines(text, start=0, end=None):
+    """
+    Return the number of lines of ``text[start:end]``, counted like
+    `LineIndex` does: a last line without newline counts, a trailing
+    newline doesn't start another line.
+    """
+    if end is None:
+        end = len(text)
+    if start >= end:
+        return 0
+    n = text.count('\n', start, end)
+    if text[end - 1] != '\n':
+        n += 1
+    return n
+
+
+class LineIndex(object):
+    """
+    The start offsets of the lines of a text, for mapping offsets to line
+    numbers and back in logarithmic time.
+
+    Lines are numbered from 1 and columns from 0.  A newline belongs to
+    the line it ends; a trailing newline doesn't start another line.
+
+    *New in Pygments 1.4.*
+    """
+
+    def __init__(self, text):
+        starts = array('I', [0])
+        find = text.find
+        pos = find('\n')
+        while pos != -1:
+            pos += 1
+            starts.append(pos)
+            pos = find('\n', pos)
+        #: array of the offsets at which the lines start
+        self.starts = starts
+        #: the length of the indexed text
+        self.length = len(text)
+
+    def __len__(self):
+        """Return the number of lines."""
+        if self.starts[-1] == self.length:
+            return len(self.starts) - 1
+        return len(self.starts)
+
+    def __repr__(self):
+        return '<pygments.tokenbuffer.LineIndex with %d lines>' % len(self)
+
+    def position(self, offset):
+        """
+        Return the ``(line, column)`` of the character at `offset`.
+        """
+        if not 0 <= offset <= self.length:
+            raise ValueError('offset %d out of range' % offset)
+        line = bisect_right(self.starts, offset) - 1
+        return line + 1, offset - self.starts[line]
+
+    def offset(self, line, column=0):
+        """
+        Return the offset of `column` in `line`, the inverse of
+        `position()`.
+        """
+        return self.line_range(line, line)[0] + column
+
+    def line_range(self, first, last):
+        """
+        Return the ``(start, end)`` offsets of the lines `first` to `last`
+        (inclusive), including the newline ending `last`.
+        """
+        if not 1 <= first <= last + 1 or last > len(self):
+            raise ValueError('line range %d-%d out of range' % (first, last))
+        start = self.starts[first - 1]
+        if last < len(self.starts):
+            return start, self.starts[last]
+        return start, self.length
+
+
+class TokenBuffer(object):
+    """
+    A token stream stored in columns: the token type ids in one array, the
+    token offsets in another, and the text the values are slices of.
+
+    Compared to a list of ``(tokentype, value)`` tuples this needs a few
+    bytes per token instead of a tuple and a string object, so it is well
+    suited for caching token streams or formatting them more than once.
+    Token values are only created when they are accessed.
+
+    A buffer is an iterable of ``(tokentype, value)`` tuples, so it can be
+    passed to formatters and filters like any other token stream::
+
+        buf = TokenBuffer(lexer.get_tokens(code))
+        highlight_html = format(buf, HtmlFormatter())
+        highlight_tex = format(buf, LatexFormatter())
+
+    If `text` is given and the values of `tokensource` concatenate to it,
+    the buffer refers to `text` instead of building a copy of it.
+
+    *New in Pygments 1.4.*
+    """
+
+    def __init__(self, tokensource=(), text=None):
+        types = _types_array()
+        offsets = array('I', [0])
+        pos = 0
+        parts = None
+        if text is None:
+            parts = []
+        for ttype, value in tokensource:
+            if parts is not None:
+                parts.append(value)
+            elif not text.startswith(value, pos):
+                # the stream was changed (e.g. by a filter), so the
+                # values are no slices of the given text any more
+                parts = [text[:pos], value]
+            types.append(ttype.id)
+            pos += len(value)
+            offsets.append(pos)
+        if parts is not None:
+            text = u''.join(parts)
+        #: the text all token values are slices of
+        self.text = text
+        #: array of the token type ids, see `pygments.token`
+        self.types = types
+        #: array of the start offsets of the tokens in `text`, followed by
+        #: the end offset of the last token
+        self.offsets = offsets
+        self._lineindex = None
+
+    @classmethod
+    def from_lexer(cls, lexer, text, unfiltered=False):
+        """
+        Lex `text` with `lexer` into a new buffer.
+
+        Lexers that use the main loop of `RegexLexer` without filters
+        (which may need to change token values) produce spans, so no
+        string is created for each token.  The buffer then refers to the
+        preprocessed text, see `Lexer.preprocess_text()`.  Other lexers
+        are asked for their tokens, whose values need not reproduce the
+        text.
+        """
+        code = text
+        text = lexer.preprocess_text(code)
+        if _uses_regex_loop(lexer) and (unfiltered or not lexer.filters):
+            types = _types_array()
+            offsets = array('I', [0])
+            add_type = types.append
+            add_offset = offsets.append
+            try:
+                # spans are contiguous, so only the ends need to be stored
+                for start, end, ttype in lexer.get_spans_unprocessed(text):
+                    add_type(ttype.id)
+                    add_offset(end)
+            except SpanError:
+                # a callback doesn't reproduce its match
+                pass
+            else:
+                return cls._from_arrays(text, types, offsets)
+        if unfiltered:
+            return cls(lexer.get_tokens(code, unfiltered=True), text)
+        return cls(lexer.get_tokens(code), text)
+
+    @classmethod
+    def _from_arrays(cls, text, types, offsets, lineindex=None):
+        buf = cls.__new__(cls)
+        buf.text = text
+        buf.types = types
+        buf.offsets = offsets
+        buf._lineindex = lineindex
+        return buf
+
+    def __len__(self):
+        return len(self.types)
+
+    def __iter__(self):
+        text = self.text
+        start = self.offsets[0]
+        for tid, end in izip(self.types, islice(self.offsets, 1, None)):
+            yield _ttype_by_id[tid], text[start:end]
+            start = end
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self.types))
+            if step != 1:
+                raise ValueError('token buffers only support contiguous '
+                                 'slices')
+            stop = max(start, stop)
+            return self._from_arrays(self.text, self.types[start:stop],
+                                     self.offsets[start:stop + 1],
+                                     self._lineindex)
+        if index < 0:
+            index += len(self.types)
+        if not 0 <= index < len(self.types):
+            raise IndexError('token index out of range')
+        return (_ttype_by_id[self.types[index]],
+                self.text[self.offsets[index]:self.offsets[index + 1]])
+
+    def __repr__(self):
+        return '<pygments.tokenbuffer.TokenBuffer with %d tokens>' % \
+               len(self.types)
+
+    def get_text(self):
+        """
+        Return the concatenated token values.
+        """
+        return self.text[self.offsets[0]:self.offsets[-1]]
+
+    def get_line_index(self):
+        """
+        Return the `LineIndex` of `text`.  It is created on first use and
+        shared with the buffers sliced from this one.
+        """
+        if self._lineindex is None:
+            self._lineindex = LineIndex(self.text)
+        return self._lineindex
+
+    def count_lines(self):
+        """
+        Return the number of lines the tokens span.
+        """
+        return count_lines(self.text, self.offsets[0], self.offsets[-1])
+
+    def get_lines(self, first, last):
+        """
+        Return a buffer with the tokens of the lines `first` to `last`
+        (inclusive) of `text`, splitting tokens that span the boundaries.
+        The buffer shares the text and line index with this one.
+        """
+        start, end = self.get_line_index().line_range(first, last)
+        offsets = self.offsets
+        start = max(start, offsets[0])
+        end = min(end, offsets[-1])
+        if start >= end:
+            return self._from_arrays(self.text, self.types[:0],
+                                     array('I', [start]), self._lineindex)
+        # tokens i to j - 1 overlap the range
+        i = bisect_right(offsets, start) - 1
+        j = bisect_left(offsets, end)
+        newoffsets = array('I', [start])
+        newoffsets.extend(offsets[i + 1:j])
+        newoffsets.append(end)
+        return self._from_arrays(self.text, self.types[i:j], newoffsets,
+                                 self._lineindex)
+
+    def dumps(self, include_text=True):
+        """
+        Return the buffer serialized as a byte string, for `loads()`.
+
+        Token type ids are only valid in one process, so the token types
+        are stored by name in a table, followed by the ids within that
+        table and the offsets as machine integers.  If `include_text` is
+        false, the text is left out and must be given to `loads()`.
+        """
+        local = {}
+        names = []
+        for tid in self.types:
+            if tid not in local:
+                local[tid] = len(names)
+                names.append(repr(_ttype_by_id[tid]))
+        types = array('H', [local[tid] for tid in self.types])
+        header = '%s %s %d %d\n%s\n' % (_dump_version, sys.byteorder,
+                                         len(types), include_text,
+                                         ' '.join(names))
+        parts = [b(header), types.tostring(), self.offsets.tostring()]
+        if include_text:
+            parts.append(self.text.encode('utf-8'))
+        return b('').join(parts)
+
+    @classmethod
+    def loads(cls, data, text=None):
+        """
+        Return the buffer serialized by `dumps()` in `data`.  `text` must
+        be given if it was not included, and is then the text of the
+        buffer.  Raise `ValueError` if `data` is not a serialized buffer.
+        """
+        try:
+            end = data.index(b('\n'))
+            end = data.index(b('\n'), end + 1) + 1
+            header, names = data[:end].decode('ascii').split('\n')[:2]
+            version, byteorder, ntokens, has_text = header.split()
+            ntokens = int(ntokens)
+        except (ValueError, UnicodeError):
+            raise ValueError('not a serialized token buffer')
+        if version != _dump_version:
+            raise ValueError('unsupported token buffer version %r' % version)
+        ids = [string_to_tokentype(name).id for name in names.split()]
+        types = array('H')
+        offsets = array('I')
+        pos = end + types.itemsize * ntokens
+        types.fromstring(data[end:pos])
+        end = pos + offsets.itemsize * (ntokens + 1)
+        offsets.fromstring(data[pos:end])
+        if byteorder != sys.byteorder:
+            types.byteswap()
+            offsets.byteswap()
+        newtypes = _types_array()
+        newtypes.extend([ids[tid] for tid in types])
+        if has_text == '1':
+            text = data[end:].decode('utf-8')
+        elif text is None:
+            raise ValueError('the text of the buffer must be given')
+        if len(offsets) != ntokens + 1 or offsets[-1] > len(text):
+            raise ValueError('truncated token buffer')
+        return cls._from_arrays(text, newtypes, offsets)
+
+    def iter_unprocessed(self):
+        """
+        Return an iterator over ``(index, tokentype, value)`` tuples, like
+        the ``get_tokens_unprocessed()`` method of lexers.  ``index`` is
+        the offset of the token in `text`.
+        """
+        text = self.text
+        start = self.offsets[0]
+        for tid, end in izip(self.types, islice(self.offsets, 1, None)):
+            yield start, _ttype_by_id[tid], text[start:end]
+            start = end
+
+
+class TokenStream(object):
+    """
+    A token stream together with the text it was lexed from, for
+    formatters that need to know the number of lines before formatting
+    them (like the HTML formatter with line numbers): `count_lines()`
+    counts them in the text, without consuming the stream.
+
+    Iterating over it iterates over the wrapped stream, so it can be
+    iterated over only once if that is a generator.  `highlight()` passes
+    the tokens of `RegexLexer` subclasses without filters to the formatter
+    this way.
+
+    *New in Pygments 1.4.*
+    """
+
+    def __init__(self, tokensource, text):
+        self.tokensource = tokensource
+        #: the text whose tokens the stream yields
+        self.text = text
+
+    def __iter__(self):
+        return iter(self.tokensource)
+
+    def count_lines(self):
+        """
+        Return the number of lines of `text`.
+        """
+        return count_lines(self.text)
@@ -12,6 +12,8 @@
 import re
 import sys
 import codecs
+import fnmatch
+from os.path import normcase
 
 
 split_path_re = re.compile(r'[/\\ ]')
@@ -36,6 +38,13 @@ class OptionError(Exception):
     pass
 
 
+class SpanError(ValueError):
+    """
+    If the tokens of a lexer are not the consecutive slices of its input
+    text, so that they can't be described by offsets into it.
+    """
+
+
 def get_choice_opt(options, optname, allowed, default=None, normcase=False):
     string = options.get(optname, default)
     if normcase:
@@ -200,6 +209,172 @@ def looks_like_xml(text):
         _looks_like_xml_cache[key] = rv
         return rv
 
+
+_escape_html_re = re.compile(u'[&<>"\']')
+_escape_html_table = {
+    u'&': u'&amp;',
+    u'<': u'&lt;',
+    u'>': u'&gt;',
+    u'"': u'&quot;',
+    u"'": u'&#39;',
+}
+
+def escape_html(text):
+    """
+    Escape &, <, > as well as single and double quotes for HTML and XML.
+
+    Most tokens contain none of these and are returned unchanged after a
+    single scan.  Single characters are looked up in a table, which is the
+    most common case of the rest.
+    """
+    if _escape_html_re.search(text) is None:
+        return text
+    if len(text) == 1 and isinstance(text, unicode):
+        return _escape_html_table[text]
+    return text.replace('&', '&amp;').  \
+                replace('<', '&lt;').   \
+                replace('>', '&gt;').   \
+                replace('"', '&quot;'). \
+                replace("'", '&#39;')
+
+
+_glob_chars_re = re.compile(r'[*?[]')
+
+class FilenameIndex(object):
+    """
+    Match file names against the glob patterns of many values at once,
+    with the same results as calling `fnmatch.fnmatch()` for every pattern.
+
+    Patterns without wildcards are looked up in a dict of names, and
+    ``*.ext`` patterns in a dict of suffixes; only the remaining patterns
+    are matched as regular expressions.  Results are cached per file name.
+    """
+
+    #: number of file names whose results are cached
+    cache_size = 10000
+
+    def __init__(self):
+        self._values = []
+        self._names = {}
+        self._suffixes = {}
+        self._globs = []
+        self._cache = {}
+
+    def add(self, value, patterns):
+        """
+        Add `value` with a list of glob `patterns`.
+        """
+        pos = len(self._values)
+        self._values.append(value)
+        self._cache.clear()
+        for pattern in patterns:
+            pattern = normcase(pattern)
+            suffix = pattern[1:]
+            if not _glob_chars_re.search(pattern):
+                self._names.setdefault(pattern, []).append(pos)
+            elif pattern.startswith('*.') and \
+                 not _glob_chars_re.search(suffix):
+                self._suffixes.setdefault(suffix, []).append(pos)
+            else:
+                regex = re.compile(fnmatch.translate(pattern))
+                self._globs.append((regex.match, pos))
+
+    def match(self, filename):
+        """
+        Return a tuple of the values with a pattern matching `filename`, in
+        the order they were added.
+        """
+        try:
+            return self._cache[filename]
+        except KeyError:
+            pass
+        name = normcase(filename)
+        found = {}
+        for pos in self._names.get(name, ()):
+            found[pos] = True
+        suffixes = self._suffixes
+        i = name.find('.')
+        while i != -1:
+            for pos in suffixes.get(name[i:], ()):
+                found[pos] = True
+            i = name.find('.', i + 1)
+        for match, pos in self._globs:
+            if pos not in found and match(name):
+                found[pos] = True
+        positions = found.keys()
+        positions.sort()
+        values = self._values
+        result = tuple([values[pos] for pos in positions])
+        if len(self._cache) >= self.cache_size:
+            self._cache.clear()
+        self._cache[filename] = result
+        return result
+
+
+def _class_name(cls):
+    """
+    Return the qualified name of `cls` if it names the same class in every
+    process, or None.  That is not the case for classes that can't be
+    found under their name in their module (e.g. classes created inside
+    functions) and for classes in ``__main__``, which is another module
+    in every script.
+    """
+    module = cls.__module__
+    if module == '__main__' or \
+       getattr(sys.modules.get(module), cls.__name__, None) is not cls:
+        return None
+    return '%s.%s' % (module, cls.__name__)
+
+
+def _stable_repr(value):
+    """
+    Return a representation of `value` that is the same in every process,
+    or None if there is none.
+    """
+    if value is None or isinstance(value, (basestring, int, long, float)):
+        return repr(value)
+    if isinstance(value, type):
+        return _class_name(value)
+    if isinstance(value, (list, tuple)):
+        items = [_stable_repr(item) for item in value]
+        if None in items:
+            return None
+        return '[%s]' % ', '.join(items)
+    if isinstance(value, dict):
+        items = []
+        for key, item in value.iteritems():
+            key = _stable_repr(key)
+            item = _stable_repr(item)
+            if key is None or item is None:
+                return None
+            items.append('%s: %s' % (key, item))
+        items.sort()
+        return '{%s}' % ', '.join(items)
+    return None
+
+
+def cache_key(cls, options, skip=()):
+    """
+    Return a string that identifies an instance of `cls` created with the
+    given `options`, leaving out the options named in `skip`.  It is the
+    same in every process, so that it can be part of a persistent cache key.
+
+    Option values may be strings, numbers, booleans, ``None``, classes and
+    lists, tuples and dicts of these.  If one is something else, its repr
+    could differ between processes and None is returned; so it is if `cls`
+    or a class among the values has no stable name (see `_class_name()`).
+    """
+    items = {}
+    for name, value in options.iteritems():
+        if name not in skip:
+            items[name] = value
+    key = _stable_repr(items)
+    name = _class_name(cls)
+    if key is None or name is None:
+        return None
+    return name + key
+
+
 # Python 2/3 compatibility
 
 if sys.version_info < (3,0):
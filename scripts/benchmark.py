@@ -0,0 +1,513 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+    Pygments benchmarks
+    ~~~~~~~~~~~~~~~~~~~
+
+    Speed and memory benchmarks, run over the example files of the test
+    suite.
+
+    Usage::
+
+        python benchmark.py [-n repeat] [benchmark ...]
+
+    Without arguments, all benchmarks are run.  Use ``-l`` to list them.
+
+    :copyright: Copyright 2006-2010 by the Pygments team, see AUTHORS.
+    :license: BSD, see LICENSE for details.
+"""
+
+import sys, os, time, getopt
+
+try:
+    import pygments
+except ImportError:
+    # try parent path
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from pygments.lexers import get_lexer_for_filename, get_lexer_by_name
+from pygments.util import ClassNotFound
+
+
+EXAMPLEDIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          '..', 'tests', 'examplefiles')
+
+#: number of times each timed function is run, the best time is reported
+repeat = 3
+
+
+def load_examples():
+    """
+    Return a list of ``(filename, lexer, text)`` for the example files.
+    """
+    result = []
+    for fn in sorted(os.listdir(EXAMPLEDIR)):
+        absfn = os.path.join(EXAMPLEDIR, fn)
+        if not os.path.isfile(absfn):
+            continue
+        try:
+            lx = get_lexer_for_filename(fn)
+        except ClassNotFound:
+            try:
+                lx = get_lexer_by_name(fn.split('_', 1)[0])
+            except ClassNotFound:
+                continue
+        text = open(absfn, 'rb').read()
+        try:
+            text = text.decode('utf-8')
+        except UnicodeError:
+            text = text.decode('latin1')
+        result.append((fn, lx, text))
+    return result
+
+
+def timed(func, *args):
+    """
+    Call ``func(*args)`` `repeat` times; return the best time in seconds.
+    """
+    best = None
+    for i in xrange(repeat):
+        t0 = time.time()
+        func(*args)
+        t = time.time() - t0
+        if best is None or t < best:
+            best = t
+    return best
+
+
+def sizeof(obj, seen):
+    """
+    Return the size of `obj` and the objects it contains (for tuples and
+    lists), counting each object only once per `seen` dict.
+    """
+    if id(obj) in seen:
+        return 0
+    seen[id(obj)] = obj
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (tuple, list)):
+        for item in obj:
+            size += sizeof(item, seen)
+    return size
+
+
+def report(name, value, unit=''):
+    print '  %-40s %12s %s' % (name, value, unit)
+
+
+def bench_tokenbuffer(examples):
+    """Retained memory of token lists vs. token buffers."""
+    from pygments.token import _ttype_by_id
+    from pygments.tokenbuffer import TokenBuffer
+
+    streams = [list(lx.get_tokens(text)) for fn, lx, text in examples]
+    ntokens = sum([len(s) for s in streams])
+    # token types are shared by all streams, don't count them
+    seen = dict([(id(t), t) for t in _ttype_by_id])
+    listsize = sum([sizeof(s, seen) for s in streams])
+
+    buffers = [TokenBuffer(s) for s in streams]
+    bufsize = sum([sys.getsizeof(b.types) + sys.getsizeof(b.offsets) +
+                   sys.getsizeof(b.text) for b in buffers])
+
+    report('tokens', ntokens)
+    report('list of tuples', listsize // 1024, 'KiB')
+    report('token buffers', bufsize // 1024, 'KiB')
+    report('ratio', '%.1fx' % (float(listsize) / bufsize))
+
+    def build():
+        for s in streams:
+            TokenBuffer(s)
+    def replay():
+        for b in buffers:
+            for t in b:
+                pass
+    report('building buffers', '%.3f' % timed(build), 's')
+    report('iterating buffers', '%.3f' % timed(replay), 's')
+
+
+def bench_spans(examples):
+    """Lexing into token tuples vs. lexing into spans (token buffers)."""
+    from pygments.token import _ttype_by_id
+    from pygments.tokenbuffer import TokenBuffer
+
+    def lex_tuples():
+        return [list(lx.get_tokens(text)) for fn, lx, text in examples]
+    def lex_spans():
+        return [TokenBuffer.from_lexer(lx, text) for fn, lx, text in examples]
+    report('lexing to tuple lists', '%.3f' % timed(lex_tuples), 's')
+    report('lexing to span buffers', '%.3f' % timed(lex_spans), 's')
+
+    seen = dict([(id(t), t) for t in _ttype_by_id])
+    listsize = sum([sizeof(s, seen) for s in lex_tuples()])
+    # the buffers refer to the lexed text, which is counted once
+    bufsize = sum([sys.getsizeof(b.types) + sys.getsizeof(b.offsets) +
+                   sys.getsizeof(b.text) for b in lex_spans()])
+    report('tuple lists', listsize // 1024, 'KiB')
+    report('span buffers incl. text', bufsize // 1024, 'KiB')
+
+
+def bench_analysers(examples):
+    """Runtime of the analyse_text() methods and of guessing large texts."""
+    from pygments.lexer import Lexer
+    from pygments.lexers import _iter_lexerclasses, guess_lexer, \
+         set_analysis_window
+
+    texts = [text for fn, lx, text in examples]
+    def analyse(cls):
+        for text in texts:
+            cls.analyse_text(text)
+    times = []
+    for cls in _iter_lexerclasses():
+        if cls.analyse_text is not Lexer.analyse_text:
+            times.append((timed(analyse, cls), cls.__name__))
+    times.sort()
+    times.reverse()
+    report('analysers', len(times))
+    report('all analysers, all examples', '%.3f' % sum([t for t, n in times]),
+           's')
+    for t, name in times[:15]:
+        report(name, '%.4f' % t, 's')
+
+    # a large document, with and without the default analysis window
+    big = u'\n'.join(texts) * 10
+    report('guessing a text of', len(big) // 1024, 'KiB')
+    report('  with the default window', '%.3f' % timed(guess_lexer, big), 's')
+    old = set_analysis_window(None)
+    try:
+        report('  without window', '%.3f' % timed(guess_lexer, big), 's')
+    finally:
+        set_analysis_window(*old)
+
+
+def bench_classifier(examples):
+    """Accuracy and latency of lexer guessing with and without classifier."""
+    from pygments.classifier import NgramClassifier
+    from pygments.lexers import guess_lexer, set_guess_classifier
+    from pygments.util import ClassNotFound
+
+    # train on the first half of every example, test on the second half
+    train = []
+    test = []
+    for fn, lx, text in examples:
+        lines = text.splitlines(True)
+        half = len(lines) // 2
+        train.append((lx.name, u''.join(lines[:half])))
+        if len(lines) - half >= 5:
+            test.append((lx.name, u''.join(lines[half:])))
+    t0 = time.time()
+    classifier = NgramClassifier.train(train)
+    report('training', '%.3f' % (time.time() - t0), 's')
+    report('test samples', len(test))
+
+    def evaluate(guess):
+        correct = 0
+        t0 = time.time()
+        for name, text in test:
+            try:
+                if guess(text) == name:
+                    correct += 1
+            except ClassNotFound:
+                pass
+        t = time.time() - t0
+        return '%d%%' % (100 * correct // len(test)), \
+               '%.2f ms/guess' % (1000 * t / len(test))
+    def guess(text):
+        return guess_lexer(text).name
+    def rank(text):
+        return classifier.rank(text)[0][1]
+
+    report('analyse_text() only', *evaluate(guess))
+    report('classifier only', *evaluate(rank))
+    set_guess_classifier(classifier)
+    try:
+        report('classifier and analyse_text()', *evaluate(guess))
+    finally:
+        set_guess_classifier(None)
+
+
+def bench_builtins(examples):
+    """Construction time and per-instance memory of builtin name lexers."""
+    from pygments import lexers
+
+    for name in ['PhpLexer', 'LuaLexer', 'CommonLispLexer', 'VimLexer',
+                 'AsymptoteLexer']:
+        cls = getattr(lexers, name)
+        first, second = cls(), cls()
+        # count the attribute values that are not shared between instances
+        size = sys.getsizeof(first.__dict__)
+        for attr, value in first.__dict__.iteritems():
+            if value is not second.__dict__.get(attr):
+                size += sys.getsizeof(value)
+        def construct():
+            for i in xrange(100):
+                cls()
+        report(name, '%.3f ms, %d bytes' % (timed(construct) * 10, size),
+               'per instance')
+
+
+class NullWriter(object):
+    """A file-like object that discards what is written to it."""
+
+    def write(self, text):
+        pass
+
+
+def bench_html(examples):
+    """Formatting speed of the HTML formatter, in tokens per second."""
+    from pygments.formatters import HtmlFormatter
+
+    streams = [list(lx.get_tokens(text)) for fn, lx, text in examples]
+    ntokens = sum([len(s) for s in streams])
+    report('tokens', ntokens)
+    outfile = NullWriter()
+    for name, options in [('default', {}),
+                          ('noclasses', {'noclasses': True}),
+                          ('table line numbers', {'linenos': 'table'}),
+                          ('inline line numbers', {'linenos': 'inline'}),
+                          ('hl_lines and anchors', {'hl_lines': '1 5 10',
+                                                    'lineanchors': 'l'})]:
+        fmt = HtmlFormatter(**options)
+        def run():
+            for s in streams:
+                fmt.format(s, outfile)
+        report(name, '%d' % (ntokens / timed(run)), 'tokens/s')
+
+
+def bench_escape(examples):
+    """HTML escaping of token values, for code and for markup."""
+    from pygments.util import escape_html
+
+    def escape_chained(text):
+        # the former implementation, for comparison
+        return text.replace('&', '&amp;').replace('<', '&lt;'). \
+               replace('>', '&gt;').replace('"', '&quot;'). \
+               replace("'", '&#39;')
+    code = []
+    markup = []
+    for fn, lx, text in examples:
+        values = [value for ttype, value in lx.get_tokens(text)]
+        if 'xml' in lx.aliases or 'html' in lx.aliases:
+            markup.extend(values)
+        else:
+            code.extend(values)
+    for name, values in [('code', code), ('markup', markup)]:
+        report(name + ' tokens', len(values))
+        for fname, func in [('chained replace', escape_chained),
+                            ('escape_html', escape_html)]:
+            def run():
+                for value in values:
+                    func(value)
+            report('  ' + fname, '%d' % (len(values) / timed(run)),
+                   'tokens/s')
+
+
+def bench_cache(examples):
+    """Highlighting all example files to HTML, uncached and from caches."""
+    import shutil
+    import tempfile
+    from pygments import highlight, format
+    from pygments.cache import MemoryCache, FileCache
+    from pygments.formatters import HtmlFormatter
+
+    fmt = HtmlFormatter()
+    def run(highlight):
+        for fn, lx, text in examples:
+            highlight(text, lx, fmt)
+    report('uncached', '%.1f' % (timed(run, highlight) * 1000), 'ms')
+    cache = MemoryCache(maxsize=256 * 1024 * 1024)
+    run(cache.highlight)
+    report('memory cache hits', '%.1f' % (timed(run, cache.highlight)
+                                          * 1000), 'ms')
+    directory = tempfile.mkdtemp()
+    try:
+        cache = FileCache(directory)
+        run(cache.highlight)
+        report('file cache hits', '%.1f' % (timed(run, cache.highlight)
+                                            * 1000), 'ms')
+    finally:
+        shutil.rmtree(directory)
+    # formatting from cached tokens, as for another style
+    cache = MemoryCache(maxsize=256 * 1024 * 1024)
+    def run_tokens():
+        for fn, lx, text in examples:
+            format(cache.get_tokens(text, lx), fmt)
+    run_tokens()
+    report('token cache hits, formatted', '%.1f' % (timed(run_tokens)
+                                                    * 1000), 'ms')
+    report('token cache size', '%.1f' % (cache.size / 1048576.0), 'MiB')
+
+
+def bench_compact(examples):
+    """Output size and speed of the HTML formatter's compact option."""
+    from pygments import format
+    from pygments.formatters import HtmlFormatter
+
+    streams = [list(lx.get_tokens(text)) for fn, lx, text in examples]
+    ntokens = sum([len(s) for s in streams])
+    for name, options in [('classes', {}),
+                          ('noclasses', {'noclasses': True})]:
+        sizes = []
+        for compact in (False, True):
+            fmt = HtmlFormatter(compact=compact, **options)
+            def run():
+                for s in streams:
+                    format(s, fmt)
+            t = timed(run)
+            sizes.append(sum([len(format(s, fmt)) for s in streams]))
+            report('%s%s' % (name, compact and ', compact' or ''),
+                   '%d KiB, %d tokens/s' % (sizes[-1] // 1024, ntokens / t))
+        report('  bytes saved', '%d KiB (%d%%)' % (
+            (sizes[0] - sizes[1]) // 1024,
+            100 * (sizes[0] - sizes[1]) // sizes[0]))
+
+
+def bench_htmlinit(examples):
+    """Creating HTML formatters and their style definitions."""
+    from pygments.formatters import HtmlFormatter
+
+    def create(options):
+        for i in xrange(100):
+            HtmlFormatter(**options)
+    def style_defs():
+        for i in xrange(100):
+            HtmlFormatter().get_style_defs('.highlight')
+    for name, options in [('default', {}),
+                          ('noclasses', {'noclasses': True}),
+                          ('style=monokai', {'style': 'monokai'})]:
+        report(name, '%.3f' % (timed(create, options) * 10), 'ms')
+    report('with get_style_defs()', '%.3f' % (timed(style_defs) * 10), 'ms')
+
+
+def bench_many(examples):
+    """HTML, LaTeX and terminal output by highlight() or format_many()."""
+    from pygments import highlight, format_many, lex
+    from pygments.formatters import HtmlFormatter, LatexFormatter, \
+         TerminalFormatter
+
+    fmts = [HtmlFormatter(linenos='table'), LatexFormatter(),
+            TerminalFormatter()]
+    def run_highlight():
+        for fn, lx, text in examples:
+            for fmt in fmts:
+                highlight(text, lx, fmt)
+    def run_many():
+        for fn, lx, text in examples:
+            format_many(lex(text, lx), [(fmt, None) for fmt in fmts])
+    report('highlight() per format', '%.1f' % (timed(run_highlight) * 1000),
+           'ms')
+    report('format_many()', '%.1f' % (timed(run_many) * 1000), 'ms')
+
+
+def bench_range(examples):
+    """highlight_range() of 100 lines in the middle of a long file."""
+    from pygments import highlight, highlight_range, set_highlight_cache
+    from pygments.cache import MemoryCache
+    from pygments.formatters import HtmlFormatter
+    from pygments.lexers import PythonLexer
+
+    code = open(os.path.join(os.path.dirname(__file__), os.pardir,
+                             'pygments', 'lexer.py')).read().decode('utf-8')
+    code *= 100
+    first = code.count('\n') // 2
+    lexer = PythonLexer()
+    fmt = HtmlFormatter(linenos='table')
+    report('lines', code.count('\n'))
+    report('whole file', '%.1f' % (timed(highlight, code, lexer, fmt)
+                                   * 1000), 'ms')
+    report('range, no checkpoints', '%.1f' % (timed(
+        highlight_range, code, lexer, fmt, first, first + 99) * 1000), 'ms')
+    old = set_highlight_cache(MemoryCache())
+    try:
+        highlight_range(code, lexer, fmt, first, first + 99)
+        report('range, from checkpoints', '%.1f' % (timed(
+            highlight_range, code, lexer, fmt, first, first + 99) * 1000),
+            'ms')
+    finally:
+        set_highlight_cache(old)
+
+
+def bench_regexopt(examples):
+    """Matching speed of words() rules, as plain and optimized alternation."""
+    import re
+    from pygments.lexer import words
+    from pygments.lexers import _iter_lexerclasses
+
+    rules = []
+    for cls in _iter_lexerclasses():
+        for state in cls.__dict__.get('tokens', {}).itervalues():
+            for tdef in state:
+                if isinstance(tdef, tuple) and isinstance(tdef[0], words):
+                    rules.append((cls, tdef[0]))
+    text = u'\n'.join([text for fn, lx, text in examples])
+    report('words() rules', len(rules))
+    report('text', len(text) // 1024, 'KiB')
+
+    def compile_all(optimized):
+        result = []
+        for cls, w in rules:
+            if optimized:
+                regex = w.get()
+            else:
+                regex = w.prefix + '(%s)' % '|'.join(map(re.escape, w.words)) \
+                        + w.suffix
+            result.append(re.compile(regex, cls.flags).match)
+        return result
+    def scan(matchers):
+        # try every rule at every word start, as a lexer would
+        starts = [m.start() for m in re.finditer(r'\b\w', text)]
+        for match in matchers:
+            for pos in starts:
+                match(text, pos)
+    for name, optimized in [('plain alternation', False),
+                            ('regex_opt', True)]:
+        t0 = time.time()
+        matchers = compile_all(optimized)
+        report(name + ', compiling', '%.3f' % (time.time() - t0), 's')
+        report(name + ', matching', '%.3f' % timed(scan, matchers), 's')
+
+
+BENCHMARKS = {
+    'analysers':   bench_analysers,
+    'builtins':    bench_builtins,
+    'cache':       bench_cache,
+    'classifier':  bench_classifier,
+    'compact':     bench_compact,
+    'escape':      bench_escape,
+    'html':        bench_html,
+    'htmlinit':    bench_htmlinit,
+    'many':        bench_many,
+    'range':       bench_range,
+    'regexopt':    bench_regexopt,
+    'spans':       bench_spans,
+    'tokenbuffer': bench_tokenbuffer,
+}
+
+
+def main(args):
+    global repeat
+    try:
+        opts, args = getopt.getopt(args, 'n:l')
+    except getopt.GetoptError:
+        print __doc__
+        return 2
+    for opt, val in opts:
+        if opt == '-n':
+            repeat = int(val)
+        elif opt == '-l':
+            for name in sorted(BENCHMARKS):
+                print '%-20s %s' % (name, BENCHMARKS[name].__doc__)
+            return 0
+    names = args or sorted(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            print 'unknown benchmark %r' % name
+            return 2
+    examples = load_examples()
+    for name in names:
+        print '%s: %s' % (name, BENCHMARKS[name].__doc__)
+        BENCHMARKS[name](examples)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,112 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+    Pygments startup budget
+    ~~~~~~~~~~~~~~~~~~~~~~~
+
+    Measure the time needed to import ``pygments.cmdline`` and to highlight
+    a small file with ``pygmentize -l python -f html``, each in a fresh
+    interpreter, and fail if it exceeds the recorded budget.
+
+    The times reported are the best of several runs, minus the startup time
+    of the bare interpreter.
+
+    Usage::
+
+        python check_startup.py [-n repeat] [-i import_budget] [-r run_budget]
+
+    :copyright: Copyright 2006-2010 by the Pygments team, see AUTHORS.
+    :license: BSD, see LICENSE for details.
+"""
+
+import os
+import sys
+import time
+import getopt
+import tempfile
+import subprocess
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+#: the budgets, in seconds
+IMPORT_BUDGET = 0.075
+RUN_BUDGET = 0.15
+
+#: number of times each command is run, the best time is used
+repeat = 5
+
+HIGHLIGHT = '''\
+import sys
+sys.argv = ['pygmentize', '-l', 'python', '-f', 'html', '-o', %r, %r]
+from pygments.cmdline import main
+sys.exit(main(sys.argv))
+'''
+
+
+def best_time(code):
+    """
+    Run `code` with a fresh interpreter `repeat` times and return the best
+    wall time in seconds.
+    """
+    env = dict(os.environ)
+    env['PYTHONPATH'] = ROOT
+    best = None
+    for i in range(repeat):
+        t0 = time.time()
+        ret = subprocess.call([sys.executable, '-c', code], env=env)
+        t = time.time() - t0
+        if ret != 0:
+            raise RuntimeError('command failed: %r' % code)
+        if best is None or t < best:
+            best = t
+    return best
+
+
+def main(args):
+    global repeat
+    import_budget = IMPORT_BUDGET
+    run_budget = RUN_BUDGET
+    try:
+        opts, args = getopt.getopt(args, 'n:i:r:')
+    except getopt.GetoptError:
+        print __doc__
+        return 2
+    for opt, val in opts:
+        if opt == '-n':
+            repeat = int(val)
+        elif opt == '-i':
+            import_budget = float(val)
+        elif opt == '-r':
+            run_budget = float(val)
+
+    fd, infile = tempfile.mkstemp('.py')
+    os.write(fd, 'def f(x):\n    return x + 1\n')
+    os.close(fd)
+    outfile = infile + '.html'
+    try:
+        # run once to compile the modules
+        best_time('import pygments.cmdline')
+        base = best_time('pass')
+        results = [
+            ('import pygments.cmdline',
+             best_time('import pygments.cmdline') - base, import_budget),
+            ('pygmentize -l python -f html',
+             best_time(HIGHLIGHT % (outfile, infile)) - base, run_budget),
+        ]
+    finally:
+        os.remove(infile)
+        if os.path.exists(outfile):
+            os.remove(outfile)
+
+    ret = 0
+    for name, t, budget in results:
+        status = 'ok'
+        if t > budget:
+            status = 'OVER BUDGET'
+            ret = 1
+        print '%-30s %.3f s (budget %.3f s) %s' % (name, t, budget, status)
+    return ret
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,94 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+    Train a lexer classifier
+    ~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Train a `pygments.classifier.NgramClassifier` on the example files of
+    the test suite and the given directories, and write the model to a
+    file.  The lexer for each file is found by its file name.
+
+    Usage::
+
+        python train_classifier.py [-p prefix] [-f features] model [dir ...]
+
+    Use the model with ``pygments.lexers.set_guess_classifier(model)``.
+
+    :copyright: Copyright 2006-2010 by the Pygments team, see AUTHORS.
+    :license: BSD, see LICENSE for details.
+"""
+
+import sys, os, getopt
+
+try:
+    import pygments
+except ImportError:
+    # try parent path
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from pygments.classifier import NgramClassifier
+from pygments.lexers import get_lexer_for_filename, get_lexer_by_name
+from pygments.util import ClassNotFound
+
+
+EXAMPLEDIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          '..', 'tests', 'examplefiles')
+
+
+def iter_samples(directories):
+    """
+    Yield ``(lexername, text)`` for the files in `directories` that have
+    a lexer for their name, or are named ``<lexer alias>_<name>`` like
+    some of the example files.
+    """
+    for directory in directories:
+        for root, dirs, files in os.walk(directory):
+            for fn in files:
+                f = open(os.path.join(root, fn), 'rb')
+                try:
+                    text = f.read()
+                finally:
+                    f.close()
+                try:
+                    text = text.decode('utf-8')
+                except UnicodeError:
+                    text = text.decode('latin1')
+                try:
+                    lexer = get_lexer_for_filename(fn, text)
+                except ClassNotFound:
+                    try:
+                        lexer = get_lexer_by_name(fn.split('_', 1)[0])
+                    except ClassNotFound:
+                        continue
+                yield lexer.name, text
+
+
+def main(args):
+    try:
+        opts, args = getopt.getopt(args, 'p:f:')
+    except getopt.GetoptError:
+        print __doc__
+        return 2
+    if not args:
+        print __doc__
+        return 2
+    kwds = {}
+    for opt, val in opts:
+        if opt == '-p':
+            kwds['prefix'] = int(val)
+        elif opt == '-f':
+            kwds['features_per_lexer'] = int(val)
+    classifier = NgramClassifier.train(iter_samples([EXAMPLEDIR] + args[1:]),
+                                       **kwds)
+    f = open(args[0], 'w')
+    try:
+        classifier.save(f)
+    finally:
+        f.close()
+    print 'model for %d lexers written to %s' % (len(classifier.lexers),
+                                                 args[0])
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
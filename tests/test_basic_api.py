@@ -15,7 +15,7 @@ from pygments import lexers, formatters, filters, format
 from pygments.token import _TokenType, Text
 from pygments.lexer import RegexLexer
 from pygments.formatters.img import FontNotFound
-from pygments.util import BytesIO, StringIO, bytes, b
+from pygments.util import BytesIO, StringIO, ClassNotFound, bytes, b
 
 import support
 
@@ -116,15 +116,197 @@ def test_get_lexers():
         yield verify, func, args
 
 
+def test_lexer_lookup_precedence():
+    # the indexed lookups must find the same lexer as a linear search
+    # through the mapping, i.e. the first entry with the alias or mimetype
+    for attr, func in [(2, lexers.get_lexer_by_name),
+                       (4, lexers.get_lexer_for_mimetype)]:
+        seen = {}
+        for entry in lexers.LEXERS.itervalues():
+            for key in entry[attr]:
+                if key not in seen:
+                    seen[key] = entry[1]
+        for key, name in seen.iteritems():
+            assert func(key).name == name, key
+    for entry in lexers.LEXERS.itervalues():
+        assert lexers.find_lexer_class(entry[1]).name == entry[1]
+    assert lexers.find_lexer_class('no such lexer') is None
+    try:
+        lexers.get_lexer_by_name('no such lexer')
+    except ClassNotFound:
+        pass
+    else:
+        raise AssertionError('ClassNotFound not raised')
+
+
+def test_lexer_pool():
+    pool = lexers.LexerPool()
+    lx = pool.get_lexer_by_name('python', stripall=True)
+    assert isinstance(lx, lexers.PythonLexer) and lx.stripall
+    assert pool.get_lexer(lexers.PythonLexer, stripall=True) is lx
+    assert pool.get_lexer_by_name('py', stripall=True) is lx
+    assert pool.get_lexer_by_name('python') is not lx
+    # filters are part of the options, shared lexers can't be changed
+    filtered = pool.get_lexer_by_name('python', filters=['keywordcase'])
+    assert pool.get_lexer_by_name('python', filters=('keywordcase',)) \
+           is filtered
+    assert len(filtered.filters) == 1
+    try:
+        lx.add_filter('keywordcase')
+    except TypeError:
+        pass
+    else:
+        raise AssertionError('TypeError not raised')
+    assert not lx.filters
+    # unhashable options give unshared instances
+    unshared = pool.get_lexer_by_name('python', opt=set())
+    assert pool.get_lexer_by_name('python', opt=set()) is not unshared
+    unshared.add_filter('keywordcase')
+    pool.clear()
+    assert pool.get_lexer_by_name('python', stripall=True) is not lx
+
+
+def test_builtin_names():
+    from pygments.lexer import builtin_names
+    php = builtin_names('_phpbuiltins', 'MODULES', ['unknown'])
+    assert isinstance(php, frozenset) and 'array_map' in php
+    assert builtin_names('_phpbuiltins', 'MODULES', ('unknown',)) is php
+    assert 'array_map' not in builtin_names('_phpbuiltins', 'MODULES',
+                                            ['unknown', 'Arrays'])
+    # instances with the same options share the sets
+    assert lexers.PhpLexer()._functions is lexers.PhpLexer()._functions
+    assert lexers.LuaLexer()._functions is lexers.LuaLexer()._functions
+    lx = lexers.PhpLexer(funcnamehighlighting=False)
+    assert not lx._functions
+    cl = builtin_names('_clbuiltins', 'SPECIAL_FORMS')
+    assert 'let' in cl and 'car' not in cl
+
+
+# texts for the analysers, other than the example files
+analysis_texts = [
+    u'deb-src http://ftp.debian.org/debian sid main\n',
+    u'# sources\n\n  deb http://ftp.debian.org/debian sid main\n',
+    u'debian\n',
+    u'#!/bin/sh\necho hi\n',
+    u'#!/usr/bin/env ruby\nputs 1\n',
+    u'<?php echo 1; ?>\n',
+    u'<?xml version="1.0"?>\n<a/>\n',
+    u'<html><body>{{ x }}</body></html>\n',
+    u'{% block body %}{{ x|e }}{% endblock %}\n',
+    u'<%= foo %>\n',
+    u'\\documentclass{article}\n',
+    u'% comment\nx = [1 2];\n',
+    u'x <- c(1, 2)\n',
+    u'grammar Foo;\nfoo : BAR ;\n',
+    u'grammar Foo;\noptions {\n  language = Python;\n}\nfoo : BAR ;\n',
+    u'.globl main\nmain:\n\tret\n',
+    u'%% @LANG: indep\n',
+    u'[section]\nkey = value\n',
+    u'int main(void) { return 0; }\n',
+]
+
+
+def test_analyse_hints():
+    # the mapping must be up to date, and a lexer's analyse_text() must
+    # return its analyse_default for all texts without its analyse_hint
+    import re
+    from pygments.lexer import Lexer
+    from pygments.lexers._mapping import ANALYSERS
+    exampledir = os.path.join(TESTDIR, 'examplefiles')
+    texts = [test_content, '', '\n', '#!/usr/bin/env python\n']
+    texts.extend(analysis_texts)
+    for fn in os.listdir(exampledir):
+        if os.path.isfile(os.path.join(exampledir, fn)):
+            texts.append(open(os.path.join(exampledir, fn), 'rb').read())
+    def verify(name, cls):
+        for defcls in cls.__mro__:
+            if 'analyse_text' in defcls.__dict__:
+                break
+        if defcls is Lexer:
+            assert name not in ANALYSERS
+            return
+        hint, default, window = ANALYSERS[name]
+        assert hint == defcls.__dict__.get('analyse_hint')
+        assert default == defcls.__dict__.get('analyse_default', 0.0)
+        assert window == cls.analyse_window
+        if hint is None:
+            return
+        for text in texts:
+            if not re.search(hint, text):
+                assert cls.analyse_text(text) == default, \
+                       '%s: %r' % (name, text[:50])
+    for name in lexers.LEXERS:
+        yield verify, name, getattr(lexers, name)
+
+
+def test_guess_lexer():
+    # guessing must give the same result as asking every lexer
+    exampledir = os.path.join(TESTDIR, 'examplefiles')
+    def guess(text):
+        best = [0.0, None]
+        for cls in lexers._iter_lexerclasses():
+            rv = cls.analyse_text(text)
+            if rv == 1.0:
+                return cls
+            if rv > best[0]:
+                best = [rv, cls]
+        return best[1]
+    def verify(text):
+        # some analysers raise errors for some texts, that must not change
+        try:
+            expected = guess(text)
+        except Exception, err:
+            expected = err.__class__
+        try:
+            guessed = lexers.guess_lexer(text).__class__
+        except ClassNotFound:
+            guessed = None
+        except Exception, err:
+            guessed = err.__class__
+        assert guessed is expected, '%s != %s' % (guessed, expected)
+    for fn in sorted(os.listdir(exampledir)):
+        if os.path.isfile(os.path.join(exampledir, fn)):
+            yield verify, open(os.path.join(exampledir, fn), 'rb').read()
+    for text in analysis_texts:
+        yield verify, text
+    assert lexers.guess_lexer(analysis_texts[0]).name == 'Debian Sourcelist'
+    # the ANTLR analysers used to return match objects
+    assert lexers.guess_lexer(u'grammar Foo;\n').name.startswith('ANTLR')
+
+
+def test_analysis_window():
+    text = '#!/usr/bin/env python\n' + 'x = 1\n' * 100 + '#!/bin/sh\n'
+    old = lexers.set_analysis_window(10)
+    try:
+        # the shebang is cut off
+        assert lexers.guess_lexer(text).name != 'Python'
+        lexers.set_analysis_window(30)
+        assert lexers.guess_lexer(text).name == 'Python'
+        samples = {}
+        sample = lexers._analysis_text(text, 0, samples)
+        assert sample == text[:30]
+        assert lexers._analysis_text(text, 40, samples) == text[:40]
+        lexers.set_analysis_window(30, 15)
+        sample = lexers._analysis_text(text, 0, {})
+        assert sample == text[:30] + '\n#!/bin/sh\n'
+        lexers.set_analysis_window(None)
+        assert lexers._analysis_text(text, 0, {}) is text
+    finally:
+        lexers.set_analysis_window(*old)
+    assert old == (1 << 20, 0)
+
+
 def test_formatter_public_api():
     ts = list(lexers.PythonLexer().get_tokens("def f(): pass"))
     out = StringIO()
     # test that every formatter class has the correct public API
     def verify(formatter, info):
-        assert len(info) == 4
-        assert info[0], "missing formatter name"
-        assert info[1], "missing formatter aliases"
-        assert info[3], "missing formatter docstring"
+        assert len(info) == 5
+        assert info[1], "missing formatter name"
+        assert info[2], "missing formatter aliases"
+        assert info[4], "missing formatter docstring"
+        assert formatter.__module__ == info[0]
+        assert formatter.name == info[1]
 
         if formatter.name == 'Raw tokens':
             # will not work with Unicode output file
@@ -141,8 +323,8 @@ def test_formatter_public_api():
             pass
         inst.format(ts, out)
 
-    for formatter, info in formatters.FORMATTERS.iteritems():
-        yield verify, formatter, info
+    for name, info in formatters.FORMATTERS.iteritems():
+        yield verify, getattr(formatters, name), info
 
 def test_formatter_encodings():
     from pygments.formatters import HtmlFormatter
@@ -192,8 +374,28 @@ def test_formatter_unicode_handling():
             out = format(tokens, inst)
             assert type(out) is bytes, '%s: %r' % (formatter, out)
     
-    for formatter, info in formatters.FORMATTERS.iteritems():
-        yield verify, formatter
+    for name in formatters.FORMATTERS:
+        yield verify, getattr(formatters, name)
+
+
+def test_format_many():
+    from pygments import format_many
+    from pygments.formatters import HtmlFormatter, LatexFormatter, \
+         TerminalFormatter
+
+    code = "def f(x):\n    return x\n" * 20
+    fmts = [HtmlFormatter(linenos='table'), LatexFormatter(),
+            TerminalFormatter(), HtmlFormatter(encoding='utf-8')]
+    expected = [format(lexers.PythonLexer().get_tokens(code), fmt)
+                for fmt in fmts]
+    lexed = lexers.PythonLexer().get_tokens(code)
+    assert format_many(lexed, [(fmt, None) for fmt in fmts]) == expected
+    # output files
+    outfile = StringIO()
+    lexed = lexers.PythonLexer().get_tokens(code)
+    result = format_many(lexed, [(fmts[0], outfile), (fmts[1], None)])
+    assert result == [None, expected[1]]
+    assert outfile.getvalue() == expected[0]
 
 
 def test_get_formatters():
@@ -213,6 +415,28 @@ def test_styles():
     fmt = HtmlFormatter(style="pastie")
 
 
+def test_style_resolution():
+    from pygments.styles import get_style_by_name
+    from pygments.token import Name, Comment
+    style = get_style_by_name('default')
+    # defined types resolve to their own style
+    assert style.resolve_token(Comment) == style.style_for_token(Comment)
+    # undefined subtypes inherit from the nearest defined parent
+    ndef = style.resolve_token(Name.Function.Magic)
+    assert ndef == style.style_for_token(Name.Function)
+    assert style.resolved_styles[Name.Function.Magic] is ndef
+    assert style.resolve_token(Name.Function.Magic) is ndef
+
+
+def test_terminal256_subtype_styling():
+    from pygments.formatters import Terminal256Formatter
+    from pygments.token import Keyword
+    fmt = Terminal256Formatter()
+    plain = format([(Keyword, u'def')], fmt)
+    sub = format([(Keyword.Declaration.Special, u'def')], fmt)
+    assert plain.startswith('\x1b[') and sub == plain
+
+
 class FiltersTest(unittest.TestCase):
 
     def test_basic(self):
@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+"""
+    Tests for pygments.cache
+    ~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :copyright: Copyright 2006-2010 by the Pygments team, see AUTHORS.
+    :license: BSD, see LICENSE for details.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from pygments import highlight, set_highlight_cache
+from pygments.cache import MemoryCache, FileCache
+from pygments.lexers import PythonLexer
+from pygments.lexers.special import RawTokenLexer
+from pygments.formatters import HtmlFormatter, RawTokenFormatter
+from pygments.styles.emacs import EmacsStyle
+from pygments.util import StringIO
+
+CODE = u'def f(x):\n    return x * 2\n'
+
+
+class CacheKeyTest(unittest.TestCase):
+
+    def test_keys(self):
+        cache = MemoryCache()
+        key = cache.make_key(CODE, PythonLexer(), HtmlFormatter())
+        self.assertEquals(key, cache.make_key(CODE, PythonLexer(),
+                                              HtmlFormatter()))
+        others = [
+            cache.make_key(CODE + u' ', PythonLexer(), HtmlFormatter()),
+            cache.make_key(CODE.encode('utf-8'), PythonLexer(),
+                           HtmlFormatter()),
+            cache.make_key(CODE, PythonLexer(stripnl=False), HtmlFormatter()),
+            cache.make_key(CODE, PythonLexer(filters=['whitespace']),
+                           HtmlFormatter()),
+            cache.make_key(CODE, PythonLexer(), HtmlFormatter(linenos=True)),
+            cache.make_key(CODE, PythonLexer(), HtmlFormatter(style='emacs')),
+            cache.make_key(CODE, PythonLexer(),
+                           HtmlFormatter(encoding='utf-8')),
+        ]
+        for other in others:
+            self.assertNotEquals(key, other)
+        self.assertEquals(
+            cache.make_key(CODE, PythonLexer(), HtmlFormatter(style='emacs')),
+            cache.make_key(CODE, PythonLexer(),
+                           HtmlFormatter(style=EmacsStyle)))
+        # filters with different options differ
+        lexer = PythonLexer()
+        lexer.add_filter('keywordcase', case='upper')
+        lexer2 = PythonLexer()
+        lexer2.add_filter('keywordcase', case='lower')
+        self.assertNotEquals(lexer.get_cache_key(), lexer2.get_cache_key())
+
+    def test_collisions(self):
+        from pygments.filter import simplefilter
+        from pygments.lexer import RegexLexer
+        from pygments.style import Style
+        from pygments.token import Keyword
+        from pygments.util import cache_key
+        def make_filter(method):
+            @simplefilter
+            def change(self, lexer, stream, options):
+                for ttype, value in stream:
+                    yield ttype, getattr(value, method)()
+            return change
+        cache = MemoryCache()
+        for method in ['upper', 'lower']:
+            lexer = PythonLexer()
+            lexer.add_filter(make_filter(method)())
+            self.assertEquals(lexer.get_cache_key(), None)
+            self.assertEquals(cache.highlight(u'aB', lexer, HtmlFormatter()),
+                              highlight(u'aB', lexer, HtmlFormatter()))
+        self.assertEquals(len(cache), 0)
+        # classes created in functions have no stable name
+        class LocalLexer(RegexLexer):
+            tokens = {'root': [(r'.', Keyword)]}
+        self.assertEquals(LocalLexer().get_cache_key(), None)
+        self.assertEquals(cache_key(PythonLexer, {'x': LocalLexer}), None)
+        # styles are told apart by their contents, not by their names
+        def make_style(color):
+            class MyStyle(Style):
+                styles = {Keyword: color}
+            return MyStyle
+        keys = [HtmlFormatter(style=make_style(color)).get_cache_key()
+                for color in ['#f00', '#f00', '#00f']]
+        self.assertEquals(keys[0], keys[1])
+        self.assertNotEquals(keys[0], keys[2])
+        self.assertNotEquals(keys[0], HtmlFormatter().get_cache_key())
+
+    def test_uncacheable(self):
+        cache = MemoryCache()
+        formatter = HtmlFormatter(foo=object())
+        self.assertEquals(formatter.get_cache_key(), None)
+        self.assertEquals(cache.make_key(CODE, PythonLexer(), formatter),
+                          None)
+        self.assertEquals(cache.highlight(CODE, PythonLexer(), formatter),
+                          highlight(CODE, PythonLexer(), formatter))
+        self.assertEquals((cache.hits, cache.misses, cache.uncacheable),
+                          (0, 0, 1))
+        self.assertEquals(len(cache), 0)
+
+
+class MemoryCacheTest(unittest.TestCase):
+
+    def test_lru(self):
+        cache = MemoryCache(maxsize=10)
+        cache.set('a', 'aaaa')
+        cache.set('b', 'bbbb')
+        self.assertEquals(cache.get('a'), 'aaaa')
+        # 'b' is the least recently used value
+        cache.set('c', 'cccc')
+        self.assertEquals(cache.get('b'), None)
+        self.assertEquals(cache.get('a'), 'aaaa')
+        self.assertEquals(cache.get('c'), 'cccc')
+        self.assertEquals(cache.size, 8)
+        # replacing a value
+        cache.set('a', 'aa')
+        self.assertEquals(cache.get('a'), 'aa')
+        self.assertEquals(cache.size, 6)
+        # too big values are not stored
+        cache.set('d', 'd' * 11)
+        self.assertEquals(cache.get('d'), None)
+        self.assertEquals(len(cache), 2)
+        cache.clear()
+        self.assertEquals((len(cache), cache.size), (0, 0))
+        self.assertEquals(cache.get('a'), None)
+
+    def test_highlight(self):
+        cache = MemoryCache()
+        expected = highlight(CODE, PythonLexer(), HtmlFormatter())
+        self.assertEquals(cache.highlight(CODE, PythonLexer(),
+                                          HtmlFormatter()), expected)
+        self.assertEquals(cache.highlight(CODE, PythonLexer(),
+                                          HtmlFormatter()), expected)
+        out = StringIO()
+        cache.highlight(CODE, PythonLexer(), HtmlFormatter(), out)
+        self.assertEquals(out.getvalue(), expected)
+        self.assertEquals((cache.hits, cache.misses), (2, 1))
+
+    def test_tokens(self):
+        cache = MemoryCache()
+        lexer = PythonLexer()
+        expected = list(lexer.get_tokens(CODE))
+        self.assertEquals(list(cache.get_tokens(CODE, lexer)), expected)
+        self.assertEquals(list(cache.get_tokens(CODE, lexer)), expected)
+        self.assertEquals((cache.token_hits, cache.token_misses), (1, 1))
+        # filters are applied before caching
+        lexer = PythonLexer()
+        lexer.add_filter('keywordcase', case='upper')
+        expected = list(lexer.get_tokens(CODE))
+        self.assertEquals(list(cache.get_tokens(CODE, lexer)), expected)
+        self.assertEquals(list(cache.get_tokens(CODE, lexer)), expected)
+        self.assertEquals((cache.token_hits, cache.token_misses), (2, 2))
+
+    def test_highlight_tokens(self):
+        # output in other styles is made from the cached tokens
+        cache = MemoryCache(tokens=True)
+        for style in ['default', 'emacs', 'default']:
+            formatter = HtmlFormatter(style=style, noclasses=True)
+            self.assertEquals(cache.highlight(CODE, PythonLexer(), formatter),
+                              highlight(CODE, PythonLexer(), formatter))
+        self.assertEquals((cache.hits, cache.misses), (1, 2))
+        self.assertEquals((cache.token_hits, cache.token_misses), (1, 1))
+
+    def test_raw_tokens(self):
+        # the values of RawTokenLexer tokens are not slices of its input
+        code = u'x = 1\n'
+        raw = highlight(code, PythonLexer(), RawTokenFormatter())
+        cache = MemoryCache(tokens=True)
+        for style in ['default', 'emacs']:
+            formatter = HtmlFormatter(style=style, noclasses=True)
+            self.assertEquals(cache.highlight(raw, RawTokenLexer(), formatter),
+                              highlight(code, PythonLexer(), formatter))
+        self.assertEquals((cache.token_hits, cache.token_misses), (1, 1))
+
+    def test_set_highlight_cache(self):
+        cache = MemoryCache()
+        self.assertEquals(set_highlight_cache(cache), None)
+        try:
+            first = highlight(CODE, PythonLexer(), HtmlFormatter())
+            second = highlight(CODE, PythonLexer(), HtmlFormatter())
+        finally:
+            self.assert_(set_highlight_cache(None) is cache)
+        self.assertEquals(first, second)
+        self.assertEquals((cache.hits, cache.misses), (1, 1))
+
+
+class FileCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def files(self):
+        result = []
+        for dirpath, dirnames, filenames in os.walk(self.directory):
+            result.extend(filenames)
+        return result
+
+    def test_roundtrip(self):
+        cache = FileCache(os.path.join(self.directory, 'cache'))
+        key = 'ab' * 20
+        self.assertEquals(cache.get(key), None)
+        cache.set(key, 'bytes')
+        self.assertEquals(cache.get(key), 'bytes')
+        cache.set(key, u'unicode \xe4')
+        self.assertEquals(cache.get(key), u'unicode \xe4')
+        # other instances see the same values
+        other = FileCache(os.path.join(self.directory, 'cache'))
+        self.assertEquals(other.get(key), u'unicode \xe4')
+        # no temporary files are left
+        self.assertEquals(len(self.files()), 1)
+        other.clear()
+        self.assertEquals(self.files(), [])
+        self.assertEquals(cache.get(key), None)
+
+    def test_maxsize(self):
+        cache = FileCache(self.directory, maxsize=40)
+        keys = ['%02x' % i * 20 for i in range(5)]
+        for i, key in enumerate(keys):
+            cache.set(key, 'x' * 9)
+            # make the older files look older
+            os.utime(cache._path(key), (i, i))
+        # the fifth value exceeded the size, the oldest ones were removed
+        # until the rest takes up 3/4 of it
+        self.assertEquals(len(self.files()), 3)
+        self.assertEquals(cache.get(keys[0]), None)
+        self.assertEquals(cache.get(keys[4]), 'x' * 9)
+
+    def test_replace(self):
+        cache = FileCache(self.directory, maxsize=40)
+        key = 'ab' * 20
+        cache.set('cd' * 20, 'x' * 9)
+        for i in range(10):
+            cache.set(key, 'x' * 9)
+        # replaced values are not counted twice
+        self.assertEquals(cache._size, 20)
+        self.assertEquals(len(self.files()), 2)
+
+    def test_highlight(self):
+        cache = FileCache(self.directory)
+        formatter = HtmlFormatter(encoding='utf-8')
+        expected = highlight(CODE, PythonLexer(), formatter)
+        self.assertEquals(cache.highlight(CODE, PythonLexer(), formatter),
+                          expected)
+        cache = FileCache(self.directory)
+        self.assertEquals(cache.highlight(CODE, PythonLexer(), formatter),
+                          expected)
+        self.assertEquals((cache.hits, cache.misses), (1, 0))
+
+    def test_tokens(self):
+        lexer = PythonLexer(stripnl=False)
+        expected = list(lexer.get_tokens(CODE))
+        cache = FileCache(self.directory)
+        self.assertEquals(list(cache.get_tokens(CODE, lexer)), expected)
+        cache = FileCache(self.directory)
+        self.assertEquals(list(cache.get_tokens(CODE, lexer)), expected)
+        self.assertEquals((cache.token_hits, cache.token_misses), (1, 0))
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+    Tests for pygments.checkpoints
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :copyright: Copyright 2006-2010 by the Pygments team, see AUTHORS.
+    :license: BSD, see LICENSE for details.
+"""
+
+import unittest
+
+from pygments import highlight_range, set_highlight_cache, format
+from pygments.cache import MemoryCache
+from pygments.checkpoints import CheckpointIndex, lex_range
+from pygments.formatters import HtmlFormatter, LatexFormatter
+from pygments.lexers import PythonLexer, CLexer
+from pygments.tokenbuffer import TokenBuffer
+from pygments.util import uni_open
+
+import support
+
+TESTFILE, TESTDIR = support.location(__file__)
+
+# long enough for several checkpoints
+text = uni_open(TESTFILE, encoding='utf-8').read() * 5
+
+
+class CheckpointTest(unittest.TestCase):
+
+    def setUp(self):
+        self.interval = CheckpointIndex.interval
+        CheckpointIndex.interval = 500
+
+    def tearDown(self):
+        CheckpointIndex.interval = self.interval
+
+    def check_ranges(self, lexer, cache):
+        full = TokenBuffer.from_lexer(lexer, text)
+        nlines = len(full.get_line_index())
+        for first, last in [(1, 1), (200, 230), (30, 40), (nlines - 2,
+                            nlines + 5), (nlines + 1, nlines + 2)]:
+            expected = []
+            if first <= nlines:
+                expected = [t for t in full.get_lines(first, min(last, nlines))
+                            if t[1]]
+            result = lex_range(text, lexer, first, last, cache)
+            self.assertEquals([t for t in result if t[1]], expected)
+
+    def test_lex_range(self):
+        cache = MemoryCache()
+        self.check_ranges(PythonLexer(), cache)
+        index = cache.get_checkpoints(text, PythonLexer())
+        self.assert_(len(index) > 10)
+        # the same ranges from the stored index
+        self.check_ranges(PythonLexer(), cache)
+        # lexers that can't resume lex from the start
+        self.check_ranges(CLexer(), cache)
+        self.check_ranges(PythonLexer(filters=['whitespace']), None)
+        self.assertRaises(ValueError, lex_range, text, PythonLexer(), 5, 4)
+
+    def test_stops_lexing(self):
+        lexer = PythonLexer()
+        cache = MemoryCache()
+        lex_range(text, lexer, 20, 40, cache)
+        index = cache.get_checkpoints(text, lexer)
+        # nothing after the range was lexed
+        self.assert_(index.offsets[-1] < len(text) // 4)
+
+    def test_index_serialization(self):
+        index = CheckpointIndex()
+        index.add(u'a\nb\n', 2, ['root', 'string'])
+        index.add(u'a\nb\nc\n', 4, ['root', '_tmp_1'])
+        loaded = CheckpointIndex.loads(index.dumps())
+        self.assertEquals(list(loaded.offsets), [0, 2])
+        self.assertEquals(list(loaded.lines), [1, 2])
+        self.assertEquals(loaded.stacks, [('root',), ('root', 'string')])
+        self.assertEquals(loaded.find(1), 0)
+        self.assertEquals(loaded.find(7), 1)
+        self.assertRaises(ValueError, CheckpointIndex.loads,
+                          index.dumps()[3:])
+
+    def test_highlight_range(self):
+        fmt = HtmlFormatter(linenos='inline', hl_lines=[12, 40],
+                            lineanchors='l', linenostart=3)
+        full = TokenBuffer.from_lexer(PythonLexer(), text)
+        cache = MemoryCache()
+        old = set_highlight_cache(cache)
+        try:
+            out = highlight_range(text, PythonLexer(), fmt, 10, 15)
+            self.assertEquals(out, highlight_range(text, PythonLexer(), fmt,
+                                                   10, 15))
+        finally:
+            set_highlight_cache(old)
+        self.assertEquals(out, format(full.get_lines(10, 15),
+                                      fmt.get_range_formatter(10)))
+        self.assert_('<span class="lineno">12</span>' in out)
+        self.assert_('<a name="l-12"></a>' in out)
+        self.assertEquals(out.count('<span class="hll">'), 1)
+        self.assert_('<span class="lineno">14</span> <span class="hll">'
+                     in out)
+        # the formatter itself is unchanged
+        self.assertEquals(fmt.linenostart, 3)
+        out = highlight_range(text, PythonLexer(), LatexFormatter(
+            linenos=True), 10, 15)
+        self.assert_('firstnumber=10' in out)
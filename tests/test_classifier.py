@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+    Pygments lexer classifier tests
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :copyright: Copyright 2006-2010 by the Pygments team, see AUTHORS.
+    :license: BSD, see LICENSE for details.
+"""
+
+import os
+import unittest
+import tempfile
+
+from pygments import lexers
+from pygments.classifier import NgramClassifier
+from pygments.util import StringIO
+
+python_code = u'''\
+import os
+
+def main(args):
+    for arg in args:
+        if arg.startswith('-'):
+            print arg
+    return 0
+
+class Foo(object):
+    def __init__(self):
+        self.x = None
+'''
+
+c_code = u'''\
+#include <stdio.h>
+
+int main(int argc, char **argv)
+{
+    int i;
+    for (i = 0; i < argc; i++) {
+        printf("%s\\n", argv[i]);
+    }
+    return 0;
+}
+'''
+
+
+class ClassifierTest(unittest.TestCase):
+
+    def setUp(self):
+        self.classifier = NgramClassifier.train([('Python', python_code),
+                                                 ('C', c_code)])
+
+    def test_rank(self):
+        ranked = self.classifier.rank(u'def f(x):\n    return x.y\n')
+        self.assertEquals([name for score, name in ranked], ['Python', 'C'])
+        ranked = self.classifier.rank(u'int f(int x) { return x; }\n')
+        self.assertEquals(ranked[0][1], 'C')
+        self.assertEquals(self.classifier.rank(u''), [])
+
+    def test_save_load(self):
+        out = StringIO()
+        self.classifier.save(out)
+        out.seek(0)
+        loaded = NgramClassifier.load(out)
+        self.assertEquals(loaded.lexers, self.classifier.lexers)
+        self.assertEquals(loaded.prefix, self.classifier.prefix)
+        for text in python_code, c_code:
+            self.assertEquals([n for s, n in loaded.rank(text)],
+                              [n for s, n in self.classifier.rank(text)])
+        self.assertRaises(ValueError, NgramClassifier.load,
+                          StringIO('foo\n'))
+
+    def test_guess_lexer(self):
+        text = u'def f(x):\n    return x\n'
+        lexers.set_guess_classifier(self.classifier)
+        try:
+            self.assertEquals(lexers.guess_lexer(text).name, 'Python')
+            self.assertEquals(lexers.guess_lexer(u'int x;\n').name, 'C')
+            # a lexer that is sure about the text wins
+            self.assertEquals(lexers.guess_lexer(u'#!/usr/bin/env python\n'
+                                                 u'int x;\n').name, 'Python')
+        finally:
+            lexers.set_guess_classifier(None)
+
+    def test_model_file(self):
+        fd, fn = tempfile.mkstemp()
+        f = os.fdopen(fd, 'w')
+        try:
+            self.classifier.save(f)
+        finally:
+            f.close()
+        try:
+            lexers.set_guess_classifier(fn)
+            try:
+                self.assertEquals(lexers.guess_lexer(u'int x;\n').name, 'C')
+            finally:
+                lexers.set_guess_classifier(None)
+        finally:
+            os.remove(fn)
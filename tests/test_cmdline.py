@@ -85,6 +85,12 @@ class CmdLineTest(unittest.TestCase):
                      ("-H", "formatter"),]:
             self.assert_(run_cmdline(*opts)[0] == 2)
 
+    def test_pagelines_without_outfile(self):
+        r = run_cmdline("-lpy", "-fhtml", "-Opagelines=5", TESTFILE)
+        self.assertEquals(r[0], 2)
+        self.assertEquals(r[1], '')
+        self.assert_('-o <outfile>' in r[2])
+
     def test_normal(self):
         # test that cmdline gives the same output as library api
         from pygments.lexers import PythonLexer
@@ -11,6 +11,7 @@ import os
 
 from pygments.lexers import get_lexer_for_filename, get_lexer_by_name
 from pygments.token import Error
+from pygments.tokenbuffer import TokenBuffer
 from pygments.util import ClassNotFound, b
 
 
@@ -46,9 +47,13 @@ def check_lexer(lx, absfn):
     except UnicodeError:
         text = text.decode('latin1')
     ntext = []
-    for type, val in lx.get_tokens(text):
+    tokens = list(lx.get_tokens(text))
+    for type, val in tokens:
         ntext.append(val)
         assert type != Error, 'lexer %s generated error token for %s' % \
                 (lx, absfn)
     if u''.join(ntext) != text:
         raise AssertionError('round trip failed for ' + absfn)
+    # lexing into spans must give the same tokens
+    if list(TokenBuffer.from_lexer(lx, text)) != tokens:
+        raise AssertionError('span lexing differs for ' + absfn)
@@ -15,6 +15,7 @@ import tempfile
 from os.path import join, dirname, isfile
 
 from pygments.lexers import PythonLexer
+from pygments.token import Keyword, Name, String, Comment, Text, Error
 from pygments.formatters import HtmlFormatter, NullFormatter
 from pygments.formatters.html import escape_html
 from pygments.util import uni_open
@@ -41,6 +42,171 @@ class HtmlFormatterTest(unittest.TestCase):
         escaped_text = escape_html(noutfile.getvalue())
         self.assertEquals(stripped_html, escaped_text)
 
+    def test_lines_and_spans(self):
+        # multi-line tokens, empty lines and adjacent tokens of the same
+        # style (but different types)
+        tokens = [(Keyword, u'def'), (Text, u' '), (Name.Function, u'f'),
+                  (Text, u'\n'), (String, u'"a\n\nb"'), (Keyword, u'x'),
+                  (Keyword.Constant, u'y'), (Text, u'\n\n'),
+                  (Comment, u'<c>\n'), (Name, u'z')]
+        outfile = StringIO.StringIO()
+        HtmlFormatter(nowrap=True).format(tokens, outfile)
+        self.assertEquals(outfile.getvalue(),
+            u'<span class="k">def</span> <span class="nf">f</span>\n'
+            u'<span class="s">&quot;a</span>\n\n'
+            u'<span class="s">b&quot;</span><span class="k">x</span>'
+            u'<span class="kc">y</span>\n\n'
+            u'<span class="c">&lt;c&gt;</span>\n'
+            u'<span class="n">z</span>\n')
+        outfile = StringIO.StringIO()
+        HtmlFormatter(nowrap=True, noclasses=True).format(tokens, outfile)
+        self.assertEquals(outfile.getvalue(),
+            u'<span style="color: #008000; font-weight: bold">def</span> '
+            u'<span style="color: #0000FF">f</span>\n'
+            u'<span style="color: #BA2121">&quot;a</span>\n\n'
+            u'<span style="color: #BA2121">b&quot;</span>'
+            u'<span style="color: #008000; font-weight: bold">xy</span>\n\n'
+            u'<span style="color: #408080; font-style: italic">&lt;c&gt;'
+            u'</span>\nz\n')
+
+    def test_streaming_linenos(self):
+        # the line numbers are the same whether the number of lines is
+        # told by the token source, counted in a list or in a generator
+        from pygments import highlight
+        code = uni_open(TESTFILE, encoding='utf-8').read()
+        for linenos in ('table', 'inline'):
+            fmt = HtmlFormatter(linenos=linenos, linenostart=95)
+            outfile = StringIO.StringIO()
+            fmt.format(tokensource, outfile)
+            expected = outfile.getvalue()
+            self.assert_('<span class="lineno">%d</span>' % (
+                len(code.splitlines()) + 94) in expected or
+                '\n%d</pre>' % (len(code.splitlines()) + 94) in expected)
+            outfile = StringIO.StringIO()
+            fmt.format(iter(tokensource), outfile)
+            self.assertEquals(outfile.getvalue(), expected)
+            self.assertEquals(highlight(code, PythonLexer(), fmt), expected)
+
+    def test_compact(self):
+        # the text is the same
+        for options in [{}, {'noclasses': True}]:
+            outfile = StringIO.StringIO()
+            HtmlFormatter(nowrap=True, compact=True, **options).format(
+                tokensource, outfile)
+            noutfile = StringIO.StringIO()
+            NullFormatter().format(tokensource, noutfile)
+            self.assertEquals(re.sub('<.*?>', '', outfile.getvalue()),
+                              escape_html(noutfile.getvalue()))
+
+        # whitespace joins spans that don't show it, unstyled types use
+        # the span of their parent
+        tokens = [(Keyword, u'not'), (Text, u' '), (Keyword, u'in'),
+                  (Text, u' '), (Name.Variable.Magic, u'x'),
+                  (Text, u'\n    '), (Error, u'e'), (Text, u' '),
+                  (Error, u'f'), (Text, u'\n')]
+        outfile = StringIO.StringIO()
+        HtmlFormatter(nowrap=True, compact=True).format(tokens, outfile)
+        self.assertEquals(outfile.getvalue(),
+            u'<span class="k">not in </span><span class="nv">x</span>\n'
+            u'    <span class="err">e</span> <span class="err">f</span>\n')
+        outfile = StringIO.StringIO()
+        HtmlFormatter(nowrap=True, compact=True, noclasses=True).format(
+            tokens, outfile)
+        self.assertEquals(outfile.getvalue(),
+            u'<span style="color:#008000;font-weight:bold">not in </span>'
+            u'<span style="color:#19177C">x</span>\n'
+            u'    <span style="border:1px solid #F00">e</span> '
+            u'<span style="border:1px solid #F00">f</span>\n')
+
+    def test_pages(self):
+        whole = StringIO.StringIO()
+        HtmlFormatter(nowrap=True, hl_lines=[2, 11]).format(tokensource,
+                                                            whole)
+        fmt = HtmlFormatter(nowrap=True, hl_lines=[2, 11], pagelines=5)
+        pages = list(fmt.iter_pages(tokensource))
+        nlines = len(whole.getvalue().splitlines())
+        self.assertEquals([(first, last) for first, last, output in pages],
+                          [(i, min(i + 4, nlines))
+                           for i in range(1, nlines + 1, 5)])
+        self.assertEquals(u''.join([output for f, l, output in pages]),
+                          whole.getvalue())
+        self.assert_(pages[2][2].startswith('<span class="hll">'))
+
+        # every page has its own wrapping and numbering
+        fmt = HtmlFormatter(linenos='inline', lineanchors='l', pagelines=5)
+        page = fmt.get_page(tokensource, 3)
+        self.assert_(page.startswith('<div class="highlight"><pre>'
+                                     '<a name="l-11"></a>'
+                                     '<span class="lineno">11</span>'))
+        self.assertEquals(page.count('<a name='), 5)
+        self.assertRaises(ValueError, fmt.get_page, tokensource, 0)
+        self.assertRaises(ValueError, fmt.get_page, tokensource, nlines)
+
+    def test_pages_lazy(self):
+        # only the tokens up to the requested page are consumed
+        consumed = []
+        def tokens():
+            for token in tokensource:
+                consumed.append(token)
+                yield token
+        HtmlFormatter(pagelines=5).get_page(tokens(), 2)
+        self.assertEquals(
+            u''.join([v for t, v in consumed]).count('\n'), 10)
+
+    def test_highlight_page(self):
+        code = uni_open(TESTFILE, encoding='utf-8').read()
+        fmt = HtmlFormatter(linenos='inline', lineanchors='l', pagelines=5)
+        for pageno in (1, 3, 7):
+            self.assertEquals(fmt.highlight_page(code, PythonLexer(), pageno),
+                              fmt.get_page(tokensource, pageno))
+        nlines = len(code.splitlines())
+        self.assertRaises(ValueError, fmt.highlight_page, code,
+                          PythonLexer(), 0)
+        self.assertRaises(ValueError, fmt.highlight_page, code,
+                          PythonLexer(), nlines)
+        self.assertRaises(ValueError, HtmlFormatter().highlight_page, code,
+                          PythonLexer(), 1)
+
+    def test_format_pages(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            fmt = HtmlFormatter(full=True, pagelines=10,
+                                outencoding='utf-8')
+            filenames = fmt.format_pages(tokensource,
+                                         join(tmpdir, 'index.html'))
+            self.assertEquals(filenames[:2], [join(tmpdir, 'index-1.html'),
+                                              join(tmpdir, 'index-2.html')])
+            index = open(join(tmpdir, 'index.html')).read()
+            for fn in filenames:
+                self.assert_(isfile(fn))
+                self.assert_(os.path.basename(fn) in index)
+                os.unlink(fn)
+            os.unlink(join(tmpdir, 'index.html'))
+        finally:
+            os.rmdir(tmpdir)
+
+    def test_lineanchors_linenostart(self):
+        fmt = HtmlFormatter(linenos=True, lineanchors='l', anchorlinenos=True,
+                            linenostart=10)
+        outfile = StringIO.StringIO()
+        fmt.format(tokensource, outfile)
+        html = outfile.getvalue()
+        self.assert_('<a href="#l-10"> 10</a>' in html)
+        self.assert_('<a name="l-10"></a>' in html)
+        self.failIf('<a name="l-1"></a>' in html)
+
+    def test_linenos_of_tokens(self):
+        # the lines are counted in the tokens, not in the lexer's input
+        from pygments import highlight
+        from pygments.formatters import RawTokenFormatter
+        from pygments.lexers.special import RawTokenLexer
+        code = u'x = 1\ny = 2\n'
+        raw = highlight(code, PythonLexer(), RawTokenFormatter())
+        fmt = HtmlFormatter(linenos='table')
+        out = highlight(raw, RawTokenLexer(), fmt)
+        self.assert_('<pre>1\n2</pre>' in out)
+        self.assertEquals(out, highlight(code, PythonLexer(), fmt))
+
     def test_external_css(self):
         # test correct behavior
         # CSS should be in /tmp directory
@@ -111,6 +277,27 @@ class HtmlFormatterTest(unittest.TestCase):
         fl = sd.splitlines()[0]
         self.assert_('.bar' in fl and '.baz' in fl)
 
+    def test_shared_stylesheet(self):
+        fmt1 = HtmlFormatter()
+        fmt2 = HtmlFormatter(linenos=True)
+        self.assert_(fmt1.class2style is fmt2.class2style)
+        self.assert_(fmt1.ttype2class is fmt2.ttype2class)
+        self.assertEquals(fmt1.get_style_defs('.x'),
+                          fmt2.get_style_defs('.x'))
+        self.assert_(fmt1.get_style_defs('.x') is fmt2.get_style_defs('.x'))
+        self.assertNotEquals(fmt1.get_style_defs('.x'),
+                             fmt1.get_style_defs('.y'))
+        self.assert_('background' in fmt1.get_style_defs('.x'))
+        fmt3 = HtmlFormatter(nobackground=True)
+        self.failIf('background:' in fmt3.get_style_defs('.x'))
+        # options changing the maps, or subclasses, get their own
+        for fmt in [HtmlFormatter(classprefix='p-'),
+                    HtmlFormatter(style='monokai'),
+                    type('SubFormatter', (HtmlFormatter,), {})()]:
+            self.assert_(fmt.class2style is not fmt1.class2style)
+        fmt4 = HtmlFormatter(noclasses=True)
+        self.assert_(fmt4._span_cache is not fmt1._span_cache)
+
     def test_unicode_options(self):
         fmt = HtmlFormatter(title=u'Föö',
                             cssclass=u'bär',
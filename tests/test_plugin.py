@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+    Pygments plugin tests
+    ~~~~~~~~~~~~~~~~~~~~~
+
+    :copyright: Copyright 2006-2010 by the Pygments team, see AUTHORS.
+    :license: BSD, see LICENSE for details.
+"""
+
+import sys
+import unittest
+
+from pygments import plugin
+from pygments.lexer import RegexLexer
+from pygments.lexers import get_lexer_by_name
+from pygments.formatters import get_formatter_by_name
+from pygments.formatters.html import HtmlFormatter
+from pygments.token import Text
+from pygments.util import ClassNotFound
+
+
+class PluginLexer(RegexLexer):
+    name = 'Plugin'
+    aliases = ['plugintest']
+    tokens = {'root': [(r'.+\n?', Text)]}
+
+
+class PluginFormatter(HtmlFormatter):
+    name = 'Plugin'
+    aliases = ['plugintest']
+
+
+class EntryPoint(object):
+
+    def __init__(self, name, obj):
+        self.name = name
+        self.obj = obj
+        self.loaded = 0
+
+    def load(self):
+        self.loaded += 1
+        return self.obj
+
+
+class FakePkgResources(object):
+    """Stands in for the pkg_resources module."""
+
+    def __init__(self):
+        self.groups = {
+            plugin.LEXER_ENTRY_POINT: [EntryPoint('plugin', PluginLexer)],
+            plugin.FORMATTER_ENTRY_POINT:
+                [EntryPoint('plugintest', PluginFormatter)],
+        }
+
+    def iter_entry_points(self, group):
+        return iter(self.groups.get(group, []))
+
+
+class PluginTest(unittest.TestCase):
+
+    def setUp(self):
+        self.old_module = sys.modules.get('pkg_resources')
+        self.old_enabled = plugin._enabled
+        self.fake = FakePkgResources()
+        sys.modules['pkg_resources'] = self.fake
+        plugin.set_plugins_enabled(True)
+
+    def tearDown(self):
+        if self.old_module is None:
+            del sys.modules['pkg_resources']
+        else:
+            sys.modules['pkg_resources'] = self.old_module
+        plugin.set_plugins_enabled(self.old_enabled)
+
+    def test_cached(self):
+        self.assertEquals(list(plugin.find_plugin_lexers()), [PluginLexer])
+        self.assertEquals(list(plugin.find_plugin_lexers()), [PluginLexer])
+        entrypoint = self.fake.groups[plugin.LEXER_ENTRY_POINT][0]
+        self.assertEquals(entrypoint.loaded, 1)
+        plugin.refresh_plugins()
+        list(plugin.find_plugin_lexers())
+        self.assertEquals(entrypoint.loaded, 2)
+
+    def test_lookups(self):
+        # builtin lexers are found without scanning the entry points
+        get_lexer_by_name('python')
+        self.assertEquals(plugin._plugins, {})
+        self.assert_(isinstance(get_lexer_by_name('plugintest'), PluginLexer))
+        self.assert_(isinstance(get_formatter_by_name('plugintest'),
+                                PluginFormatter))
+        # the lookup tables follow the refreshed plugins
+        del self.fake.groups[plugin.LEXER_ENTRY_POINT]
+        plugin.refresh_plugins()
+        self.assertRaises(ClassNotFound, get_lexer_by_name, 'plugintest')
+        self.assert_(isinstance(get_formatter_by_name('plugintest'),
+                                PluginFormatter))
+
+    def test_builtin_precedence(self):
+        # builtin formatters win over plugins with the same alias
+        class HtmlPluginFormatter(HtmlFormatter):
+            name = 'HTML plugin'
+            aliases = ['html']
+        self.fake.groups[plugin.FORMATTER_ENTRY_POINT].append(
+            EntryPoint('html', HtmlPluginFormatter))
+        plugin.refresh_plugins()
+        formatter = get_formatter_by_name('html')
+        self.assertEquals(type(formatter), HtmlFormatter)
+        self.assertEquals(plugin._plugins, {})
+        self.assert_(isinstance(get_formatter_by_name('plugintest'),
+                                PluginFormatter))
+
+    def test_disabled(self):
+        plugin.set_plugins_enabled(False)
+        self.assertEquals(list(plugin.find_plugin_lexers()), [])
+        self.assertRaises(ClassNotFound, get_lexer_by_name, 'plugintest')
+        self.assertRaises(ClassNotFound, get_formatter_by_name, 'plugintest')
+        self.assertEquals(list(plugin.find_plugin_filters()), [])
@@ -9,8 +9,10 @@
 
 import unittest
 
-from pygments.token import Text
-from pygments.lexer import RegexLexer
+from pygments.token import Text, Error
+from pygments.lexer import RegexLexer, ExtendedRegexLexer
+from pygments.tokenbuffer import TokenBuffer
+from pygments.util import SpanError
 
 
 class TestLexer(RegexLexer):
@@ -37,3 +39,60 @@ class TupleTransTest(unittest.TestCase):
         self.assertEquals(toks,
            [(0, Text.Root, 'a'), (1, Text.Rag, 'b'), (2, Text.Rag, 'c'),
             (3, Text.Beer, 'd'), (4, Text.Root, 'e')])
+
+
+class SpansTest(unittest.TestCase):
+    def test(self):
+        lx = TestLexer()
+        spans = list(lx.get_spans_unprocessed('abcde\nx'))
+        self.assertEquals(spans,
+           [(0, 1, Text.Root), (1, 2, Text.Rag), (2, 3, Text.Rag),
+            (3, 4, Text.Beer), (4, 5, Text.Root), (5, 6, Text),
+            (6, 7, Error)])
+
+
+def _upper_callback(lexer, match):
+    yield match.start(), Text.Upper, match.group().upper()
+
+
+class CallbackLexer(RegexLexer):
+    """A callback that doesn't reproduce its match."""
+    tokens = {
+        'root': [
+            ('a', _upper_callback),
+            ('b', Text.Root),
+        ],
+    }
+
+
+class SpanErrorTest(unittest.TestCase):
+    def test(self):
+        lx = CallbackLexer()
+        self.assertRaises(SpanError, list, lx.get_spans_unprocessed('ab'))
+        # token buffers fall back to the token values
+        buf = TokenBuffer.from_lexer(lx, 'ab')
+        self.assertEquals(list(buf),
+           [(Text.Upper, 'A'), (Text.Root, 'b'), (Text, '\n')])
+        self.assertEquals(buf.get_text(), 'Ab\n')
+
+
+class OnlyALexer(RegexLexer):
+    """Newlines are only matched by the fallback at EOL."""
+    tokens = {
+        'root': [
+            ('a', Text.Root),
+        ],
+    }
+
+
+class ExtendedOnlyALexer(ExtendedRegexLexer):
+    tokens = OnlyALexer.tokens
+
+
+class EolFallbackTest(unittest.TestCase):
+    def test(self):
+        expected = [(0, Text.Root, 'a'), (1, Text, '\n'),
+                    (2, Text.Root, 'a'), (3, Text, '\n')]
+        for lx in [OnlyALexer(), ExtendedOnlyALexer()]:
+            self.assertEquals(list(lx.get_tokens_unprocessed('a\na\n')),
+                              expected)
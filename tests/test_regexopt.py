@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+    Tests for pygments.regexopt
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :copyright: Copyright 2006-2010 by the Pygments team, see AUTHORS.
+    :license: BSD, see LICENSE for details.
+"""
+
+import re
+import random
+import unittest
+
+from pygments.regexopt import regex_opt
+from pygments.lexer import RegexLexer, words
+from pygments.token import Keyword, Text
+
+ALPHABET = ['a', 'b', 'c', 'd', 'e']
+N_TRIES = 15
+
+
+class RegexOptTestCase(unittest.TestCase):
+
+    def generate_keywordlist(self, length):
+        return [''.join(random.sample(ALPHABET,
+                                      random.randint(1, len(ALPHABET))))
+                for i in range(length)]
+
+    def test_randomly(self):
+        # every keyword must match, and of all strings of up to two letters
+        # exactly the keywords must match
+        for n in range(3, N_TRIES):
+            kwlist = self.generate_keywordlist(n)
+            rex = re.compile(regex_opt(kwlist) + '$')
+            for w in kwlist:
+                self.assert_(rex.match(w), '%r does not match %r' % (w, kwlist))
+            others = [a + b for a in ALPHABET for b in [''] + ALPHABET]
+            for w in others:
+                self.assertEquals(bool(rex.match(w)), w in kwlist)
+
+    def test_longest_match(self):
+        rex = re.compile(regex_opt(['a', 'ab', 'abc', 'b']))
+        self.assertEquals(rex.match('abcd').group(), 'abc')
+        self.assertEquals(rex.match('abd').group(), 'ab')
+
+    def test_prefix_suffix_group(self):
+        rex = re.compile(regex_opt(['if', 'in', 'import'], prefix=r'\b',
+                                   suffix=r'\b'))
+        self.assertEquals(rex.match('import x').group(1), 'import')
+        self.assertEquals(rex.match('in').groups(), ('in',))
+        self.failIf(rex.match('imports'))
+
+    def test_special_characters(self):
+        kwlist = ['a.b', '^x', '[]', 'a-z', '\\', 'a|b', '-', ']']
+        rex = re.compile(regex_opt(kwlist) + '$')
+        for w in kwlist:
+            self.assert_(rex.match(w), w)
+        for w in ['axb', 'x', 'a', 'b', 'az']:
+            self.failIf(rex.match(w), w)
+
+    def test_words_in_lexer(self):
+        class WordsLexer(RegexLexer):
+            tokens = {
+                'root': [
+                    (words(('for', 'foreach', 'while'), suffix=r'\b'),
+                     Keyword),
+                    (r'\w+|\s+', Text),
+                ]
+            }
+        tokens = list(WordsLexer().get_tokens('foreach fork while'))
+        self.assertEquals(tokens, [
+            (Keyword, u'foreach'), (Text, u' '), (Text, u'fork'),
+            (Text, u' '), (Keyword, u'while'), (Text, u'\n'),
+        ])
@@ -8,6 +8,7 @@
 """
 
 import unittest
+import os
 import StringIO
 import sys
 
@@ -35,6 +36,49 @@ class TokenTest(unittest.TestCase):
         self.assert_(token.string_to_tokentype('') is token.Token)
         self.assert_(token.string_to_tokentype('String') is token.String)
 
+    def test_ids(self):
+        t = token.String.Double
+        self.assert_(token.id_to_tokentype(t.id) is t)
+        self.assertEquals(t.ancestor_ids,
+                          frozenset([x.id for x in t.split()]))
+        # new types get fresh ids and inherit their parent's ancestors
+        new = token.Name.Function.Magic
+        self.assert_(new.id > token.Name.Function.id)
+        self.assert_(new in token.Name and new in token.Token)
+        self.failIf(token.Name in new)
+        self.failIf(token.Name.Function.Magic in token.Literal)
+        # hashing is still compatible with plain tuples
+        self.assertEquals(hash(t), hash(tuple(t)))
+        self.assertEquals({('Literal', 'String', 'Double'): 1}[t], 1)
+        self.assertRaises(IndexError, token.id_to_tokentype, -1)
+
+    def test_pickle(self):
+        import pickle
+        t = token.Name.Function.Pickled
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            loaded = pickle.loads(pickle.dumps(t, proto))
+            self.assert_(loaded is t)
+            self.assert_(loaded in token.Name)
+        # types pickled in another process, which created them in a
+        # different order and so gave them other ids
+        import subprocess
+        script = ('import pickle, sys; from pygments import token; '
+                  'token.Token.Zed.Baz; '
+                  'sys.stdout.write(pickle.dumps([token.Token.Foo.Bar, '
+                  'token.Token.Zed.Baz], 0))')
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.path.dirname(os.path.dirname(
+            os.path.abspath(token.__file__)))
+        p = subprocess.Popen([sys.executable, '-c', script],
+                             stdout=subprocess.PIPE, env=env)
+        data = p.communicate()[0]
+        foo, zed = token.Token.Foo.Bar, token.Token.Zed.Baz
+        self.assertEquals(pickle.loads(data), [foo, zed])
+        loaded = pickle.loads(data)[0]
+        self.assert_(loaded is foo)
+        self.assert_(loaded in token.Token.Foo)
+        self.failIf(loaded in token.Token.Zed)
+
     def test_sanity_check(self):
         stp = token.STANDARD_TYPES.copy()
         stp[token.Token] = '---' # Token and Text do conflict, that is okay
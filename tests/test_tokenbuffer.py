@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+    Pygments token buffer tests
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :copyright: Copyright 2006-2010 by the Pygments team, see AUTHORS.
+    :license: BSD, see LICENSE for details.
+"""
+
+import unittest
+
+from pygments import format
+from pygments.lexers import PythonLexer
+from pygments.formatters import HtmlFormatter
+from pygments.token import Text, Name, Keyword, String
+from pygments.tokenbuffer import TokenBuffer, LineIndex, TokenStream, \
+     count_lines
+from pygments.util import uni_open, bytes, b
+
+import support
+
+TESTFILE, TESTDIR = support.location(__file__)
+
+text = uni_open(TESTFILE, encoding='utf-8').read()
+tokens = list(PythonLexer().get_tokens(text))
+
+
+class TokenBufferTest(unittest.TestCase):
+
+    def test_roundtrip(self):
+        buf = TokenBuffer(tokens)
+        self.assertEquals(len(buf), len(tokens))
+        self.assertEquals(list(buf), tokens)
+        self.assertEquals(buf.get_text(), u''.join([v for t, v in tokens]))
+        indexed = list(buf.iter_unprocessed())
+        self.assertEquals([(t, v) for i, t, v in indexed], tokens)
+        for i, t, v in indexed:
+            self.assertEquals(buf.text[i:i + len(v)], v)
+
+    def test_text_reference(self):
+        lexed = PythonLexer().get_tokens(text)
+        buf = TokenBuffer(lexed, text)
+        self.assert_(buf.text is text)
+        self.assertEquals(list(buf), tokens)
+
+    def test_changed_stream(self):
+        # values that are not slices of the text make the buffer fall
+        # back to its own copy
+        lx = PythonLexer()
+        lx.add_filter('keywordcase', case='upper')
+        filtered = list(lx.get_tokens(text))
+        buf = TokenBuffer(filtered, text)
+        self.assert_(buf.text is not text)
+        self.assertEquals(list(buf), filtered)
+
+    def test_from_lexer(self):
+        lx = PythonLexer()
+        buf = TokenBuffer.from_lexer(lx, text)
+        self.assertEquals(list(buf), tokens)
+        self.assertEquals(buf.text, lx.preprocess_text(text))
+        # filters changing values make the buffer copy the text
+        lx.add_filter('keywordcase', case='upper')
+        buf = TokenBuffer.from_lexer(lx, text)
+        self.assertEquals(list(buf), list(lx.get_tokens(text)))
+        self.assert_(u'CLASS' in buf.text)
+
+    def test_dumps(self):
+        buf = TokenBuffer(tokens)
+        data = buf.dumps()
+        self.assertEquals(type(data), bytes)
+        self.assertEquals(list(TokenBuffer.loads(data)), tokens)
+        # without the text
+        data = buf.dumps(include_text=False)
+        self.assertRaises(ValueError, TokenBuffer.loads, data)
+        loaded = TokenBuffer.loads(data, buf.text)
+        self.assertEquals(list(loaded), tokens)
+        self.assert_(loaded.text is buf.text)
+        # slices and empty buffers
+        self.assertEquals(list(TokenBuffer.loads(buf[5:10].dumps())),
+                          tokens[5:10])
+        self.assertEquals(list(TokenBuffer.loads(TokenBuffer().dumps())), [])
+        self.assertRaises(ValueError, TokenBuffer.loads, b('garbage'))
+        self.assertRaises(ValueError, TokenBuffer.loads, data[:-10],
+                          buf.text)
+
+    def test_indexing(self):
+        buf = TokenBuffer([(Keyword, u'def'), (Text, u' '), (Name, u'f')])
+        self.assertEquals(buf[0], (Keyword, u'def'))
+        self.assertEquals(buf[-1], (Name, u'f'))
+        self.assertRaises(IndexError, buf.__getitem__, 3)
+        part = buf[1:]
+        self.assertEquals(list(part), [(Text, u' '), (Name, u'f')])
+        self.assert_(part.text is buf.text)
+        self.assertEquals(part.get_text(), u' f')
+        self.assertEquals(list(buf[2:1]), [])
+
+    def test_format(self):
+        buf = TokenBuffer(tokens)
+        fmt = HtmlFormatter(linenos=True)
+        self.assertEquals(format(buf, fmt), format(tokens, fmt))
+        # buffers can be formatted more than once
+        self.assertEquals(format(buf, fmt), format(tokens, fmt))
+
+    def test_count_lines(self):
+        buf = TokenBuffer(tokens)
+        self.assertEquals(buf.count_lines(), len(text.splitlines()))
+        self.assertEquals(buf.get_lines(3, 5).count_lines(), 3)
+        self.assertEquals(buf[:0].count_lines(), 0)
+        buf = TokenBuffer([(Name, u'a'), (Text, u'\n'), (Name, u'b')])
+        self.assertEquals(buf.count_lines(), 2)
+        self.assertEquals(buf[1:].count_lines(), 2)
+        self.assertEquals(buf[:2].count_lines(), 1)
+
+    def test_token_stream(self):
+        stream = TokenStream(PythonLexer().get_tokens(text), text)
+        self.assertEquals(stream.count_lines(), len(text.splitlines()))
+        self.assertEquals(list(stream), tokens)
+
+    def test_get_lines(self):
+        buf = TokenBuffer(tokens)
+        lines = text.splitlines(True)
+        part = buf.get_lines(3, 5)
+        self.assertEquals(part.get_text(), u''.join(lines[2:5]))
+        self.assert_(part.get_line_index() is buf.get_line_index())
+        # a token spanning several lines is split
+        buf = TokenBuffer([(Name, u'x'), (Text, u' '),
+                           (String, u'"a\nb\nc"'), (Text, u'\n')])
+        self.assertEquals(list(buf.get_lines(2, 2)), [(String, u'b\n')])
+        self.assertEquals(list(buf.get_lines(3, 3)),
+                          [(String, u'c"'), (Text, u'\n')])
+        self.assertEquals(list(buf.get_lines(1, 0)), [])
+
+
+class LineIndexTest(unittest.TestCase):
+
+    def test_positions(self):
+        index = LineIndex(u'ab\n\ncd\n')
+        self.assertEquals(len(index), 3)
+        self.assertEquals(list(index.starts), [0, 3, 4, 7])
+        self.assertEquals(index.position(0), (1, 0))
+        self.assertEquals(index.position(2), (1, 2))
+        self.assertEquals(index.position(3), (2, 0))
+        self.assertEquals(index.position(5), (3, 1))
+        self.assertEquals(index.offset(3, 1), 5)
+        self.assertEquals(index.line_range(2, 3), (3, 7))
+        self.assertRaises(ValueError, index.position, 8)
+        self.assertRaises(ValueError, index.line_range, 1, 4)
+        self.assertEquals(len(LineIndex(u'a\nb')), 2)
+        self.assertEquals(len(LineIndex(u'')), 0)
+        for s in [u'ab\n\ncd\n', u'a\nb', u'', u'\n', u'x']:
+            self.assertEquals(count_lines(s), len(LineIndex(s)))
+        self.assertEquals(count_lines(u'ab\n\ncd\n', 1, 4), 2)
+
+    def test_against_splitlines(self):
+        index = LineIndex(text)
+        lines = text.splitlines(True)
+        self.assertEquals(len(index), len(lines))
+        for lineno in (1, len(lines) // 2, len(lines)):
+            start, end = index.line_range(lineno, lineno)
+            self.assertEquals(text[start:end], lines[lineno - 1])
@@ -59,6 +59,12 @@ class UtilTest(unittest.TestCase):
                 return 0.5
             analyse = util.make_analysator(analyse)
         self.assertEquals(X.analyse(''), 0.5)
+        # values that aren't numbers are errors in the analyser
+        class Y(object):
+            def analyse(text):
+                return object()
+            analyse = util.make_analysator(analyse)
+        self.assertRaises(TypeError, Y.analyse, '')
 
     def test_shebang_matches(self):
         self.assert_(util.shebang_matches('#!/usr/bin/env python', r'python(2\.\d)?'))
@@ -85,3 +91,36 @@ class UtilTest(unittest.TestCase):
             '<?xml ?><!DOCTYPE html PUBLIC  "-//W3C//DTD XHTML 1.0 Strict//EN">'))
         self.assert_(util.looks_like_xml('<html xmlns>abc</html>'))
         self.failIf(util.looks_like_xml('<html>'))
+
+    def test_escape_html(self):
+        text = u'plain text'
+        self.assert_(util.escape_html(text) is text)
+        self.assertEquals(util.escape_html(u'<'), u'&lt;')
+        self.assertEquals(util.escape_html(u"'"), u'&#39;')
+        self.assertEquals(util.escape_html(u'<a href="x">&\'</a>'),
+                          u'&lt;a href=&quot;x&quot;&gt;&amp;&#39;&lt;/a&gt;')
+        self.assertEquals(util.escape_html(u'&lt;'), u'&amp;lt;')
+        # byte strings stay byte strings
+        self.assertEquals(type(util.escape_html('<')), type(''))
+        self.assertEquals(util.escape_html('a&b'), 'a&amp;b')
+
+    def test_filename_index(self):
+        import fnmatch
+        from pygments.lexers import LEXERS
+        index = util.FilenameIndex()
+        for entry in LEXERS.itervalues():
+            index.add(entry[1], entry[3])
+        names = os.listdir(os.path.join(os.path.dirname(__file__),
+                                        'examplefiles'))
+        names += ['Makefile', 'Makefile.in', 'foo.php5', 'ls.1', '.py',
+                  'a.tar.gz', 'CMakeLists.txt', 'x.G', 'noext', '']
+        for name in names:
+            expected = []
+            for entry in LEXERS.itervalues():
+                for pattern in entry[3]:
+                    if fnmatch.fnmatch(name, pattern):
+                        expected.append(entry[1])
+                        break
+            self.assertEquals(list(index.match(name)), expected)
+            # cached results are the same
+            self.assertEquals(list(index.match(name)), expected)